@@ -5,6 +5,11 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/3.1/howto/deployment/asgi/
+
+Besides the Django views it serves the live updates of colony.push (Server-
+Sent Events and WebSocket), so run a single process, for instance:
+
+    uvicorn HiveQueen.asgi:application
 """
 
 import os
@@ -13,4 +18,9 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'HiveQueen.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Imported once Django is set up
+from colony.push import push_application
+
+application = push_application(django_application)
@@ -67,9 +67,34 @@ REST_FRAMEWORK = {
 'DEFAULT_PERMISSION_CLASSES':['rest_framework.permissions.IsAuthenticated', 
                               'rest_framework.permissions.DjangoModelPermissions'],
 'DEFAULT_PAGINATION_CLASS':'rest_framework.pagination.PageNumberPagination',
+# orjson, when installed, writes the JSON answers
+'DEFAULT_RENDERER_CLASSES':['rest_hq.renderers.FastJSONRenderer',
+                             'rest_framework.renderers.BrowsableAPIRenderer'],
 'PAGE_SIZE':1
  }
 
+# Default and maximum page_size of the rest_hq cursor pagination
+REST_HQ_PAGE_SIZE = 100
+REST_HQ_MAX_PAGE_SIZE = 5000
+
+# Default and maximum page_size of the colony list pages
+COLONY_PAGE_SIZE = 50
+COLONY_MAX_PAGE_SIZE = 500
+
+# Seconds a process uses the model versions it read before reading them
+# again, and so before it sees the writes of other processes (colony.versions)
+COLONY_VERSIONS_TTL = 1
+
+# Days the tombstones of deleted objects stay in the change log
+COLONY_CHANGES_RETENTION_DAYS = 30
+
+# Playbook jobs (see colony.jobs)
+HIVE_JOB_WORKERS = 20
+HIVE_JOB_EXECUTOR = 'ansible'
+HIVE_PLAYBOOK_DIR = os.path.join(BASE_DIR, 'playbooks')
+# Seconds between full reloads of the maintenance windows by run_scheduler
+HIVE_SCHEDULER_RELOAD = 300
+
 '''
 JWT_AUTH = {
     'JWT_EXPIRATION_DELTA': timezone.timedelta(hours=1),
@@ -137,6 +162,43 @@ DATABASES = {
 #    "django.contrib.auth.backends.ModelBackend",
 #]
 
+# Caches
+# https://docs.djangoproject.com/en/3.1/topics/cache/
+#
+# 'default' holds small derived data (the inventory, the dashboard
+# statistics); 'responses' the cached API responses and list pages (see
+# colony.caching). MAX_ENTRIES bounds them, evicting the least recently
+# used entries in local memory. Entries are keyed by the model version
+# counters, which are in the database (colony.versions): every process
+# sees the writes of the others (the server processes, import_colony,
+# run_job...) within COLONY_VERSIONS_TTL seconds, so local memory per
+# process is safe. With several server processes set HIVEQUEEN_CACHE=file
+# so they also share the entries on disk.
+
+HIVEQUEEN_CACHE = os.environ.get('HIVEQUEEN_CACHE', 'locmem')
+HIVEQUEEN_CACHE_DIR = os.environ.get('HIVEQUEEN_CACHE_DIR', os.path.join(BASE_DIR, 'cache'))
+
+
+def cache_settings(name, max_entries):
+    if HIVEQUEEN_CACHE == 'file':
+        return {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.path.join(HIVEQUEEN_CACHE_DIR, name),
+            'OPTIONS': {'MAX_ENTRIES': max_entries},
+        }
+    return {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'hivequeen-' + name,
+        'OPTIONS': {'MAX_ENTRIES': max_entries},
+    }
+
+
+CACHES = {
+    'default': cache_settings('default', 10000),
+    'responses': cache_settings('responses', 5000),
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/3.1/ref/settings/#auth-password-validators
 
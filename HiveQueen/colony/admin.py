@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Client, NetAddress, Space
+from .models import Client, NetAddress, Space, MaintenanceWindow, ScheduledJob
 
 
 class ClientAdmin(admin.ModelAdmin):
@@ -12,3 +12,10 @@ admin.site.register(Client, ClientAdmin)
 admin.site.register(NetAddress)
 admin.site.register(Space)
 
+
+class MaintenanceWindowAdmin(admin.ModelAdmin):
+    list_display = ('space', 'client', 'begin', 'end')
+
+
+admin.site.register(MaintenanceWindow, MaintenanceWindowAdmin)
+admin.site.register(ScheduledJob)
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class ColonyConfig(AppConfig):
     name = 'colony'
+
+    def ready(self):
+        # Connect the model signal handlers
+        from colony import signals
@@ -0,0 +1,98 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres <gregorio.corral@uc3m.es>
+
+Cache of derived data (API responses, list pages...) in the 'responses'
+cache, the 'default' one if it is not configured.
+
+Keys include the versions of the models the data is read from (see
+colony.versions), so any write to them makes the old entries unreachable;
+they are then evicted by the size bound of the cache. Hits and misses are
+counted in the cache itself, so every process sharing it adds to them.
+'''
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+
+from colony.versions import get_versions
+
+
+RESPONSES = 'responses'
+
+HITS = 'colony:cache:hits'
+MISSES = 'colony:cache:misses'
+
+
+def get_cache():
+    return caches[RESPONSES if RESPONSES in settings.CACHES else 'default']
+
+
+def make_key(prefix, models, *parts):
+    '''
+    Key of the data named by parts, read from models
+    '''
+    versions = '-'.join(str(version) for version in get_versions(*models))
+    digest = hashlib.sha1('\n'.join(str(part) for part in parts).encode()).hexdigest()
+    return 'colony:cache:%s:%s:%s' % (prefix, versions, digest)
+
+
+def permissions_key(user):
+    '''
+    Part of the key for the data seen by user: superusers share it, other
+    users have their own (reading their permission set would cost two
+    queries per request, more than most cached answers)
+    '''
+    if not user.is_authenticated:
+        return 'anonymous'
+    if user.is_superuser:
+        return 'superuser'
+    return 'user:%s' % user.pk
+
+
+def count(key):
+    responses = get_cache()
+    try:
+        responses.incr(key)
+    except ValueError:
+        if not responses.add(key, 1, timeout=None):
+            responses.incr(key)
+
+
+def get(key):
+    value = get_cache().get(key)
+    count(MISSES if value is None else HITS)
+    return value
+
+
+def store(key, value, timeout=None):
+    get_cache().set(key, value, timeout)
+
+
+def cached(key, compute, timeout=None):
+    '''
+    Returns the value cached under key, computing and caching it on a miss
+    (compute must not return None)
+    '''
+    value = get(key)
+    if value is None:
+        value = compute()
+        store(key, value, timeout)
+    return value
+
+
+def stats():
+    responses = get_cache()
+    hits = responses.get(HITS, 0)
+    misses = responses.get(MISSES, 0)
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': hits / (hits + misses) if hits + misses else None,
+    }
+
+
+def reset_stats():
+    get_cache().delete_many([HITS, MISSES])
@@ -0,0 +1,111 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres <gregorio.corral@uc3m.es>
+
+Change log of spaces, clients and addresses, for delta synchronisation.
+
+Every write appends (model, object id, action) to the Change table: from
+the model signals, and explicitly after bulk operations, which send none.
+The id of the entry is the cursor: a reader asks for the changes after the
+last cursor it has seen and gets each changed object once, with its last
+action, so the traffic grows with the changes and not with the colony.
+
+compact() keeps the log small: older entries of an object are dropped
+once it has a newer one, and tombstones of deleted objects are dropped
+after the retention period. Cursors from before the dropped tombstones are
+expired, and their readers must start again from a full export.
+
+Ids are handed out when rows are inserted, not when they are committed:
+with concurrent writers on a database other than SQLite a reader could
+move past an id still uncommitted, so readers should step back a few
+seconds of changes (they are idempotent) when they can afford it.
+'''
+
+from django.db import transaction
+from django.db.models import Max
+
+from colony.models import Change
+from colony import push
+
+
+CREATED = 'created'
+UPDATED = 'updated'
+DELETED = 'deleted'
+COMPACTED = 'compacted'
+
+BATCH_SIZE = 1000
+
+
+class CursorExpired(Exception):
+    pass
+
+
+def model_name(model):
+    return model._meta.model_name
+
+
+def record(model, ids, action):
+    '''
+    Appends action on the objects of model with ids to the log, and
+    tells the dashboards (see colony.push) once it is committed
+    '''
+    name = model_name(model)
+    ids = list(ids)
+    Change.objects.bulk_create([Change(model=name, object_id=pk, action=action) for pk in ids],
+                               batch_size=BATCH_SIZE)
+    transaction.on_commit(lambda: push.publish_change(name, action, ids))
+
+
+def last_cursor():
+    return Change.objects.aggregate(last=Max('id'))['last'] or 0
+
+
+def oldest_cursor():
+    '''
+    The first cursor still valid: changes before it have been compacted
+    '''
+    return Change.objects.filter(action=COMPACTED).aggregate(floor=Max('object_id'))['floor'] or 0
+
+
+def read(since, limit):
+    '''
+    Returns (changes, cursor, more): the last change of each object
+    changed after the cursor since, in the order of those changes, for at
+    most limit log entries; the cursor to ask for the next ones; and
+    whether there are more. Raises CursorExpired when since has been
+    compacted away.
+    '''
+    if since < oldest_cursor():
+        raise CursorExpired()
+
+    entries = list(Change.objects.filter(id__gt=since).exclude(action=COMPACTED)
+                   .values_list('id', 'model', 'object_id', 'action')[:limit + 1])
+    more = len(entries) > limit
+    entries = entries[:limit]
+
+    last = {}
+    for entry in entries:
+        last[entry[1], entry[2]] = entry
+    changes = sorted(last.values())
+    return changes, entries[-1][0] if entries else since, more
+
+
+def compact(before):
+    '''
+    Compacts the entries created before the datetime before. Returns the
+    number of entries deleted.
+    '''
+    with transaction.atomic():
+        cutoff = Change.objects.filter(created__lt=before).aggregate(last=Max('id'))['last']
+        if cutoff is None:
+            return 0
+
+        latest = Change.objects.values('model', 'object_id').annotate(last=Max('id')).values('last')
+        deleted, _ = Change.objects.filter(id__lte=cutoff).exclude(id__in=latest).delete()
+
+        tombstones, _ = Change.objects.filter(id__lte=cutoff, action=DELETED).delete()
+        if tombstones:
+            Change.objects.filter(action=COMPACTED).delete()
+            Change.objects.create(model='', object_id=cutoff, action=COMPACTED)
+        return deleted + tombstones
@@ -7,7 +7,9 @@ Created on 19 may. 2021
 from django import forms
 from django.core.exceptions import ValidationError
 from django.utils.translation import ugettext_lazy as _
-import validators
+from colony.importer import is_valid_domain, PARSERS
+from colony.models import Client, Space
+from colony import caching
 
 class AddClientForm(forms.Form):
     name = forms.CharField(help_text="Enter client name.")
@@ -18,7 +20,44 @@ class AddClientForm(forms.Form):
         domain = self.cleaned_data['domain']
         
         # Check valid domain name
-        if not validators.domain(domain):
+        if not is_valid_domain(domain):
             raise ValidationError(_('Invalid domain name'))
         
-        return domain
\ No newline at end of file
+        return domain
+    
+    def clean(self):
+        cleaned_data = super().clean()
+        name = cleaned_data.get('name')
+        domain = cleaned_data.get('domain')
+        if name and domain and Client.objects.by_fqdn(f'{name}.{domain}').exists():
+            raise ValidationError(_('A client with this name and domain already exists'))
+        return cleaned_data
+    
+    
+class ImportColonyForm(forms.Form):
+    file = forms.FileField(help_text="CSV (name, domain, space, ips) or JSON lines file.")
+    format = forms.ChoiceField(choices=[(name, name.upper()) for name in PARSERS])
+
+
+def space_choices():
+    # Cached until the next change to the spaces, so the filter forms
+    # do not read the table on every page
+    spaces = caching.cached(caching.make_key('choices', (Space,), 'space'),
+                            lambda: list(Space.objects.order_by('name').values_list('id', 'name')))
+    return [('', '---------')] + spaces
+
+
+class ClientFilterForm(forms.Form):
+    space = forms.TypedChoiceField(choices=space_choices, coerce=int, empty_value=None, required=False)
+    domain = forms.CharField(required=False)
+    ip = forms.CharField(required=False, label='IP prefix')
+
+
+class SpaceFilterForm(forms.Form):
+    name = forms.CharField(required=False, label='Name prefix')
+
+
+class NetAddressFilterForm(forms.Form):
+    ip = forms.CharField(required=False, label='IP prefix')
+    space = forms.TypedChoiceField(choices=space_choices, coerce=int, empty_value=None, required=False)
+    domain = forms.CharField(required=False)
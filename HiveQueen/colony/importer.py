@@ -0,0 +1,243 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres <gregorio.corral@uc3m.es>
+
+Streaming import of host inventories.
+
+Rows have a name, a domain, a space name and a list of addresses. They
+are read lazily from CSV (columns name, domain, space, ips, with the ips
+separated by spaces or ';') or from JSON (one object per line, or a
+single array) and written in batches with a constant number of queries
+per batch. Imports are upserts: a client with the same name and domain
+(ignoring case) moves to the new space, and an existing address moves to
+the new client.
+'''
+
+import csv
+import functools
+import ipaddress
+import json
+
+import validators
+from django.db import transaction
+from django.utils import timezone
+
+from colony.models import Client, Space, NetAddress, make_fqdn
+from colony.versions import bump
+from colony import changes
+
+
+BATCH_SIZE = 1000
+
+
+@functools.lru_cache(maxsize=4096)
+def is_valid_domain(domain):
+    '''
+    validators.domain with the result cached: an inventory repeats a few
+    domains over thousands of rows, so each one is checked once
+    '''
+    return bool(validators.domain(domain))
+
+
+def csv_rows(lines):
+    reader = csv.DictReader(lines)
+    for row in reader:
+        ips = (row.get('ips') or '').replace(';', ' ').split()
+        yield {'name': row.get('name'), 'domain': row.get('domain'), 'space': row.get('space'), 'ips': ips}
+
+
+def json_rows(lines):
+    '''
+    JSON lines, or a single JSON array (which has to be loaded whole)
+    '''
+    lines = iter(lines)
+    for line in lines:
+        if not line.strip():
+            continue
+        if line.lstrip().startswith('['):
+            yield from json.loads(line + ''.join(lines))
+            return
+        yield json.loads(line)
+
+
+def text(value):
+    '''
+    value stripped, '' for a missing one and None for anything but a string
+    '''
+    if value is None:
+        return ''
+    return value.strip() if isinstance(value, str) else None
+
+
+PARSERS = {
+    'csv': csv_rows,
+    'json': json_rows,
+}
+
+
+class ColonyImporter:
+    '''
+    Imports rows in batches. Spaces are resolved with an in-memory
+    name -> id map; unknown spaces are created.
+    '''
+
+    def __init__(self, batch_size=BATCH_SIZE):
+        self.batch_size = batch_size
+        self.spaces = None
+        self.stats = {
+            'rows': 0,
+            'clients_created': 0,
+            'clients_updated': 0,
+            'spaces_created': 0,
+            'addresses_created': 0,
+            'addresses_updated': 0,
+            'errors': [],
+        }
+
+    def run(self, rows):
+        if self.spaces is None:
+            self.spaces = dict(Space.objects.values_list('name', 'id'))
+
+        batch = []
+        for number, row in enumerate(rows, 1):
+            self.stats['rows'] += 1
+            clean = self.clean(number, row)
+            if clean is not None:
+                batch.append(clean)
+            if len(batch) >= self.batch_size:
+                self.write(batch)
+                batch = []
+
+        if batch:
+            self.write(batch)
+
+        return self.stats
+
+    def clean(self, number, row):
+        if not isinstance(row, dict):
+            self.stats['errors'].append((number, 'Invalid row'))
+            return None
+
+        # JSON rows may hold numbers, lists... anywhere: those are taken
+        # for invalid values, not stripped
+        name = text(row.get('name'))
+        domain = text(row.get('domain'))
+        space = text(row.get('space'))
+        ips = row.get('ips') or []
+        if isinstance(ips, str):
+            ips = ips.replace(';', ' ').split()
+
+        if not name or len(name) > 200:
+            self.stats['errors'].append((number, 'Invalid client name'))
+            return None
+
+        if domain is None or len(domain) > 200 or not is_valid_domain(domain):
+            self.stats['errors'].append((number, 'Invalid domain name'))
+            return None
+
+        if space is None or len(space) > 200:
+            self.stats['errors'].append((number, 'Invalid space name'))
+            return None
+        space = space or None
+
+        if not isinstance(ips, list) or not all(isinstance(ip, str) for ip in ips):
+            self.stats['errors'].append((number, 'Invalid addresses'))
+            return None
+
+        try:
+            ips = [str(ipaddress.ip_address(ip)) for ip in ips]
+        except ValueError as error:
+            self.stats['errors'].append((number, str(error)))
+            return None
+
+        return name, domain, space, ips
+
+    def write(self, batch):
+        with transaction.atomic():
+            self.write_spaces(batch)
+            clients = self.write_clients(batch)
+            self.write_addresses(batch, clients)
+            # Bulk writes send no signals
+            bump(Space, Client, NetAddress)
+
+    def write_spaces(self, batch):
+        missing = set(space for name, domain, space, ips in batch
+                      if space is not None and space not in self.spaces)
+        if missing:
+            Space.objects.bulk_create([Space(name=space) for space in missing])
+            created = dict(Space.objects.filter(name__in=missing).values_list('name', 'id'))
+            self.spaces.update(created)
+            changes.record(Space, created.values(), changes.CREATED)
+            self.stats['spaces_created'] += len(missing)
+
+    def write_clients(self, batch):
+        '''
+        Upserts the clients of batch, returns the fqdn -> id map. Clients
+        are matched by fqdn, so names differing only in case are the same
+        client.
+        '''
+        wanted = {}
+        for name, domain, space, ips in batch:
+            wanted[make_fqdn(name, domain)] = (name, domain, self.spaces.get(space))
+
+        existing = dict((fqdn, (pk, space_id)) for fqdn, pk, space_id in
+                        Client.objects.filter(fqdn__in=wanted).values_list('fqdn', 'id', 'space_id'))
+
+        created = [Client(name=name, domain=domain, space_id=space_id, fqdn=fqdn)
+                   for fqdn, (name, domain, space_id) in wanted.items() if fqdn not in existing]
+        now = timezone.now()
+        updated = [Client(id=existing[fqdn][0], space_id=space_id, updated=now)
+                   for fqdn, (name, domain, space_id) in wanted.items()
+                   if fqdn in existing and existing[fqdn][1] != space_id]
+
+        ids = dict((fqdn, value[0]) for fqdn, value in existing.items())
+        if created:
+            Client.objects.bulk_create(created, ignore_conflicts=True)
+            created = dict(Client.objects.filter(fqdn__in=[client.fqdn for client in created])
+                           .values_list('fqdn', 'id'))
+            ids.update(created)
+            changes.record(Client, created.values(), changes.CREATED)
+        if updated:
+            Client.objects.bulk_update(updated, ['space', 'updated'])
+            changes.record(Client, [client.id for client in updated], changes.UPDATED)
+
+        self.stats['clients_created'] += len(created)
+        self.stats['clients_updated'] += len(updated)
+        return ids
+
+    def write_addresses(self, batch, clients):
+        wanted = {}
+        for name, domain, space, ips in batch:
+            for ip in ips:
+                wanted[ip] = clients[make_fqdn(name, domain)]
+
+        existing = dict((ip, (pk, client_id)) for ip, pk, client_id in
+                        NetAddress.objects.filter(ip_add__in=wanted).values_list('ip_add', 'id', 'client_id'))
+
+        created = [NetAddress(ip_add=ip, client_id=client_id)
+                   for ip, client_id in wanted.items() if ip not in existing]
+        now = timezone.now()
+        updated = [NetAddress(id=existing[ip][0], ip_add=ip, client_id=client_id, updated=now)
+                   for ip, client_id in wanted.items() if ip in existing and existing[ip][1] != client_id]
+
+        if created:
+            NetAddress.objects.bulk_create(created, ignore_conflicts=True)
+            changes.record(NetAddress, NetAddress.objects.filter(ip_add__in=[address.ip_add for address in created])
+                           .values_list('id', flat=True), changes.CREATED)
+        if updated:
+            NetAddress.objects.bulk_update(updated, ['client', 'updated'])
+            changes.record(NetAddress, [address.id for address in updated], changes.UPDATED)
+
+        self.stats['addresses_created'] += len(created)
+        self.stats['addresses_updated'] += len(updated)
+
+
+def import_colony(lines, format='csv', batch_size=BATCH_SIZE):
+    '''
+    Imports the rows read from lines (any iterable of text lines)
+    '''
+    if format not in PARSERS:
+        raise ValueError('Unknown format: ' + format)
+
+    return ColonyImporter(batch_size).run(PARSERS[format](lines))
@@ -0,0 +1,96 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres <gregorio.corral@uc3m.es>
+
+Ansible dynamic inventory built from the colony.
+
+Spaces become groups, clients hosts (by FQDN) and their first address
+ansible_host. The _meta.hostvars block is always filled, so Ansible does
+not call the inventory once per host. The JSON is cached under the model
+versions (see colony.versions), so it is rebuilt only after a change.
+'''
+
+import hashlib
+import json
+import re
+
+from django.core.cache import cache
+
+from colony.models import Client, Space, NetAddress
+from colony.versions import get_versions
+
+
+UNGROUPED = 'ungrouped'
+
+
+def group_name(space_name):
+    '''
+    Ansible group names may only have letters, digits and underscores and
+    must not start with a digit
+    '''
+    return 'space_' + re.sub(r'[^A-Za-z0-9_]', '_', space_name)
+
+
+def build_inventory():
+    clients = Client.objects.select_related('space').prefetch_related('netaddress_set').order_by('name', 'domain', 'id')
+
+    groups = {}
+    hostvars = {}
+    for client in clients:
+        host = str(client)
+        addresses = [address.ip_add for address in client.netaddress_set.all()]
+
+        variables = {
+            'hq_id': client.id,
+            'hq_name': client.name,
+            'hq_domain': client.domain,
+            'hq_addresses': addresses,
+        }
+        if addresses:
+            variables['ansible_host'] = addresses[0]
+
+        if client.space is not None:
+            group = group_name(client.space.name)
+            variables['hq_space'] = client.space.name
+        else:
+            group = UNGROUPED
+        groups.setdefault(group, []).append(host)
+        hostvars[host] = variables
+
+    inventory = {
+        'all': {'children': sorted(groups)},
+        '_meta': {'hostvars': hostvars},
+    }
+    for group, hosts in groups.items():
+        inventory[group] = {'hosts': hosts}
+
+    return inventory
+
+
+def inventory_version():
+    return '-'.join(str(version) for version in get_versions(Space, Client, NetAddress))
+
+
+def inventory_json():
+    '''
+    Returns (etag, json text) of the current inventory
+    '''
+    version = inventory_version()
+    cached = cache.get('colony:inventory')
+    if cached is None or cached[0] != version:
+        text = json.dumps(build_inventory(), sort_keys=True)
+        etag = '"%s"' % hashlib.sha1(version.encode()).hexdigest()
+        cached = (version, etag, text)
+        cache.set('colony:inventory', cached, timeout=None)
+    return cached[1], cached[2]
+
+
+def host_vars(host):
+    hostvars = json.loads(inventory_json()[1])['_meta']['hostvars']
+    if host not in hostvars:
+        # Host names are case-insensitive
+        client = Client.objects.by_fqdn(host).first()
+        if client is not None:
+            host = str(client)
+    return hostvars.get(host, {})
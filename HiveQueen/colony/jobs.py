@@ -0,0 +1,189 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres <gregorio.corral@uc3m.es>
+
+Playbook runs over colony clients, on top of hive.jobs.
+
+Jobs run in a pool of threads of the process that starts them, so they
+can only be cancelled from that process. Results are written with one
+bulk insert per batch while the job runs; the dashboard reads them by id
+when colony.push announces a batch (or polls, without a push channel).
+
+Settings:
+
+    HIVE_JOB_WORKERS    size of the shared pool (20)
+    HIVE_JOB_EXECUTOR   'ansible' (default), 'local' to run every playbook
+                        on this machine (ansible connection local), or
+                        'stub' to run nothing, for tests and demos
+    HIVE_PLAYBOOK_DIR   directory of the playbooks jobs may run
+    HIVE_JOB_INVENTORY  inventory used with --limit <host>, for instance
+                        a wrapper of the ansible_inventory command. Without
+                        it every host is its own inventory.
+'''
+
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from colony.models import Client, Job, JobResult
+from hive import jobs
+from colony import push
+
+
+BATCH_SIZE = 50
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_runner = None
+
+# Job id -> hive.jobs.Job of the jobs running in this process
+_running = {}
+
+
+def get_runner():
+    global _runner
+    with _lock:
+        if _runner is None:
+            _runner = jobs.JobRunner(getattr(settings, 'HIVE_JOB_WORKERS', 20))
+        return _runner
+
+
+def playbook_path(playbook):
+    '''
+    Path of playbook inside HIVE_PLAYBOOK_DIR. Raises ValueError for names
+    outside of it.
+    '''
+    directory = os.path.realpath(getattr(settings, 'HIVE_PLAYBOOK_DIR', os.path.join(settings.BASE_DIR, 'playbooks')))
+    path = os.path.realpath(os.path.join(directory, playbook))
+    if not path.startswith(directory + os.sep):
+        raise ValueError('Invalid playbook: ' + playbook)
+    return path
+
+
+def make_executor(playbook):
+    kind = getattr(settings, 'HIVE_JOB_EXECUTOR', 'ansible')
+    if kind == 'stub':
+        return jobs.StubExecutor(lambda host: 'stub: %s on %s' % (playbook, host))
+
+    path = playbook_path(playbook)
+    if kind == 'local':
+        return jobs.ansible_playbook(path, extra_arguments=['--connection', 'local'])
+    if kind == 'ansible':
+        return jobs.ansible_playbook(path, getattr(settings, 'HIVE_JOB_INVENTORY', None))
+    raise ValueError('Unknown HIVE_JOB_EXECUTOR: ' + kind)
+
+
+def start_job(clients, playbook, forks=5, timeout=None, executor=None, batch_size=BATCH_SIZE,
+              on_batch=None):
+    '''
+    Runs playbook over clients (a queryset or list of clients) and returns
+    the Job, already running. on_batch(results) is called after storing
+    each batch. A batch that cannot be stored (or that on_batch fails on)
+    is logged and the job ends as failed.
+    '''
+    if executor is None:
+        executor = make_executor(playbook)
+
+    # Hosts by FQDN, as in the ansible inventory
+    hosts = {}
+    for pk, name, domain in Client.objects.filter(pk__in=[getattr(client, 'pk', client) for client in clients]) \
+            .order_by('name', 'domain', 'id').values_list('id', 'name', 'domain'):
+        hosts.setdefault(f'{name}.{domain}', pk)
+
+    if not hosts:
+        # Finished here: the runner would finish it in this thread, closing
+        # its connection
+        job = Job.objects.create(command=playbook, status='finished', finished=timezone.now(),
+                                 forks=forks, timeout=timeout)
+        transaction.on_commit(lambda: push.publish_job(job.pk, 'finished', {'total': 0, 'done': 0}))
+        return job
+
+    job = Job.objects.create(command=playbook, status='running', total=len(hosts), forks=forks, timeout=timeout)
+    failed = threading.Event()
+
+    # Both run in the pool threads, which outlive the job and any timeout of
+    # the database: each call checks the connection of its thread first and
+    # closes it at the end
+    def store(batch):
+        close_old_connections()
+        try:
+            JobResult.objects.bulk_create([
+                JobResult(job_id=job.pk, client_id=hosts.get(result.host), host=result.host,
+                          status=result.status, returncode=result.returncode, output=result.output,
+                          started=result.started, finished=result.finished)
+                for result in batch])
+            push.publish_job(job.pk, 'running', hiveJob.progress())
+            if on_batch is not None:
+                on_batch(batch)
+        except Exception:
+            # Raised in the lane, it would stop the lane and, from the last
+            # batch, the finish of the job
+            logger.exception('Job %d: failed storing a batch of %d results', job.pk, len(batch))
+            failed.set()
+        finally:
+            connection.close()
+
+    def finish(hiveJob):
+        status = 'failed' if failed.is_set() else 'finished'
+        close_old_connections()
+        try:
+            Job.objects.filter(pk=job.pk).update(status=status, finished=timezone.now(),
+                                                 cancelled=hiveJob.isCancelled())
+            push.publish_job(job.pk, status, hiveJob.progress())
+        except Exception:
+            logger.exception('Job %d: failed marking it %s', job.pk, status)
+        finally:
+            _running.pop(job.pk, None)
+            connection.close()
+
+    hiveJob = jobs.Job(list(hosts), executor, forks=forks, timeout=timeout,
+                       on_batch=store, batch_size=batch_size, on_finish=finish)
+
+    # Workers use their own connections: the job row must be committed. A
+    # job rolled back never runs, nor stays in _running
+    def start():
+        _running[job.pk] = hiveJob
+        get_runner().submit(hiveJob)
+
+    transaction.on_commit(start)
+    return job
+
+
+def get_running(job):
+    return _running.get(getattr(job, 'pk', job))
+
+
+def cancel_job(job):
+    '''
+    Cancels a job running in this process. Returns False if it is not.
+    '''
+    running = get_running(job)
+    if running is None:
+        return False
+    running.cancel()
+    Job.objects.filter(pk=getattr(job, 'pk', job)).update(cancelled=True)
+    return True
+
+
+def wait_job(job, timeout=None):
+    running = get_running(job)
+    return running is None or running.wait(timeout)
+
+
+def progress(job):
+    '''
+    Counts of the stored results per status, plus total and done
+    '''
+    counts = {'total': job.total, 'done': 0}
+    for status, count in job.results.order_by().values_list('status').annotate(count=Count('id')):
+        counts[status] = count
+        counts['done'] += count
+    return counts
+
@@ -0,0 +1,165 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres <gregorio.corral@uc3m.es>
+
+Pagination, sorting and filtering of the colony list views.
+
+Pages are read with a single query: one row past the page tells whether
+there is a next page, so the table is never counted. Row links are built
+from a URL reversed once per request instead of three reverse() per row.
+Built pages are kept in the response cache (see colony.caching) until one
+of the cache_models of the view changes.
+'''
+
+from django.conf import settings
+from django.urls import reverse
+
+from colony import caching
+from colony import push
+
+
+PK_PLACEHOLDER = '__pk__'
+
+
+def url_builder(name):
+    '''
+    Returns pk -> url for a URL pattern taking a single pk argument
+    '''
+    prefix, suffix = reverse(name, args=[PK_PLACEHOLDER]).split(PK_PLACEHOLDER)
+    return lambda pk: f'{prefix}{pk}{suffix}'
+
+
+class LookaheadPage:
+    '''
+    The part of a Django Page the templates use, without a total count
+    '''
+
+    def __init__(self, object_list, number, has_next):
+        self.object_list = object_list
+        self.number = number
+        self.__has_next = has_next
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.__has_next
+
+    def has_previous(self):
+        return self.number > 1
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    def next_page_number(self):
+        return self.number + 1
+
+    def previous_page_number(self):
+        return self.number - 1
+
+
+class ColonyListMixin:
+    '''
+    For ListViews. Subclasses set:
+
+        sort_fields  ?sort= value -> ordering fields ('-' prefix reverses)
+        default_sort key of sort_fields used without ?sort=
+        filter_form  form class validating the filter parameters
+        row_urls     attribute -> URL name (of the row pk) or (URL name,
+                     attribute holding the pk), set on every row of the page
+        cache_models models the rows are read from, the view model if empty
+
+    and implement filter_queryset(queryset, cleaned_data).
+    '''
+
+    sort_fields = {}
+    default_sort = None
+    filter_form = None
+    row_urls = {}
+    cache_models = ()
+
+    def get_paginate_by(self, queryset):
+        size = getattr(settings, 'COLONY_PAGE_SIZE', 50)
+        try:
+            size = int(self.request.GET.get('page_size', size))
+        except ValueError:
+            pass
+        return min(max(size, 1), getattr(settings, 'COLONY_MAX_PAGE_SIZE', 500))
+
+    def get_sort(self):
+        sort = self.request.GET.get('sort', self.default_sort)
+        if sort.lstrip('-') not in self.sort_fields:
+            sort = self.default_sort
+        return sort
+
+    def get_ordering(self):
+        sort = self.get_sort()
+        fields = self.sort_fields[sort.lstrip('-')]
+        if sort.startswith('-'):
+            fields = [field[1:] if field.startswith('-') else '-' + field for field in fields]
+        # The id makes the order total, so rows do not move between pages
+        return list(fields) + ['-id' if sort.startswith('-') else 'id']
+
+    def get_filter_form(self):
+        if not hasattr(self, '_filter_form'):
+            self._filter_form = self.filter_form(self.request.GET) if self.filter_form is not None else None
+        return self._filter_form
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        form = self.get_filter_form()
+        if form is not None and form.is_valid():
+            queryset = self.filter_queryset(queryset, form.cleaned_data)
+        return queryset
+
+    def filter_queryset(self, queryset, cleaned_data):
+        return queryset
+
+    def paginate_queryset(self, queryset, page_size):
+        try:
+            number = max(int(self.request.GET.get(self.page_kwarg, 1)), 1)
+        except ValueError:
+            number = 1
+
+        key = caching.make_key('list', self.cache_models or (self.model,), type(self).__name__,
+                               self.request.get_full_path(), page_size,
+                               caching.permissions_key(self.request.user))
+        page = caching.cached(key, lambda: self.build_page(queryset, number, page_size))
+        return None, page, page.object_list, page.has_other_pages()
+
+    def build_page(self, queryset, number, page_size):
+        start = (number - 1) * page_size
+        rows = list(queryset[start:start + page_size + 1])
+        page = LookaheadPage(rows[:page_size], number, len(rows) > page_size)
+
+        builders = []
+        for attribute, name in self.row_urls.items():
+            name, key = name if isinstance(name, tuple) else (name, 'pk')
+            builders.append((attribute, key, url_builder(name)))
+        for row in page.object_list:
+            for attribute, key, builder in builders:
+                pk = getattr(row, key)
+                setattr(row, attribute, builder(pk) if pk is not None else None)
+        return page
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+
+        # Query strings keeping the other parameters, for the links
+        query = self.request.GET.copy()
+        query.pop(self.page_kwarg, None)
+        context['page_query'] = query.urlencode()
+        query.pop('sort', None)
+        context['sort_query'] = query.urlencode()
+
+        context['sort'] = self.get_sort()
+        context['filter_form'] = self.get_filter_form()
+
+        # The page tells when its models change (see colony.push)
+        context['stream_url'] = push.STREAM_PATH + '?topics=colony'
+        context['live_models'] = ','.join(model._meta.model_name for model in self.cache_models or (self.model,))
+        return context
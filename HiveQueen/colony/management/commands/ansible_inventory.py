@@ -0,0 +1,34 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres
+
+Ansible inventory script. Ansible runs inventory scripts directly, so
+point it to a wrapper such as:
+
+    #!/bin/sh
+    exec python /path/to/manage.py ansible_inventory "$@"
+'''
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from colony import inventory
+
+
+class Command(BaseCommand):
+    help = 'Print the colony as an Ansible dynamic inventory'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--list', action='store_true', help='Print the whole inventory (default)')
+        parser.add_argument('--host', help='Print the variables of one host')
+
+    def handle(self, *args, **options):
+        if options['list'] and options['host']:
+            raise CommandError('--list and --host are exclusive')
+
+        if options['host']:
+            self.stdout.write(json.dumps(inventory.host_vars(options['host'])))
+        else:
+            self.stdout.write(inventory.inventory_json()[1])
@@ -0,0 +1,20 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres
+'''
+
+from django.core.management.base import BaseCommand
+
+from hive import benchmark
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the datastructures and hive packages at growing sizes'
+
+    def add_arguments(self, parser):
+        benchmark.addArguments(parser)
+
+    def handle(self, *args, **options):
+        benchmark.runFromOptions(options['sizes'], options['repeat'], options['max_seconds'],
+                                 options['cases'], options['jsonPath'], self.stdout)
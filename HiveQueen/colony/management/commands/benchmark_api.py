@@ -0,0 +1,151 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres
+
+Load test of the read endpoints: the sync viewsets against their async
+variants (rest_hq.async_views), with many concurrent clients.
+
+    python manage.py benchmark_api --user admin --password secret \
+        --path /api/clients/ --path /api/spaces/ --concurrency 50 --requests 2000
+
+By default the requests go through the ASGI application in this process,
+as a single ASGI server worker would serve them. With --url they go to a
+running server over HTTP instead (from a pool of client threads), for
+instance uvicorn serving HiveQueen.asgi:application.
+
+Each path is measured as given and under /api/async/. Basic auth hashes the
+password on every request, which can dominate the times: --authorization
+passes any other header value, such as a JWT ("JWT <token>").
+'''
+
+import asyncio
+import base64
+import json
+import statistics
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Compare the throughput of the sync and async read endpoints under concurrent clients'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', action='append', dest='paths',
+                            help='Sync endpoint to measure (repeatable), /api/clients/ by default')
+        parser.add_argument('--concurrency', type=int, default=50)
+        parser.add_argument('--requests', type=int, default=1000, help='Requests per endpoint')
+        parser.add_argument('--user')
+        parser.add_argument('--password')
+        parser.add_argument('--authorization', help='Value of the Authorization header')
+        parser.add_argument('--url', help='Base URL of a running server, instead of this process')
+        parser.add_argument('--host', default='localhost', help='Host header of the requests in this process')
+        parser.add_argument('--json', dest='jsonPath', help='Save the results as JSON to this file')
+
+    def handle(self, *args, **options):
+        authorization = options['authorization']
+        if authorization is None and options['user']:
+            credentials = '%s:%s' % (options['user'], options['password'] or '')
+            authorization = 'Basic ' + base64.b64encode(credentials.encode()).decode()
+
+        results = []
+        for path in options['paths'] or ['/api/clients/']:
+            if not path.startswith('/api/'):
+                raise CommandError('Paths start with /api/: ' + path)
+            for variant in (path, '/api/async/' + path[len('/api/'):]):
+                if options['url']:
+                    result = run_http(options['url'].rstrip('/') + variant, authorization,
+                                      options['concurrency'], options['requests'])
+                else:
+                    result = asyncio.run(run_asgi(variant, options['host'], authorization,
+                                                  options['concurrency'], options['requests']))
+                result['path'] = variant
+                results.append(result)
+                self.stdout.write('%-36s %8.1f req/s  p50 %7.1f ms  p95 %7.1f ms  errors %d' % (
+                    variant, result['throughput'], result['p50'] * 1000, result['p95'] * 1000, result['errors']))
+
+        if options['jsonPath']:
+            with open(options['jsonPath'], 'w') as jsonFile:
+                json.dump({'concurrency': options['concurrency'], 'requests': options['requests'],
+                           'results': results}, jsonFile, indent=2)
+
+
+def summary(latencies, errors, elapsed):
+    latencies.sort()
+    return {
+        'throughput': len(latencies) / elapsed,
+        'p50': statistics.median(latencies) if latencies else 0,
+        'p95': latencies[int(len(latencies) * 0.95)] if latencies else 0,
+        'errors': errors,
+    }
+
+
+async def run_asgi(path, host, authorization, concurrency, requests):
+    application = get_asgi_application()
+    headers = [(b'host', host.encode())]
+    if authorization:
+        headers.append((b'authorization', authorization.encode()))
+    scope = {'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+             'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': b'',
+             'root_path': '', 'headers': headers, 'client': ('127.0.0.1', 0), 'server': (host, 80)}
+
+    async def request():
+        status = []
+        sent = False
+
+        async def receive():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+            # The client stays until the answer is complete
+            await asyncio.Event().wait()
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                status.append(message['status'])
+
+        await application(dict(scope), receive, send)
+        return status[0]
+
+    latencies = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def client():
+        nonlocal errors
+        for i in remaining:
+            start = time.perf_counter()
+            if await request() != 200:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[client() for i in range(concurrency)])
+    return summary(latencies, errors, time.perf_counter() - start)
+
+
+def run_http(url, authorization, concurrency, requests):
+    def request(i):
+        call = urllib.request.Request(url)
+        if authorization:
+            call.add_header('Authorization', authorization)
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(call) as response:
+                response.read()
+                ok = response.status == 200
+        except (urllib.error.URLError, OSError):
+            ok = False
+        return ok, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        answers = list(pool.map(request, range(requests)))
+    elapsed = time.perf_counter() - start
+    return summary([latency for ok, latency in answers], sum(1 for ok, latency in answers if not ok), elapsed)
@@ -0,0 +1,115 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres
+
+List and lookup latency of the colony tables at a given size, on any of
+the configured databases (SQLite, MySQL...):
+
+    python manage.py benchmark_db --rows 100000 --database default
+
+The rows are created inside a transaction that is rolled back at the end,
+so the database is left as it was. The query plans are printed too, to
+check that the lookups use the indexes.
+'''
+
+import json
+import random
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from colony.models import Client, Space, NetAddress, make_fqdn
+
+
+CLIENTS_PER_SPACE = 50
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Measure list and lookup latency of the colony tables with many rows (rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100000, help='Clients (and addresses) to create')
+        parser.add_argument('--database', default='default')
+        parser.add_argument('--lookups', type=int, default=1000)
+        parser.add_argument('--json', dest='jsonPath', help='Save the results as JSON to this file')
+
+    def handle(self, *args, **options):
+        self.database = options['database']
+        self.results = []
+        try:
+            with transaction.atomic(using=self.database):
+                self.run(options['rows'], options['lookups'])
+                raise Rollback()
+        except Rollback:
+            pass
+
+        if options['jsonPath']:
+            with open(options['jsonPath'], 'w') as jsonFile:
+                json.dump({'rows': options['rows'], 'database': self.database, 'results': self.results},
+                          jsonFile, indent=2)
+
+    def run(self, rows, lookups):
+        rnd = random.Random(0)
+        # Unique names, so existing rows never collide
+        prefix = 'bench' + uuid.uuid4().hex[:8]
+        db = self.database
+
+        start = time.perf_counter()
+        spaces = [Space(name='%s-%05d' % (prefix, i)) for i in range(rows // CLIENTS_PER_SPACE + 1)]
+        Space.objects.using(db).bulk_create(spaces, batch_size=1000)
+        spaceIds = list(Space.objects.using(db).filter(name__startswith=prefix).values_list('id', flat=True))
+
+        names = ['%s-%07d' % (prefix, i) for i in range(rows)]
+        rnd.shuffle(names)
+        Client.objects.using(db).bulk_create(
+            [Client(name=name, domain='lab.it.uc3m.es', fqdn=make_fqdn(name, 'lab.it.uc3m.es'),
+                    space_id=spaceIds[i % len(spaceIds)]) for i, name in enumerate(names)],
+            batch_size=1000)
+        clientIds = list(Client.objects.using(db).filter(name__startswith=prefix).values_list('id', flat=True))
+        ips = ['10.%d.%d.%d' % (i >> 16 & 255, i >> 8 & 255, i & 255) for i in range(len(clientIds))]
+        NetAddress.objects.using(db).bulk_create(
+            [NetAddress(client_id=pk, ip_add=ip) for pk, ip in zip(clientIds, ips)], batch_size=1000)
+        self.stdout.write('Created %d clients in %.1f s' % (rows, time.perf_counter() - start))
+
+        clients = Client.objects.using(db)
+        middle = sorted(names)[rows // 2]
+        fqdns = [make_fqdn(name, 'lab.it.uc3m.es').upper() for name in rnd.sample(names, min(lookups, rows))]
+        addresses = rnd.sample(ips, min(lookups, rows))
+
+        self.measure('client list, first page', 1,
+                     lambda i: list(clients.order_by('name', 'domain', 'id')[:100]),
+                     clients.order_by('name', 'domain', 'id')[:100])
+        self.measure('client list, page after a cursor', 1,
+                     lambda i: list(clients.filter(name__gt=middle).order_by('name', 'domain', 'id')[:100]),
+                     clients.filter(name__gt=middle).order_by('name', 'domain', 'id')[:100])
+        self.measure('client by fqdn, any case', len(fqdns),
+                     lambda i: clients.by_fqdn(fqdns[i]).first(),
+                     clients.by_fqdn(fqdns[0]))
+        self.measure('address by ip', len(addresses),
+                     lambda i: NetAddress.objects.using(db).filter(ip_add=addresses[i]).first(),
+                     NetAddress.objects.using(db).filter(ip_add=addresses[0]))
+        self.measure('address list, first page', 1,
+                     lambda i: list(NetAddress.objects.using(db).order_by('ip_add', 'id')[:100]),
+                     NetAddress.objects.using(db).order_by('ip_add', 'id')[:100])
+
+    def measure(self, name, operations, operation, queryset):
+        best = None
+        for repeat in range(3):
+            start = time.perf_counter()
+            for i in range(operations):
+                operation(i)
+            elapsed = (time.perf_counter() - start) / operations
+            best = elapsed if best is None else min(best, elapsed)
+
+        plan = queryset.explain()
+        self.results.append({'case': name, 'seconds': best, 'plan': plan})
+        self.stdout.write('%-40s %10.3f ms' % (name, best * 1000))
+        for line in plan.splitlines():
+            self.stdout.write('    ' + line)
@@ -0,0 +1,112 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres
+
+Time to serialize and render a page of the API, with the serializers and
+JSONRenderer against the fast path (rest_hq.fast and FastJSONRenderer):
+
+    python manage.py benchmark_serializers --rows 5000
+
+The rows are created inside a transaction that is rolled back at the end,
+so the database is left as it was. Each case reads its page from the
+database too, as the list endpoints do.
+'''
+
+import json
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from colony.models import Client, Space, NetAddress, make_fqdn
+from rest_hq import fast
+from rest_hq import renderers
+from rest_hq.renderers import FastJSONRenderer
+from rest_hq.serializers import ClientSerializer, SpaceSerializer, NetAddressSerializer
+from rest_hq.views import client_queryset, space_queryset
+
+
+CLIENTS_PER_SPACE = 50
+ADDRESSES_PER_CLIENT = 2
+
+
+class Rollback(Exception):
+    pass
+
+
+def address(i):
+    # 172.16.0.0/12, apart from the lab addresses
+    return '172.%d.%d.%d' % (16 + (i >> 16 & 15), i >> 8 & 255, i & 255)
+
+
+class Command(BaseCommand):
+    help = 'Compare the serializers with the fast read path on a page of the API (rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000, help='Clients in the page')
+        parser.add_argument('--repeat', type=int, default=3)
+        parser.add_argument('--json', dest='jsonPath', help='Save the results as JSON to this file')
+
+    def handle(self, *args, **options):
+        self.repeat = options['repeat']
+        self.results = []
+        try:
+            with transaction.atomic():
+                self.run(options['rows'])
+                raise Rollback()
+        except Rollback:
+            pass
+
+        if options['jsonPath']:
+            with open(options['jsonPath'], 'w') as jsonFile:
+                json.dump({'rows': options['rows'], 'orjson': renderers.orjson is not None,
+                           'results': self.results}, jsonFile, indent=2)
+
+    def run(self, rows):
+        prefix = 'bench' + uuid.uuid4().hex[:8]
+        spaces = [Space(name='%s-%05d' % (prefix, i)) for i in range(rows // CLIENTS_PER_SPACE + 1)]
+        Space.objects.bulk_create(spaces, batch_size=1000)
+        spaceIds = list(Space.objects.filter(name__startswith=prefix).values_list('id', flat=True))
+        Client.objects.bulk_create(
+            [Client(name='%s-%07d' % (prefix, i), domain='lab.it.uc3m.es',
+                    fqdn=make_fqdn('%s-%07d' % (prefix, i), 'lab.it.uc3m.es'),
+                    space_id=spaceIds[i % len(spaceIds)]) for i in range(rows)],
+            batch_size=1000)
+        clientIds = list(Client.objects.filter(name__startswith=prefix).values_list('id', flat=True))
+        NetAddress.objects.bulk_create(
+            [NetAddress(client_id=pk, ip_add=address(i * ADDRESSES_PER_CLIENT + j))
+             for i, pk in enumerate(clientIds) for j in range(ADDRESSES_PER_CLIENT)],
+            batch_size=1000)
+
+        clients = Client.objects.filter(name__startswith=prefix)
+        self.compare('clients',
+                     lambda: ClientSerializer(client_queryset().filter(name__startswith=prefix), many=True).data,
+                     lambda: fast.clients(list(clients.values(*fast.CLIENT_VALUES))))
+        self.compare('spaces',
+                     lambda: SpaceSerializer(space_queryset().filter(name__startswith=prefix), many=True).data,
+                     lambda: fast.spaces(list(Space.objects.filter(name__startswith=prefix)
+                                              .values(*fast.SPACE_VALUES))))
+        addresses = NetAddress.objects.filter(client__name__startswith=prefix)
+        self.compare('addresses',
+                     lambda: NetAddressSerializer(addresses, many=True).data,
+                     lambda: fast.netaddresses(list(addresses.values(*fast.NETADDRESS_VALUES))))
+
+    def compare(self, name, serializer, reader):
+        for variant, serialize, renderer in (('serializers + JSONRenderer', serializer, JSONRenderer()),
+                                             ('fast + FastJSONRenderer', reader, FastJSONRenderer())):
+            serializing = rendering = None
+            for repeat in range(self.repeat):
+                start = time.perf_counter()
+                data = serialize()
+                middle = time.perf_counter()
+                renderer.render(data)
+                end = time.perf_counter()
+                serializing = middle - start if serializing is None else min(serializing, middle - start)
+                rendering = end - middle if rendering is None else min(rendering, end - middle)
+
+            self.results.append({'case': name, 'variant': variant, 'serialize': serializing, 'render': rendering})
+            self.stdout.write('%-10s %-28s serialize %9.1f ms  render %8.1f ms  total %9.1f ms' % (
+                name, variant, serializing * 1000, rendering * 1000, (serializing + rendering) * 1000))
@@ -0,0 +1,28 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres
+
+Compacts the change log, to run periodically (cron):
+
+    python manage.py compact_changes --days 30
+'''
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from colony import changes
+
+
+class Command(BaseCommand):
+    help = 'Drop superseded change log entries and the tombstones older than the retention period'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=float, default=getattr(settings, 'COLONY_CHANGES_RETENTION_DAYS', 30))
+
+    def handle(self, *args, **options):
+        deleted = changes.compact(timezone.now() - timedelta(days=options['days']))
+        self.stdout.write('%d entries deleted, cursors before %d expired' % (deleted, changes.oldest_cursor()))
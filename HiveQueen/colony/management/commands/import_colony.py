@@ -0,0 +1,43 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres
+'''
+
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from colony.importer import import_colony, PARSERS, BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = 'Import hosts (name, domain, space, ips) from a CSV or JSON lines file, "-" for stdin'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=sorted(PARSERS),
+                            help='Defaults to the file extension, csv for stdin')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        path = options['path']
+        format = options['format']
+        if format is None:
+            format = 'json' if path.endswith(('.json', '.ndjson', '.jsonl')) else 'csv'
+
+        try:
+            if path == '-':
+                stats = import_colony(sys.stdin, format, options['batch_size'])
+            else:
+                with open(path, newline='', encoding='utf-8') as lines:
+                    stats = import_colony(lines, format, options['batch_size'])
+        except (OSError, ValueError) as error:
+            raise CommandError(error)
+
+        for line, error in stats['errors']:
+            self.stderr.write('Row %d: %s' % (line, error))
+
+        self.stdout.write('%(rows)d rows: %(clients_created)d clients created, %(clients_updated)d updated, '
+                          '%(spaces_created)d spaces created, %(addresses_created)d addresses created, '
+                          '%(addresses_updated)d updated' % stats)
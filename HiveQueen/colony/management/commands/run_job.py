@@ -0,0 +1,85 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres
+'''
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from colony import jobs
+from colony.scheduler import schedule_job
+from colony.models import Client, Space
+
+
+class Command(BaseCommand):
+    help = 'Run a playbook (from HIVE_PLAYBOOK_DIR) over some clients or the clients of a space'
+
+    def add_arguments(self, parser):
+        parser.add_argument('playbook')
+        parser.add_argument('--client', type=int, action='append', dest='clients',
+                            help='Client id (repeatable)')
+        parser.add_argument('--space', help='Space name')
+        parser.add_argument('--forks', type=int, default=5)
+        parser.add_argument('--timeout', type=int, help='Seconds per host')
+        parser.add_argument('--begin', help='Queue the job to run from this date and time, inside the '
+                                             'maintenance windows of each client (see run_scheduler)')
+        parser.add_argument('--end', help='End of the run window of a queued job')
+
+    def handle(self, *args, **options):
+        if bool(options['clients']) == bool(options['space']):
+            raise CommandError('Give either --client or --space')
+        if options['forks'] < 1:
+            raise CommandError('--forks must be positive')
+
+        if options['space']:
+            space = Space.objects.filter(name=options['space']).first()
+            if space is None:
+                raise CommandError('Unknown space: ' + options['space'])
+            clients = Client.objects.filter(space=space)
+        else:
+            clients = Client.objects.filter(pk__in=options['clients'])
+
+        if options['begin'] or options['end']:
+            begin = self.parse(options['begin']) if options['begin'] else timezone.now()
+            end = self.parse(options['end']) if options['end'] else None
+            if end is None:
+                raise CommandError('--end is required to queue a job')
+            try:
+                scheduled = schedule_job(clients, options['playbook'], begin, end,
+                                         forks=options['forks'], timeout=options['timeout'])
+            except ValueError as error:
+                raise CommandError(error)
+            self.stdout.write('Scheduled job %d queued for %d hosts' % (scheduled.id, scheduled.hosts.count()))
+            return
+
+        def report(batch):
+            for result in batch:
+                self.stdout.write('%s: %s' % (result.host, result.status))
+
+        try:
+            job = jobs.start_job(clients.values_list('pk', flat=True), options['playbook'],
+                                 forks=options['forks'], timeout=options['timeout'],
+                                 batch_size=1, on_batch=report)
+        except ValueError as error:
+            raise CommandError(error)
+
+        try:
+            jobs.wait_job(job)
+        except KeyboardInterrupt:
+            jobs.cancel_job(job)
+            jobs.wait_job(job)
+
+        job.refresh_from_db()
+        progress = jobs.progress(job)
+        self.stdout.write('Job %d %s: %s' % (job.id, 'cancelled' if job.cancelled else job.status,
+                                             ', '.join('%s %d' % item for item in sorted(progress.items()))))
+
+    def parse(self, value):
+        moment = parse_datetime(value)
+        if moment is None:
+            raise CommandError('Invalid date and time: ' + value)
+        if timezone.is_naive(moment):
+            moment = timezone.make_aware(moment)
+        return moment
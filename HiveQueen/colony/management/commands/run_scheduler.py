@@ -0,0 +1,38 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres
+'''
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from colony.scheduler import Scheduler
+
+
+class Command(BaseCommand):
+    help = 'Dispatch the scheduled jobs inside the maintenance windows of their clients'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Run a single tick')
+        parser.add_argument('--interval', type=float, default=30,
+                            help='Maximum seconds between ticks, to see new jobs and windows')
+        parser.add_argument('--reload', type=float, default=None,
+                            help='Seconds between full reloads of the windows (HIVE_SCHEDULER_RELOAD)')
+
+    def handle(self, *args, **options):
+        scheduler = Scheduler(options['reload'])
+        while True:
+            for job in scheduler.tick():
+                self.stdout.write('Started job %d: %s on %d hosts' % (job.id, job.command, job.total))
+            if options['once']:
+                break
+
+            # Sleep until the next window opens, or the interval
+            wait = options['interval']
+            nextStart = scheduler.nextStart()
+            if nextStart is not None:
+                wait = min(wait, max((nextStart - timezone.now()).total_seconds(), 0))
+            time.sleep(wait)
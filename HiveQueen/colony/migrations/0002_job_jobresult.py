@@ -0,0 +1,48 @@
+# Generated by Django 3.2.25 on 2026-10-17 17:31
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('colony', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('command', models.CharField(max_length=500)),
+                ('status', models.CharField(choices=[('pending', 'pending'), ('running', 'running'), ('finished', 'finished')], default='pending', max_length=20)),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('forks', models.PositiveIntegerField(default=5)),
+                ('timeout', models.PositiveIntegerField(blank=True, null=True)),
+                ('cancelled', models.BooleanField(default=False)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('finished', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['-created', '-id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='JobResult',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('host', models.CharField(max_length=401)),
+                ('status', models.CharField(max_length=20)),
+                ('returncode', models.IntegerField(blank=True, null=True)),
+                ('output', models.TextField(blank=True)),
+                ('started', models.DateTimeField(blank=True, null=True)),
+                ('finished', models.DateTimeField(blank=True, null=True)),
+                ('client', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='colony.client')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='results', to='colony.job')),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+    ]
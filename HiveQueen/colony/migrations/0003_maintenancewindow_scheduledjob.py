@@ -0,0 +1,64 @@
+# Generated by Django 3.2.25 on 2026-10-17 17:35
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.db.models.expressions
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('colony', '0002_job_jobresult'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScheduledJob',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('playbook', models.CharField(max_length=500)),
+                ('forks', models.PositiveIntegerField(default=5)),
+                ('timeout', models.PositiveIntegerField(blank=True, null=True)),
+                ('begin', models.DateTimeField()),
+                ('end', models.DateTimeField()),
+                ('created', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['begin', 'id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ScheduledHost',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('queued', 'queued'), ('dispatched', 'dispatched'), ('expired', 'expired')], db_index=True, default='queued', max_length=20)),
+                ('client', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='colony.client')),
+                ('job', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='colony.job')),
+                ('scheduled_job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hosts', to='colony.scheduledjob')),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='MaintenanceWindow',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('begin', models.DateTimeField()),
+                ('end', models.DateTimeField()),
+                ('client', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='colony.client')),
+                ('space', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='colony.space')),
+            ],
+            options={
+                'ordering': ['begin', 'end'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='maintenancewindow',
+            constraint=models.CheckConstraint(check=models.Q(('end__gte', django.db.models.expressions.F('begin'))), name='maintenancewindow_end_after_begin'),
+        ),
+        migrations.AddConstraint(
+            model_name='maintenancewindow',
+            constraint=models.CheckConstraint(check=models.Q(('space__isnull', False), ('client__isnull', False), _connector='OR'), name='maintenancewindow_space_or_client'),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 3.2.25 on 2026-10-17 18:12
+
+from django.db import migrations, models
+
+
+def fill_fqdn(apps, schema_editor):
+    '''
+    Sets the fqdn of the existing clients, refusing to go on if names
+    differing only in case (or repeated addresses) would break the new
+    unique constraints
+    '''
+    Client = apps.get_model('colony', 'Client')
+    NetAddress = apps.get_model('colony', 'NetAddress')
+
+    seen = {}
+    duplicates = []
+    clients = []
+    for client in Client.objects.order_by('pk').only('pk', 'name', 'domain').iterator(chunk_size=2000):
+        client.fqdn = f'{client.name}.{client.domain}'.strip().lower().rstrip('.')
+        if client.fqdn in seen:
+            duplicates.append('client %d (same name as %d)' % (client.pk, seen[client.fqdn]))
+        seen[client.fqdn] = client.pk
+        clients.append(client)
+
+    ips = models.Count('pk')
+    for ip, count in NetAddress.objects.values_list('ip_add').annotate(count=ips).filter(count__gt=1):
+        duplicates.append('address %s (%d times)' % (ip, count))
+
+    if duplicates:
+        raise RuntimeError('Remove the duplicated clients and addresses before migrating: ' + ', '.join(duplicates))
+
+    Client.objects.bulk_update(clients, ['fqdn'], batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('colony', '0003_maintenancewindow_scheduledjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='client',
+            name='fqdn',
+            field=models.CharField(default='', editable=False, max_length=401),
+            preserve_default=False,
+        ),
+        migrations.RunPython(fill_fqdn, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='client',
+            name='fqdn',
+            field=models.CharField(editable=False, max_length=401, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['name', 'domain'], name='colony_client_name_domain'),
+        ),
+        migrations.AlterField(
+            model_name='space',
+            name='name',
+            field=models.CharField(db_index=True, help_text='4.1B01', max_length=200),
+        ),
+        migrations.AlterField(
+            model_name='netaddress',
+            name='ip_add',
+            field=models.GenericIPAddressField(unique=True),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 3.2.25 on 2026-10-17 17:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('colony', '0005_change_timestamps'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Change',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('model', models.CharField(max_length=20)),
+                ('object_id', models.IntegerField()),
+                ('action', models.CharField(choices=[('created', 'created'), ('updated', 'updated'), ('deleted', 'deleted'), ('compacted', 'compacted')], max_length=10)),
+                ('created', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='change',
+            index=models.Index(fields=['model', 'object_id'], name='colony_change_object'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 3.2.25 on 2026-10-17 18:15
+
+import time
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def create_versions(apps, schema_editor):
+    # Counters of the models bumping them, so no write has to create them
+    ModelVersion = apps.get_model('colony', 'ModelVersion')
+    ModelVersion.objects.bulk_create([
+        ModelVersion(label='colony.' + name, version=int(time.time() * 1000), modified=timezone.now())
+        for name in ('space', 'client', 'netaddress', 'maintenancewindow')])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('colony', '0006_change'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ModelVersion',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('label', models.CharField(max_length=100, unique=True)),
+                ('version', models.BigIntegerField()),
+                ('modified', models.DateTimeField()),
+            ],
+        ),
+        migrations.RunPython(create_versions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-17 18:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('colony', '0007_modelversion'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='job',
+            name='status',
+            field=models.CharField(choices=[('pending', 'pending'), ('running', 'running'), ('finished', 'finished'), ('failed', 'failed')], default='pending', max_length=20),
+        ),
+    ]
@@ -1,9 +1,26 @@
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.urls import reverse
 
+from hive.timeframe import TimeFrame
+
+
+def normalise_fqdn(fqdn):
+    """Host name as stored in Client.fqdn: lower case, without the final dot."""
+    return fqdn.strip().lower().rstrip('.')
+
+
+def make_fqdn(name, domain):
+    return normalise_fqdn(f'{name}.{domain}')
+
+
 class Space(models.Model):
     """Model representing a spaces in  witch locate clients."""
-    name = models.CharField(max_length=200, help_text='4.1B01')
+    name = models.CharField(max_length=200, help_text='4.1B01', db_index=True)
+    
+    created = models.DateTimeField(auto_now_add=True)
+    
+    updated = models.DateTimeField(auto_now=True, db_index=True)
        
     class Meta:
         ordering = ['name']
@@ -17,6 +34,13 @@ class Space(models.Model):
         return reverse('space-detail', args=[str(self.id)])
 
 
+class ClientQuerySet(models.QuerySet):
+
+    def by_fqdn(self, fqdn):
+        """Case-insensitive lookup of a host name, on the unique fqdn index."""
+        return self.filter(fqdn=normalise_fqdn(fqdn))
+
+
 class Client(models.Model):
     """Model representing a clients to include in the colony."""  
     name = models.CharField(max_length=200, help_text='it001')
@@ -24,14 +48,37 @@ class Client(models.Model):
     domain = models.CharField(max_length=200, help_text='lab.it.uc3m.es')
     
     space = models.ForeignKey(Space, on_delete=models.SET_NULL, null=True)
+    
+    # make_fqdn(name, domain), kept by save(); bulk writes must set it
+    fqdn = models.CharField(max_length=401, unique=True, editable=False)
+    
+    created = models.DateTimeField(auto_now_add=True)
+    
+    # Set by save(); bulk_update() does not, its callers must
+    updated = models.DateTimeField(auto_now=True, db_index=True)
+    
+    objects = ClientQuerySet.as_manager()
   
     class Meta:
         ordering = ['name', 'domain']
+        indexes = [
+            models.Index(fields=['name', 'domain'], name='colony_client_name_domain'),
+        ]
         
     def __str__(self):
         """String for representing the Model object."""
         return f'{self.name}.{self.domain}'   
     
+    def clean(self):
+        """Rejects names taken by another client, ignoring case."""
+        if self.name and self.domain and \
+                Client.objects.by_fqdn(str(self)).exclude(pk=self.pk).exists():
+            raise ValidationError(f'A client named {self} already exists.')
+    
+    def save(self, *args, **kwargs):
+        self.fqdn = make_fqdn(self.name, self.domain)
+        super().save(*args, **kwargs)
+    
     def get_absolute_url(self):
         """Returns the url to access a particular client."""
         return reverse('client-detail', args=[str(self.id)])
@@ -49,7 +96,11 @@ class NetAddress(models.Model):
     #)
     
     #ip_add = models.GenericIPAddressField(protocol=NET_TYPE_ADDR)
-    ip_add = models.GenericIPAddressField()
+    ip_add = models.GenericIPAddressField(unique=True)
+    
+    created = models.DateTimeField(auto_now_add=True)
+    
+    updated = models.DateTimeField(auto_now=True, db_index=True)
     
     class Meta:
         ordering = ['ip_add']
@@ -60,4 +111,193 @@ class NetAddress(models.Model):
     
     def get_absolute_url(self):
         """Returns the url to access a particular NetAddress."""
-        return reverse('netaddress-detail', args=[str(self.id)])
\ No newline at end of file
+        return reverse('netaddress-detail', args=[str(self.id)])
+
+
+class Job(models.Model):
+    """Model representing a playbook run over a set of clients."""
+
+    STATUS = (
+        ('pending', 'pending'),
+        ('running', 'running'),
+        ('finished', 'finished'),
+        ('failed', 'failed'),
+    )
+
+    command = models.CharField(max_length=500)
+
+    status = models.CharField(max_length=20, choices=STATUS, default='pending')
+
+    total = models.PositiveIntegerField(default=0)
+
+    forks = models.PositiveIntegerField(default=5)
+
+    timeout = models.PositiveIntegerField(null=True, blank=True)
+
+    cancelled = models.BooleanField(default=False)
+
+    created = models.DateTimeField(auto_now_add=True)
+
+    finished = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created', '-id']
+
+    def __str__(self):
+        """String for representing the Model object."""
+        return f'{self.command} ({self.status})'
+
+    def get_absolute_url(self):
+        """Returns the url to access a particular job."""
+        return reverse('job-detail', args=[str(self.id)])
+
+
+class JobResult(models.Model):
+    """Model representing the outcome of a job on one client."""
+
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='results')
+
+    client = models.ForeignKey(Client, on_delete=models.SET_NULL, null=True, blank=True)
+
+    host = models.CharField(max_length=401)
+
+    status = models.CharField(max_length=20)
+
+    returncode = models.IntegerField(null=True, blank=True)
+
+    output = models.TextField(blank=True)
+
+    started = models.DateTimeField(null=True, blank=True)
+
+    finished = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['id']
+
+    def __str__(self):
+        """String for representing the Model object."""
+        return f'{self.host}: {self.status}'
+
+
+class MaintenanceWindow(models.Model):
+    """Model representing a time frame in which jobs may run on a space or a client."""
+
+    space = models.ForeignKey(Space, on_delete=models.CASCADE, null=True, blank=True)
+
+    client = models.ForeignKey(Client, on_delete=models.CASCADE, null=True, blank=True)
+
+    begin = models.DateTimeField()
+
+    end = models.DateTimeField()
+
+    class Meta:
+        ordering = ['begin', 'end']
+        constraints = [
+            models.CheckConstraint(check=models.Q(end__gte=models.F('begin')),
+                                   name='maintenancewindow_end_after_begin'),
+            models.CheckConstraint(check=models.Q(space__isnull=False) | models.Q(client__isnull=False),
+                                   name='maintenancewindow_space_or_client'),
+        ]
+
+    def __str__(self):
+        """String for representing the Model object."""
+        return f'{self.client or self.space}: {self.begin} - {self.end}'
+
+    def getTimeFrame(self):
+        return TimeFrame(self.begin, self.end)
+
+
+class ScheduledJob(models.Model):
+    """Model representing a playbook to run over some clients inside their maintenance windows."""
+
+    playbook = models.CharField(max_length=500)
+
+    forks = models.PositiveIntegerField(default=5)
+
+    timeout = models.PositiveIntegerField(null=True, blank=True)
+
+    begin = models.DateTimeField()
+
+    end = models.DateTimeField()
+
+    created = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['begin', 'id']
+
+    def __str__(self):
+        """String for representing the Model object."""
+        return f'{self.playbook}: {self.begin} - {self.end}'
+
+
+class ScheduledHost(models.Model):
+    """Model representing a client waiting for a scheduled job."""
+
+    STATUS = (
+        ('queued', 'queued'),
+        ('dispatched', 'dispatched'),
+        ('expired', 'expired'),
+    )
+
+    scheduled_job = models.ForeignKey(ScheduledJob, on_delete=models.CASCADE, related_name='hosts')
+
+    client = models.ForeignKey(Client, on_delete=models.CASCADE)
+
+    status = models.CharField(max_length=20, choices=STATUS, default='queued', db_index=True)
+
+    job = models.ForeignKey(Job, on_delete=models.SET_NULL, null=True, blank=True)
+
+    class Meta:
+        ordering = ['id']
+
+    def __str__(self):
+        """String for representing the Model object."""
+        return f'{self.client}: {self.status}'
+
+
+class Change(models.Model):
+    """Model representing an entry of the change log of spaces, clients and addresses."""
+
+    ACTIONS = (
+        ('created', 'created'),
+        ('updated', 'updated'),
+        ('deleted', 'deleted'),
+        ('compacted', 'compacted'),
+    )
+
+    # Increasing, the cursor of the change feed
+    id = models.BigAutoField(primary_key=True)
+
+    # Model name: space, client or netaddress
+    model = models.CharField(max_length=20)
+
+    object_id = models.IntegerField()
+
+    action = models.CharField(max_length=10, choices=ACTIONS)
+
+    created = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['model', 'object_id'], name='colony_change_object'),
+        ]
+
+    def __str__(self):
+        """String for representing the Model object."""
+        return f'{self.id}: {self.model} {self.object_id} {self.action}'
+
+
+class ModelVersion(models.Model):
+    """Model representing the version counter of a model (see colony.versions)."""
+
+    # Label of the model: colony.client...
+    label = models.CharField(max_length=100, unique=True)
+
+    version = models.BigIntegerField()
+
+    modified = models.DateTimeField()
+
+    def __str__(self):
+        """String for representing the Model object."""
+        return f'{self.label}: {self.version}'
@@ -0,0 +1,214 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres <gregorio.corral@uc3m.es>
+
+Live colony changes and job progress for the dashboards, over ASGI.
+
+push_application() wraps the Django ASGI application and serves two more
+paths itself, as plain ASGI coroutines (Django 3.2 views cannot wait for
+events without holding a thread):
+
+    /api/stream/?topics=colony,job:12   Server-Sent Events
+    /api/ws/?topics=colony,job:12       WebSocket, one JSON text per event
+
+Topics are 'colony' (changes of spaces, clients and addresses, see
+colony.changes), 'job' (every job) or 'job:<id>'; the default is 'colony'.
+Users are authenticated with the session cookie of the dashboard and need
+the view permissions of what they follow. An idle connection is a
+suspended coroutine and a small queue in the broker (hive.broker), so one
+process holds thousands of them.
+
+Events come from this process only: serve the site with the ASGI server
+(one process) so the writes and the jobs publish where the dashboards
+listen. Events tell what changed; the pages read the data from the API.
+'''
+
+import asyncio
+import json
+from importlib import import_module
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlsplit
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import auth
+from django.db import close_old_connections
+from django.http import parse_cookie
+
+from hive.broker import broker
+
+
+STREAM_PATH = '/api/stream/'
+WEBSOCKET_PATH = '/api/ws/'
+
+# Seconds between comments on idle streams, so proxies keep them open
+KEEPALIVE = 15
+
+# Topic kind -> permissions needed to follow it
+TOPICS = {
+    'colony': ['colony.view_space', 'colony.view_client', 'colony.view_netaddress'],
+    'job': ['colony.view_job'],
+}
+
+
+def publish_change(model, action, ids):
+    '''
+    Tells the followers of 'colony' that action happened to the objects of
+    model with ids (only the count for large batches)
+    '''
+    broker.publish('colony', {'model': model, 'action': action, 'count': len(ids),
+                              'ids': ids if len(ids) <= 500 else None})
+
+
+def publish_job(job, status, progress):
+    broker.publish('job:%d' % job, {'job': job, 'status': status, 'progress': progress})
+
+
+def parse_topics(scope):
+    '''
+    Returns the topics asked for in the query string, None if any is unknown
+    '''
+    query = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+    topics = set(topic for value in query.get('topics', ['colony']) for topic in value.split(',') if topic)
+    for topic in topics:
+        kind, _, name = topic.partition(':')
+        if kind not in TOPICS or (name and not name.isdigit()):
+            return None
+    return topics
+
+
+def header(scope, name):
+    for key, value in scope.get('headers', ()):
+        if key == name:
+            return value.decode('latin-1')
+    return None
+
+
+def authorise(scope, topics):
+    '''
+    Whether the user of the session cookie may follow topics
+    '''
+    close_old_connections()
+    try:
+        cookies = parse_cookie(header(scope, b'cookie') or '')
+        engine = import_module(settings.SESSION_ENGINE)
+        session = engine.SessionStore(cookies.get(settings.SESSION_COOKIE_NAME))
+        user = auth.get_user(SimpleNamespace(session=session))
+        if not user.is_authenticated:
+            return False
+        return all(user.has_perms(TOPICS[topic.partition(':')[0]]) for topic in topics)
+    finally:
+        close_old_connections()
+
+
+async def pump(subscription, receive, closing, emit, keepalive=None):
+    '''
+    Hands the events of subscription to emit until a message of type
+    closing is received; emit(None) after keepalive idle seconds
+    '''
+    async def closed():
+        while (await receive())['type'] != closing:
+            pass
+
+    closer = asyncio.ensure_future(closed())
+    getter = None
+    try:
+        while True:
+            if getter is None:
+                getter = asyncio.ensure_future(subscription.get())
+            done, pending = await asyncio.wait({getter, closer}, timeout=keepalive,
+                                               return_when=asyncio.FIRST_COMPLETED)
+            if closer in done:
+                return
+            if getter in done:
+                event, getter = getter.result(), None
+                await emit(event)
+            else:
+                await emit(None)
+    finally:
+        for task in (getter, closer):
+            if task is not None:
+                task.cancel()
+
+
+async def respond(send, status, text):
+    await send({'type': 'http.response.start', 'status': status,
+                'headers': [(b'content-type', b'text/plain; charset=utf-8')]})
+    await send({'type': 'http.response.body', 'body': text.encode()})
+
+
+async def event_stream(scope, receive, send):
+    topics = parse_topics(scope)
+    if topics is None:
+        return await respond(send, 400, 'Unknown topic')
+    if not await sync_to_async(authorise)(scope, topics):
+        return await respond(send, 403, 'Forbidden')
+
+    subscription = broker.subscribe(topics)
+    try:
+        await send({'type': 'http.response.start', 'status': 200, 'headers': [
+            (b'content-type', b'text/event-stream'),
+            (b'cache-control', b'no-cache'),
+            # Unbuffered behind nginx
+            (b'x-accel-buffering', b'no'),
+        ]})
+        await send({'type': 'http.response.body', 'body': b'retry: 5000\n\n', 'more_body': True})
+
+        async def emit(event):
+            if event is None:
+                body = b': keepalive\n\n'
+            else:
+                sequence, topic, data = event
+                body = ('id: %d\nevent: %s\ndata: %s\n\n' % (
+                    sequence, topic.partition(':')[0], json.dumps({'topic': topic, 'data': data}))).encode()
+            await send({'type': 'http.response.body', 'body': body, 'more_body': True})
+
+        await pump(subscription, receive, 'http.disconnect', emit, KEEPALIVE)
+    finally:
+        subscription.close()
+
+
+def same_origin(scope):
+    origin = header(scope, b'origin')
+    return origin is None or urlsplit(origin).netloc == header(scope, b'host')
+
+
+async def websocket(scope, receive, send):
+    if (await receive())['type'] != 'websocket.connect':
+        return
+
+    topics = parse_topics(scope)
+    # Other sites could use the session cookie of the user otherwise
+    if topics is None or not same_origin(scope) or not await sync_to_async(authorise)(scope, topics):
+        return await send({'type': 'websocket.close', 'code': 4403})
+
+    subscription = broker.subscribe(topics)
+    try:
+        await send({'type': 'websocket.accept'})
+
+        async def emit(event):
+            sequence, topic, data = event
+            await send({'type': 'websocket.send', 'text': json.dumps({'id': sequence, 'topic': topic, 'data': data})})
+
+        await pump(subscription, receive, 'websocket.disconnect', emit)
+    finally:
+        subscription.close()
+
+
+def push_application(application):
+    '''
+    Returns application (the Django ASGI one) serving the push paths too
+    '''
+    async def router(scope, receive, send):
+        if scope['type'] == 'http' and scope['path'] == STREAM_PATH:
+            return await event_stream(scope, receive, send)
+        if scope['type'] == 'websocket':
+            if scope['path'] == WEBSOCKET_PATH:
+                return await websocket(scope, receive, send)
+            await receive()
+            return await send({'type': 'websocket.close', 'code': 4404})
+        return await application(scope, receive, send)
+
+    return router
+
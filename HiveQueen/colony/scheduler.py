@@ -0,0 +1,153 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres <gregorio.corral@uc3m.es>
+
+Scheduled jobs, dispatched only inside the maintenance windows of their
+clients.
+
+The windows of a client are its own and those of its space; a client
+without any window is not restricted. Each queued host waits in a
+hive.scheduler.WindowScheduler on the intersections of its windows with
+the run window requested for the job, so every tick only looks at the
+hosts that are due. The queue is loaded once and then extended with the
+hosts queued since; it is rebuilt when windows or clients change, as
+their version counters in the database tell (see colony.versions), and
+every reloadInterval seconds anyway, for writes that bump no counter
+(QuerySet.update(), SQL...).
+'''
+
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from colony import jobs
+from colony.models import Client, MaintenanceWindow, ScheduledJob, ScheduledHost
+from colony.versions import get_versions
+from hive.scheduler import WindowScheduler, allowedFrames
+from hive.timeframe import TimeFrame
+
+
+def schedule_job(clients, playbook, begin, end, forks=5, timeout=None):
+    '''
+    Queues playbook to run over clients between begin and end
+    '''
+    if begin > end:
+        raise ValueError('Invalid run window: begin > end')
+    # Fails now, rather than at dispatch, for unknown executors and playbooks
+    jobs.make_executor(playbook)
+
+    ids = Client.objects.filter(pk__in=[getattr(client, 'pk', client) for client in clients]) \
+        .values_list('pk', flat=True)
+    with transaction.atomic():
+        scheduled = ScheduledJob.objects.create(playbook=playbook, begin=begin, end=end, forks=forks, timeout=timeout)
+        ScheduledHost.objects.bulk_create([ScheduledHost(scheduled_job=scheduled, client_id=pk) for pk in ids])
+    return scheduled
+
+
+def client_windows(clients):
+    '''
+    Maps (client id, space id) pairs to the TimeFrames of the windows of
+    each client, None for clients without windows. Two queries.
+    '''
+    spaces = set(space for client, space in clients if space is not None)
+    byClient = {}
+    bySpace = {}
+    windows = MaintenanceWindow.objects.filter(client__in=set(client for client, space in clients)) \
+        .values_list('client_id', 'begin', 'end')
+    for client, begin, end in windows:
+        byClient.setdefault(client, []).append(TimeFrame(begin, end))
+    for space, begin, end in MaintenanceWindow.objects.filter(space__in=spaces).values_list('space_id', 'begin', 'end'):
+        bySpace.setdefault(space, []).append(TimeFrame(begin, end))
+
+    result = {}
+    for client, space in clients:
+        frames = byClient.get(client, []) + bySpace.get(space, [])
+        result[client] = frames or None
+    return result
+
+
+class Scheduler:
+    '''
+    Dispatches the queued hosts due at each tick
+    '''
+
+    def __init__(self, reloadInterval=None):
+        if reloadInterval is None:
+            reloadInterval = getattr(settings, 'HIVE_SCHEDULER_RELOAD', 300)
+        self.reloadInterval = reloadInterval
+        self.loaded = None
+        self.queue = None
+        self.lastId = 0
+        self.versions = None
+        self.scheduledJobs = {}
+
+    def load(self):
+        self.queue = WindowScheduler()
+        self.lastId = 0
+        self.scheduledJobs = {}
+        self.versions = get_versions(MaintenanceWindow, Client)
+        self.loaded = time.monotonic()
+        self.extend()
+
+    def extend(self):
+        '''
+        Queues the hosts queued after the last ones loaded
+        '''
+        hosts = list(ScheduledHost.objects.filter(status='queued', pk__gt=self.lastId).order_by('pk')
+                     .values_list('pk', 'client_id', 'client__space_id', 'scheduled_job_id',
+                                  'scheduled_job__playbook', 'scheduled_job__forks', 'scheduled_job__timeout',
+                                  'scheduled_job__begin', 'scheduled_job__end'))
+        if not hosts:
+            return
+
+        windows = client_windows(set((client, space) for pk, client, space, *rest in hosts))
+        for pk, client, space, scheduled, playbook, forks, timeout, begin, end in hosts:
+            self.scheduledJobs[scheduled] = (playbook, forks, timeout)
+            frames = allowedFrames(windows[client], TimeFrame(begin, end))
+            self.queue.add((pk, client, scheduled), frames)
+        self.lastId = hosts[-1][0]
+
+    def refresh(self):
+        if self.queue is None or get_versions(MaintenanceWindow, Client) != self.versions \
+                or time.monotonic() - self.loaded >= self.reloadInterval:
+            self.load()
+        else:
+            self.extend()
+
+    def nextStart(self):
+        return self.queue.nextStart() if self.queue is not None else None
+
+    def tick(self, now=None):
+        '''
+        Starts a job per scheduled job with due hosts and marks the expired
+        hosts. Returns the started jobs.
+        '''
+        if now is None:
+            now = timezone.now()
+        self.refresh()
+
+        due = {}
+        for pk, client, scheduled in self.queue.due(now):
+            due.setdefault(scheduled, []).append((pk, client))
+
+        started = []
+        for scheduled, hosts in sorted(due.items()):
+            playbook, forks, timeout = self.scheduledJobs[scheduled]
+            # Only hosts still queued: another scheduler may have taken some
+            with transaction.atomic():
+                pks = list(ScheduledHost.objects.select_for_update()
+                           .filter(pk__in=[pk for pk, client in hosts], status='queued').values_list('pk', 'client_id'))
+                if not pks:
+                    continue
+                job = jobs.start_job([client for pk, client in pks], playbook, forks=forks, timeout=timeout)
+                ScheduledHost.objects.filter(pk__in=[pk for pk, client in pks]).update(status='dispatched', job=job)
+            started.append(job)
+
+        expired = [pk for pk, client, scheduled in self.queue.popExpired()]
+        if expired:
+            ScheduledHost.objects.filter(pk__in=expired, status='queued').update(status='expired')
+
+        return started
@@ -0,0 +1,98 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres <gregorio.corral@uc3m.es>
+'''
+
+import contextlib
+import threading
+
+from django.db.models.signals import post_save, pre_delete, post_delete
+from django.dispatch import receiver
+
+from colony.models import Client, Space, NetAddress, MaintenanceWindow
+from colony.versions import bump
+from colony import changes
+
+
+# Deleting a space or a client nulls the foreign keys pointing to it with
+# an UPDATE that sends no signal
+SET_NULL_ON_DELETE = {
+    Space: ((Client, 'space'),),
+    Client: ((NetAddress, 'client'),),
+}
+
+_batch = threading.local()
+
+
+def batched():
+    '''
+    Models deleted from in the current batched_deletes(), None outside
+    '''
+    return getattr(_batch, 'senders', None)
+
+
+@contextlib.contextmanager
+def batched_deletes():
+    '''
+    Within it, deletes send their signals but record no change and bump no
+    version per row: the caller records the changes of the whole batch, and
+    the versions of the models deleted from (cascades and nulled foreign
+    keys included) are bumped once at the end.
+    '''
+    _batch.senders = set()
+    try:
+        yield
+        senders = _batch.senders
+    finally:
+        _batch.senders = None
+    if senders:
+        bump(*senders)
+
+
+@receiver(post_save, sender=Space)
+@receiver(post_save, sender=Client)
+@receiver(post_save, sender=NetAddress)
+@receiver(post_save, sender=MaintenanceWindow)
+def bump_saved(sender, **kwargs):
+    bump(sender)
+
+
+@receiver(post_delete, sender=Space)
+@receiver(post_delete, sender=Client)
+@receiver(post_delete, sender=NetAddress)
+@receiver(post_delete, sender=MaintenanceWindow)
+def bump_deleted(sender, **kwargs):
+    models = [sender] + [model for model, field in SET_NULL_ON_DELETE.get(sender, ())]
+    if batched() is not None:
+        batched().update(models)
+    else:
+        bump(*models)
+
+
+@receiver(post_save, sender=Space)
+@receiver(post_save, sender=Client)
+@receiver(post_save, sender=NetAddress)
+def record_saved(sender, instance, created, **kwargs):
+    changes.record(sender, [instance.pk], changes.CREATED if created else changes.UPDATED)
+
+
+@receiver(pre_delete, sender=Space)
+@receiver(pre_delete, sender=Client)
+def record_nulled(sender, instance, **kwargs):
+    if batched() is not None:
+        return
+    # Before the delete nulls them, inside its transaction
+    for model, field in SET_NULL_ON_DELETE[sender]:
+        ids = list(model.objects.filter(**{field: instance}).values_list('pk', flat=True))
+        if ids:
+            changes.record(model, ids, changes.UPDATED)
+
+
+@receiver(post_delete, sender=Space)
+@receiver(post_delete, sender=Client)
+@receiver(post_delete, sender=NetAddress)
+def record_deleted(sender, instance, **kwargs):
+    if batched() is not None:
+        return
+    changes.record(sender, [instance.pk], changes.DELETED)
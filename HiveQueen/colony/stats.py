@@ -0,0 +1,54 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres <gregorio.corral@uc3m.es>
+
+Colony statistics for the dashboard, cached under the model versions (see
+colony.versions): they are computed once after each change and then read
+from the cache without touching the database.
+'''
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from colony.models import Client, Space, NetAddress
+from colony.versions import get_versions
+
+
+# Spaces listed in clients_per_space, the most populated ones
+TOP_SPACES = 10
+
+
+def build_stats():
+    families = NetAddress.objects.aggregate(
+        ipv4=Count('id', filter=~Q(ip_add__contains=':')),
+        ipv6=Count('id', filter=Q(ip_add__contains=':')),
+    )
+    clients = Client.objects.aggregate(
+        total=Count('id'),
+        without_space=Count('id', filter=Q(space__isnull=True)),
+    )
+    spaces = Space.objects.annotate(clients=Count('client')).order_by('-clients', 'name') \
+        .values_list('name', 'clients')
+
+    return {
+        'num_clients': clients['total'],
+        'num_spaces': Space.objects.count(),
+        'num_addresses': families['ipv4'] + families['ipv6'],
+        'addresses_per_family': {'IPv4': families['ipv4'], 'IPv6': families['ipv6']},
+        'clients_per_space': list(spaces[:TOP_SPACES]),
+        'clients_without_space': clients['without_space'],
+        'clients_without_address': Client.objects.filter(netaddress__isnull=True).count(),
+    }
+
+
+def colony_stats():
+    '''
+    Returns the statistics of the current colony
+    '''
+    version = get_versions(Space, Client, NetAddress)
+    cached = cache.get('colony:stats')
+    if cached is None or cached[0] != version:
+        cached = (version, build_stats())
+        cache.set('colony:stats', cached, timeout=None)
+    return cached[1]
@@ -0,0 +1,86 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres <gregorio.corral@uc3m.es>
+'''
+import io
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from colony.models import Client, Space, NetAddress, Change
+from colony.importer import import_colony
+from colony import changes
+
+
+class ChangeLogTest(TestCase):
+
+    def setUp(self):
+        self.space = Space.objects.create(name='4.1B01')
+        self.client1 = Client.objects.create(name='it001', domain='lab.it.uc3m.es', space=self.space)
+        self.address = NetAddress.objects.create(client=self.client1, ip_add='10.0.0.1')
+
+    def log(self, since=0):
+        entries, cursor, more = changes.read(since, 1000)
+        return [(model, pk, action) for entry, model, pk, action in entries]
+
+    def test_signals(self):
+        self.assertEqual(self.log(), [('space', self.space.pk, 'created'), ('client', self.client1.pk, 'created'),
+                                      ('netaddress', self.address.pk, 'created')])
+        cursor = changes.last_cursor()
+
+        self.client1.domain = 'lab2.it.uc3m.es'
+        self.client1.save()
+        self.client1.save()
+        self.assertEqual(self.log(cursor), [('client', self.client1.pk, 'updated')])
+
+        # The address loses its client in an UPDATE sending no signal
+        pk = self.client1.pk
+        self.client1.delete()
+        self.assertEqual(self.log(cursor), [('netaddress', self.address.pk, 'updated'), ('client', pk, 'deleted')])
+
+    def test_paging(self):
+        for i in range(5):
+            self.space.save()
+        entries, cursor, more = changes.read(0, 4)
+        self.assertTrue(more)
+        self.assertEqual([entry[1] for entry in entries], ['client', 'netaddress', 'space'])
+        entries, cursor, more = changes.read(cursor, 4)
+        self.assertFalse(more)
+        self.assertEqual([entry[1:] for entry in entries], [('space', self.space.pk, 'updated')])
+        self.assertEqual(cursor, changes.last_cursor())
+
+    def test_import(self):
+        cursor = changes.last_cursor()
+        import_colony(io.StringIO('name,domain,space,ips\n'
+                                  'it001,lab.it.uc3m.es,lab,10.0.0.2\n'
+                                  'it002,lab.it.uc3m.es,lab,10.0.0.1\n'))
+        log = self.log(cursor)
+        space = Space.objects.get(name='lab')
+        client2 = Client.objects.get(name='it002')
+        self.assertIn(('space', space.pk, 'created'), log)
+        self.assertIn(('client', self.client1.pk, 'updated'), log)
+        self.assertIn(('client', client2.pk, 'created'), log)
+        self.assertIn(('netaddress', self.address.pk, 'updated'), log)
+        self.assertIn(('netaddress', NetAddress.objects.get(ip_add='10.0.0.2').pk, 'created'), log)
+
+    def test_compact(self):
+        for i in range(3):
+            self.client1.save()
+        self.address.delete()
+        cursor = changes.last_cursor()
+        Change.objects.update(created=timezone.now() - timedelta(days=40))
+        self.space.save()
+
+        call_command('compact_changes', '--days', '30', stdout=io.StringIO())
+        # One entry per object, the deleted address gone
+        self.assertEqual(Change.objects.exclude(action=changes.COMPACTED).count(), 2)
+        self.assertEqual(changes.oldest_cursor(), cursor)
+        self.assertEqual(self.log(cursor), [('space', self.space.pk, 'updated')])
+        with self.assertRaises(changes.CursorExpired):
+            changes.read(0, 1000)
+
+        # Nothing older left
+        self.assertEqual(changes.compact(timezone.now() - timedelta(days=30)), 0)
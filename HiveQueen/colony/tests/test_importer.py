@@ -0,0 +1,140 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres <gregorio.corral@uc3m.es>
+'''
+import io
+import json
+import os
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from colony.models import Client, Space, NetAddress
+from colony.importer import import_colony
+
+
+CSV = '''name,domain,space,ips
+it001,lab.it.uc3m.es,4.1B01,10.0.0.1;10.0.0.2
+it002,lab.it.uc3m.es,4.1B01,10.0.0.3
+it003,lab.it.uc3m.es,4.1B02,
+bad,not a domain,4.1B01,10.0.0.4
+it004,lab.it.uc3m.es,,300.0.0.1
+'''
+
+
+class ColonyImporterTest(TestCase):
+
+    def test_import_csv(self):
+        stats = import_colony(io.StringIO(CSV), 'csv')
+        self.assertEqual(stats['rows'], 5)
+        self.assertEqual(stats['clients_created'], 3)
+        self.assertEqual(stats['spaces_created'], 2)
+        self.assertEqual(stats['addresses_created'], 3)
+        self.assertEqual([line for line, error in stats['errors']], [4, 5])
+        self.assertEqual(Client.objects.get(name='it001').netaddress_set.count(), 2)
+        self.assertEqual(Client.objects.get(name='it003').space.name, '4.1B02')
+
+    def test_import_upsert(self):
+        import_colony(io.StringIO(CSV), 'csv')
+        rows = [{'name': 'it001', 'domain': 'lab.it.uc3m.es', 'space': '4.1B02', 'ips': ['10.0.0.1']},
+                {'name': 'it002', 'domain': 'lab.it.uc3m.es', 'space': '4.1B01', 'ips': ['10.0.0.2']}]
+        lines = io.StringIO('\n'.join(json.dumps(row) for row in rows))
+        stats = import_colony(lines, 'json')
+        self.assertEqual(stats['clients_created'], 0)
+        self.assertEqual(stats['clients_updated'], 1)
+        self.assertEqual(stats['addresses_updated'], 1)
+        self.assertEqual(Client.objects.count(), 3)
+        self.assertEqual(Client.objects.get(name='it001').space.name, '4.1B02')
+        self.assertEqual(NetAddress.objects.get(ip_add='10.0.0.2').client.name, 'it002')
+
+    def test_import_ignores_case(self):
+        import_colony(io.StringIO(CSV), 'csv')
+        rows = [{'name': 'IT001', 'domain': 'Lab.It.Uc3m.Es', 'space': '4.1B02'},
+                {'name': 'it002', 'domain': 'LAB.IT.UC3M.ES', 'space': '4.1B02'}]
+        stats = import_colony(io.StringIO('\n'.join(json.dumps(row) for row in rows)), 'json')
+        self.assertEqual(stats['clients_created'], 0)
+        self.assertEqual(stats['clients_updated'], 2)
+        self.assertEqual(Client.objects.count(), 3)
+
+    def test_import_json_array(self):
+        rows = [{'name': 'it%03d' % i, 'domain': 'lab.it.uc3m.es', 'space': 'lab', 'ips': '10.1.0.%d' % i}
+                for i in range(10)]
+        stats = import_colony(io.StringIO(json.dumps(rows, indent=1)), 'json')
+        self.assertEqual(stats['clients_created'], 10)
+        self.assertEqual(Space.objects.count(), 1)
+
+    def test_constant_queries_per_batch(self):
+        def count(rows):
+            lines = io.StringIO('\n'.join(json.dumps(row) for row in rows))
+            with CaptureQueriesContext(connection) as context:
+                import_colony(lines, 'json', batch_size=1000)
+            return len(context.captured_queries)
+
+        few = count([{'name': 'a%d' % i, 'domain': 'lab.it.uc3m.es', 'space': 'lab', 'ips': ['10.2.0.%d' % i]}
+                     for i in range(2)])
+        many = count([{'name': 'b%d' % i, 'domain': 'lab.it.uc3m.es', 'space': 'lab2', 'ips': ['10.3.%d.1' % i]}
+                      for i in range(150)])
+        self.assertEqual(few, many)
+
+    def test_command(self):
+        out = io.StringIO()
+        path = self.tmp_csv()
+        call_command('import_colony', path, stdout=out, stderr=io.StringIO())
+        self.assertIn('3 clients created', out.getvalue())
+
+    def tmp_csv(self):
+        handle, path = tempfile.mkstemp(suffix='.csv')
+        with open(handle, 'w') as csv_file:
+            csv_file.write(CSV)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_upload_view(self):
+        user = get_user_model().objects.create_superuser('admin', 'admin@lab.it.uc3m.es', 'admin')
+        self.client.force_login(user)
+        upload = SimpleUploadedFile('hosts.csv', CSV.encode())
+        response = self.client.post('/colony/clients/import/', {'file': upload, 'format': 'csv'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['stats']['clients_created'], 3)
+
+    def test_upload_multiline_fields(self):
+        user = get_user_model().objects.create_superuser('admin', 'admin@lab.it.uc3m.es', 'admin')
+        self.client.force_login(user)
+        content = 'name,domain,space,ips\r\nit001,lab.it.uc3m.es,"Lab\r\nnorth",10.0.0.1\r\n'
+        upload = SimpleUploadedFile('hosts.csv', content.encode())
+        response = self.client.post('/colony/clients/import/', {'file': upload, 'format': 'csv'})
+        self.assertEqual(response.context['stats']['errors'], [])
+        self.assertEqual(Client.objects.get(name='it001').space.name, 'Lab\r\nnorth')
+
+    def test_upload_invalid_file(self):
+        user = get_user_model().objects.create_superuser('admin', 'admin@lab.it.uc3m.es', 'admin')
+        self.client.force_login(user)
+        for content, format in ((b'name,domain\n\xff\xfe,lab.it.uc3m.es\n', 'csv'),
+                                (b'{"name": "it001", "domain"\n', 'json')):
+            upload = SimpleUploadedFile('hosts.' + format, content)
+            response = self.client.post('/colony/clients/import/', {'file': upload, 'format': format})
+            self.assertEqual(response.status_code, 200)
+            self.assertIsNone(response.context['stats'])
+            self.assertIn('file', response.context['form'].errors)
+
+    def test_import_values_of_other_types(self):
+        rows = [
+            {'name': 5, 'domain': 'lab.it.uc3m.es'},
+            {'name': 'it001', 'domain': ['lab.it.uc3m.es']},
+            {'name': 'it002', 'domain': 'lab.it.uc3m.es', 'space': {'name': '4.1B01'}},
+            {'name': 'it003', 'domain': 'lab.it.uc3m.es', 'ips': 167772161},
+            {'name': 'it004', 'domain': 'lab.it.uc3m.es', 'ips': [167772161]},
+            {'name': 'it005', 'domain': 'lab.it.uc3m.es', 'space': '', 'ips': ['10.0.0.1']},
+        ]
+        stats = import_colony(io.StringIO('\n'.join(json.dumps(row) for row in rows)), 'json')
+        self.assertEqual(stats['errors'], [(1, 'Invalid client name'), (2, 'Invalid domain name'),
+                                           (3, 'Invalid space name'), (4, 'Invalid addresses'),
+                                           (5, 'Invalid addresses')])
+        self.assertEqual(stats['clients_created'], 1)
+        self.assertIsNone(Client.objects.get(name='it005').space_id)
@@ -0,0 +1,55 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres <gregorio.corral@uc3m.es>
+'''
+import io
+import json
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+from colony.models import Client, Space, NetAddress
+from colony import inventory
+
+
+class InventoryTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        space = Space.objects.create(name='4.1B01')
+        self.client1 = Client.objects.create(name='it001', domain='lab.it.uc3m.es', space=space)
+        NetAddress.objects.create(client=self.client1, ip_add='10.0.0.1')
+        Client.objects.create(name='it002', domain='lab.it.uc3m.es')
+
+    def test_build(self):
+        data = inventory.build_inventory()
+        self.assertEqual(data['all']['children'], ['space_4_1B01', 'ungrouped'])
+        self.assertEqual(data['space_4_1B01']['hosts'], ['it001.lab.it.uc3m.es'])
+        self.assertEqual(data['ungrouped']['hosts'], ['it002.lab.it.uc3m.es'])
+        hostvars = data['_meta']['hostvars']
+        self.assertEqual(hostvars['it001.lab.it.uc3m.es']['ansible_host'], '10.0.0.1')
+        self.assertNotIn('ansible_host', hostvars['it002.lab.it.uc3m.es'])
+
+    def test_cached_until_write(self):
+        etag, text = inventory.inventory_json()
+        with self.assertNumQueries(0):
+            self.assertEqual(inventory.inventory_json(), (etag, text))
+
+        NetAddress.objects.create(client=self.client1, ip_add='10.0.0.2')
+        new_etag, new_text = inventory.inventory_json()
+        self.assertNotEqual(new_etag, etag)
+        self.assertIn('10.0.0.2', new_text)
+
+        self.client1.space.delete()
+        self.assertIn('it001.lab.it.uc3m.es', json.loads(inventory.inventory_json()[1])['ungrouped']['hosts'])
+
+    def test_command(self):
+        out = io.StringIO()
+        call_command('ansible_inventory', '--list', stdout=out)
+        self.assertIn('space_4_1B01', json.loads(out.getvalue()))
+
+        out = io.StringIO()
+        call_command('ansible_inventory', '--host', 'it001.lab.it.uc3m.es', stdout=out)
+        self.assertEqual(json.loads(out.getvalue())['hq_space'], '4.1B01')
@@ -3,13 +3,50 @@ Created on 24 may. 2021
 
 @author: Gregorio Corral Torres <gregorio.corral@uc3m.es>
 '''
+import io
+
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import IntegrityError
 from django.test import TestCase
 
-from colony.models import Client
+from colony.forms import AddClientForm
+from colony.models import Client, NetAddress
 
 class ClientModelTest(TestCase):
     
     @classmethod
     def setUpTestData(cls):
         # Set up non-modified objects used by all test methods
-        Client.objects.create(name='it001', domain='lab.it.uc3m.es')
\ No newline at end of file
+        Client.objects.create(name='it001', domain='lab.it.uc3m.es')
+
+
+class ClientFqdnTest(TestCase):
+
+    def setUp(self):
+        self.client1 = Client.objects.create(name='it001', domain='Lab.It.Uc3m.Es')
+
+    def test_fqdn(self):
+        self.assertEqual(self.client1.fqdn, 'it001.lab.it.uc3m.es')
+        self.assertEqual(Client.objects.by_fqdn('IT001.LAB.IT.UC3M.ES.').get(), self.client1)
+        self.assertFalse(Client.objects.by_fqdn('it001.lab').exists())
+
+    def test_unique(self):
+        self.assertRaises(ValidationError, Client(name='IT001', domain='lab.it.uc3m.es').full_clean, exclude=['space'])
+        self.client1.full_clean(exclude=['space'])
+        self.assertFalse(AddClientForm({'name': 'IT001', 'domain': 'lab.it.uc3m.es'}).is_valid())
+        self.assertRaises(IntegrityError, Client.objects.create, name='IT001', domain='lab.it.uc3m.es')
+
+    def test_unique_address(self):
+        NetAddress.objects.create(client=self.client1, ip_add='10.0.0.1')
+        self.assertRaises(IntegrityError, NetAddress.objects.create, ip_add='10.0.0.1')
+
+
+class BenchmarkDbTest(TestCase):
+
+    def test_command(self):
+        out = io.StringIO()
+        call_command('benchmark_db', '--rows', '200', '--lookups', '10', stdout=out)
+        self.assertIn('client by fqdn', out.getvalue())
+        # Rolled back
+        self.assertFalse(Client.objects.exists())
@@ -0,0 +1,100 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres <gregorio.corral@uc3m.es>
+'''
+import json
+
+from asgiref.sync import async_to_sync, sync_to_async
+from asgiref.testing import ApplicationCommunicator
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from colony.models import Client
+from colony import push
+
+
+async def django_stub(scope, receive, send):
+    await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+    await send({'type': 'http.response.body', 'body': b'django'})
+
+
+application = push.push_application(django_stub)
+
+
+class PushTest(TestCase):
+
+    def setUp(self):
+        self.client.force_login(get_user_model().objects.create_superuser('admin', 'admin@lab.it.uc3m.es', 'admin'))
+        self.cookie = ('%s=%s' % (settings.SESSION_COOKIE_NAME,
+                                  self.client.cookies[settings.SESSION_COOKIE_NAME].value)).encode()
+
+    def scope(self, kind, path, query=b'', headers=()):
+        return {'type': kind, 'path': path, 'query_string': query,
+                'headers': [(b'host', b'testserver'), (b'cookie', self.cookie)] + list(headers)}
+
+    def create_client(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Client.objects.create(name='it001', domain='lab.it.uc3m.es')
+
+    @async_to_sync
+    async def test_event_stream(self):
+        communicator = ApplicationCommunicator(application, self.scope('http', push.STREAM_PATH))
+        await communicator.send_input({'type': 'http.request', 'body': b''})
+        start = await communicator.receive_output(2)
+        self.assertEqual(start['status'], 200)
+        self.assertIn((b'content-type', b'text/event-stream'), start['headers'])
+        await communicator.receive_output(2)
+
+        client = await sync_to_async(self.create_client)()
+        body = (await communicator.receive_output(2))['body'].decode()
+        self.assertTrue(body.startswith('id: '))
+        self.assertIn('event: colony\n', body)
+        data = json.loads(body.split('data: ', 1)[1])
+        self.assertEqual(data, {'topic': 'colony', 'data': {'model': 'client', 'action': 'created',
+                                                            'count': 1, 'ids': [client.pk]}})
+
+        await communicator.send_input({'type': 'http.disconnect'})
+        await communicator.wait(2)
+        self.assertEqual(len(push.broker), 0)
+
+    @async_to_sync
+    async def test_refused(self):
+        scope = self.scope('http', push.STREAM_PATH)
+        scope['headers'] = scope['headers'][:1]
+        communicator = ApplicationCommunicator(application, scope)
+        await communicator.send_input({'type': 'http.request', 'body': b''})
+        self.assertEqual((await communicator.receive_output(2))['status'], 403)
+
+        communicator = ApplicationCommunicator(application, self.scope('http', push.STREAM_PATH, b'topics=users'))
+        await communicator.send_input({'type': 'http.request', 'body': b''})
+        self.assertEqual((await communicator.receive_output(2))['status'], 400)
+
+    @async_to_sync
+    async def test_websocket(self):
+        communicator = ApplicationCommunicator(application, self.scope('websocket', push.WEBSOCKET_PATH, b'topics=job:5'))
+        await communicator.send_input({'type': 'websocket.connect'})
+        self.assertEqual((await communicator.receive_output(2))['type'], 'websocket.accept')
+
+        push.publish_job(4, 'running', {})
+        push.publish_job(5, 'finished', {'total': 1, 'done': 1, 'ok': 1})
+        message = await communicator.receive_output(2)
+        self.assertEqual(json.loads(message['text'])['data'],
+                         {'job': 5, 'status': 'finished', 'progress': {'total': 1, 'done': 1, 'ok': 1}})
+
+        await communicator.send_input({'type': 'websocket.disconnect', 'code': 1000})
+        await communicator.wait(2)
+
+        # From another site
+        communicator = ApplicationCommunicator(application, self.scope(
+            'websocket', push.WEBSOCKET_PATH, headers=[(b'origin', b'https://evil.example.com')]))
+        await communicator.send_input({'type': 'websocket.connect'})
+        self.assertEqual(await communicator.receive_output(2), {'type': 'websocket.close', 'code': 4403})
+
+    @async_to_sync
+    async def test_other_paths(self):
+        communicator = ApplicationCommunicator(application, self.scope('http', '/api/clients/'))
+        await communicator.send_input({'type': 'http.request', 'body': b''})
+        await communicator.receive_output(2)
+        self.assertEqual((await communicator.receive_output(2))['body'], b'django')
@@ -0,0 +1,115 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres <gregorio.corral@uc3m.es>
+'''
+import datetime
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import F
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from colony import jobs
+from colony.models import Client, Space, MaintenanceWindow, ScheduledHost, ModelVersion
+from colony.scheduler import Scheduler, schedule_job
+
+
+T0 = timezone.make_aware(datetime.datetime(2021, 4, 7))
+
+
+def at(hour):
+    return T0 + datetime.timedelta(hours=hour)
+
+
+# Dispatched jobs store their results from other threads
+@override_settings(HIVE_JOB_EXECUTOR='stub')
+class SchedulerTest(TransactionTestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.space = Space.objects.create(name='4.1B01')
+        self.inSpace = Client.objects.create(name='it001', domain='lab.it.uc3m.es', space=self.space)
+        self.own = Client.objects.create(name='it002', domain='lab.it.uc3m.es')
+        self.free = Client.objects.create(name='it003', domain='lab.it.uc3m.es')
+        MaintenanceWindow.objects.create(space=self.space, begin=at(2), end=at(3))
+        MaintenanceWindow.objects.create(client=self.own, begin=at(5), end=at(6))
+
+    def statuses(self):
+        return dict(ScheduledHost.objects.values_list('client__name', 'status'))
+
+    def wait(self, started):
+        for job in started:
+            jobs.wait_job(job, 10)
+
+    def test_dispatch_in_windows(self):
+        schedule_job([self.inSpace, self.own, self.free], 'site.yml', at(1), at(10))
+        scheduler = Scheduler()
+
+        started = scheduler.tick(at(1))
+        self.wait(started)
+        self.assertEqual([job.total for job in started], [1])
+        self.assertEqual(self.statuses(), {'it001': 'queued', 'it002': 'queued', 'it003': 'dispatched'})
+        self.assertEqual(scheduler.nextStart(), at(2))
+
+        self.wait(scheduler.tick(at(2.5)))
+        self.assertEqual(self.statuses()['it001'], 'dispatched')
+
+        self.assertEqual(scheduler.tick(at(4)), [])
+        self.wait(scheduler.tick(at(5)))
+        self.assertEqual(set(self.statuses().values()), {'dispatched'})
+
+    def test_expired(self):
+        schedule_job([self.inSpace, self.own], 'site.yml', at(3.5), at(4))
+        scheduler = Scheduler()
+        self.assertEqual(scheduler.tick(at(3.5)), [])
+        self.assertEqual(self.statuses(), {'it001': 'expired', 'it002': 'expired'})
+
+    def test_window_change_reloads(self):
+        schedule_job([self.own], 'site.yml', at(0), at(10))
+        scheduler = Scheduler()
+        self.assertEqual(scheduler.tick(at(1)), [])
+
+        MaintenanceWindow.objects.create(client=self.own, begin=at(1), end=at(2))
+        self.wait(scheduler.tick(at(1.5)))
+        self.assertEqual(self.statuses(), {'it002': 'dispatched'})
+
+    @mock.patch('colony.versions.VERSIONS_TTL', 0.1)
+    def test_window_change_of_another_process(self):
+        schedule_job([self.own], 'site.yml', at(0), at(10))
+        scheduler = Scheduler()
+        self.assertEqual(scheduler.tick(at(1)), [])
+
+        # Saved by the web server: this process sees the counter only
+        # in the database
+        MaintenanceWindow.objects.bulk_create([MaintenanceWindow(client=self.own, begin=at(1), end=at(2))])
+        ModelVersion.objects.filter(label='colony.maintenancewindow').update(version=F('version') + 1)
+        time.sleep(0.2)
+        self.wait(scheduler.tick(at(1.5)))
+        self.assertEqual(self.statuses(), {'it002': 'dispatched'})
+
+    def test_reload_interval(self):
+        schedule_job([self.own], 'site.yml', at(0), at(10))
+        scheduler = Scheduler(reloadInterval=0)
+        self.assertEqual(scheduler.tick(at(1)), [])
+
+        # Bumps no counter
+        MaintenanceWindow.objects.bulk_create([MaintenanceWindow(client=self.own, begin=at(1), end=at(2))])
+        self.wait(scheduler.tick(at(1.5)))
+        self.assertEqual(self.statuses(), {'it002': 'dispatched'})
+
+    def test_tick_queries(self):
+        schedule_job([self.inSpace, self.own], 'site.yml', at(0), at(10))
+        scheduler = Scheduler()
+        scheduler.tick(at(0))
+        with CaptureQueriesContext(connection) as context:
+            scheduler.tick(at(1))
+        # Only the query for newly queued hosts
+        self.assertEqual(len(context.captured_queries), 1)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, schedule_job, [self.own], 'site.yml', at(2), at(1))
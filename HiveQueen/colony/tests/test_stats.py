@@ -0,0 +1,78 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres <gregorio.corral@uc3m.es>
+'''
+import io
+import time
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import F
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from colony.models import Client, Space, NetAddress, ModelVersion
+from colony.importer import import_colony
+from colony.stats import colony_stats
+
+
+class ColonyStatsTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        space = Space.objects.create(name='4.1B01')
+        Space.objects.create(name='4.1B02')
+        self.client1 = Client.objects.create(name='it001', domain='lab.it.uc3m.es', space=space)
+        NetAddress.objects.create(client=self.client1, ip_add='10.0.0.1')
+        NetAddress.objects.create(client=self.client1, ip_add='2001:db8::1')
+        Client.objects.create(name='it002', domain='lab.it.uc3m.es')
+
+    def test_stats(self):
+        stats = colony_stats()
+        self.assertEqual((stats['num_clients'], stats['num_spaces'], stats['num_addresses']), (2, 2, 2))
+        self.assertEqual(stats['addresses_per_family'], {'IPv4': 1, 'IPv6': 1})
+        self.assertEqual(stats['clients_per_space'], [('4.1B01', 1), ('4.1B02', 0)])
+        self.assertEqual(stats['clients_without_space'], 1)
+        self.assertEqual(stats['clients_without_address'], 1)
+
+    def test_cached_until_write(self):
+        colony_stats()
+        with self.assertNumQueries(0):
+            colony_stats()
+
+        NetAddress.objects.create(client=self.client1, ip_add='10.0.0.2')
+        self.assertEqual(colony_stats()['addresses_per_family']['IPv4'], 2)
+
+        self.client1.delete()
+        stats = colony_stats()
+        self.assertEqual(stats['num_clients'], 1)
+        self.assertEqual(stats['clients_per_space'][0], ('4.1B01', 0))
+
+        # Bulk writes send no signals but bump the versions
+        import_colony(io.StringIO('name,domain,space,ips\nit003,lab.it.uc3m.es,lab,10.0.0.3\n'))
+        self.assertEqual(colony_stats()['num_clients'], 2)
+
+    @mock.patch('colony.versions.VERSIONS_TTL', 0.1)
+    def test_write_of_another_process(self):
+        colony_stats()
+        # As import_colony or run_job would, in their own process: the
+        # counter moves in the database only
+        Client.objects.filter(pk=self.client1.pk).update(space=None)
+        ModelVersion.objects.filter(label='colony.client').update(version=F('version') + 1)
+
+        time.sleep(0.2)
+        self.assertEqual(colony_stats()['clients_without_space'], 2)
+
+    def test_dashboard_queries(self):
+        user = get_user_model().objects.create_user('tester', password='tester')
+        self.client.force_login(user)
+        self.client.get('/colony/')
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get('/colony/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['num_clients'], 2)
+        # Only the session and the user
+        self.assertFalse([query for query in context.captured_queries if 'colony_' in query['sql']])
@@ -1,3 +1,113 @@
 from django.test import TestCase
 
 # Create your tests here.
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from colony.models import Client, Space, NetAddress, make_fqdn
+from colony import caching
+
+
+def bulk_colony(clients, spaces=10):
+    Space.objects.bulk_create([Space(name='space%02d' % i) for i in range(spaces)])
+    space_ids = list(Space.objects.order_by('name').values_list('id', flat=True))
+    Client.objects.bulk_create([Client(name='it%05d' % i, domain='lab.it.uc3m.es', space_id=space_ids[i % spaces],
+                                       fqdn=make_fqdn('it%05d' % i, 'lab.it.uc3m.es')) for i in range(clients)])
+    NetAddress.objects.bulk_create([NetAddress(client_id=pk, ip_add='10.0.%d.%d' % (i // 256, i % 256))
+                                    for i, pk in enumerate(Client.objects.order_by('name').values_list('id', flat=True))])
+
+
+class ListViewsTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        caching.get_cache().clear()
+        user = get_user_model().objects.create_superuser('admin', 'admin@lab.it.uc3m.es', 'admin')
+        self.client.force_login(user)
+
+    def get(self, url):
+        # Counts the queries of building the page, not of reading it back
+        # (bulk_create does not bump the versions either), nor the versions
+        cache.clear()
+        caching.get_cache().clear()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, len(context.captured_queries)
+
+    def test_client_pages(self):
+        bulk_colony(120)
+        response, queries = self.get('/colony/clients/?page_size=50')
+        page = response.context['page_obj']
+        self.assertEqual([client.name for client in page][:2], ['it00000', 'it00001'])
+        self.assertTrue(page.has_next())
+        self.assertContains(response, 'href="/colony/clients/%d/update/"' % page.object_list[0].id)
+
+        response, more_queries = self.get('/colony/clients/?page_size=50&page=3')
+        self.assertEqual(len(response.context['page_obj']), 20)
+        self.assertFalse(response.context['page_obj'].has_next())
+        self.assertEqual(queries, more_queries)
+
+    def test_client_sort_and_filter(self):
+        bulk_colony(30)
+        response, queries = self.get('/colony/clients/?sort=-name')
+        self.assertEqual(response.context['page_obj'].object_list[0].name, 'it00029')
+
+        space = Space.objects.get(name='space03')
+        response, queries = self.get('/colony/clients/?space=%d' % space.id)
+        self.assertEqual([client.name for client in response.context['page_obj']], ['it00003', 'it00013', 'it00023'])
+
+        response, queries = self.get('/colony/clients/?ip=10.0.0.1')
+        self.assertEqual([client.name for client in response.context['page_obj']],
+                         ['it00001'] + ['it%05d' % i for i in range(10, 20)])
+
+        response, queries = self.get('/colony/clients/?domain=LAB.it.uc3m.es&sort=bogus')
+        self.assertEqual(len(response.context['page_obj']), 30)
+
+    def test_address_and_space_lists(self):
+        bulk_colony(30)
+        response, queries = self.get('/colony/netaddresses/?ip=10.0.0.2&sort=client')
+        addresses = response.context['page_obj'].object_list
+        self.assertEqual([address.ip_add for address in addresses], ['10.0.0.2'] + ['10.0.0.%d' % i for i in range(20, 30)])
+        self.assertEqual(addresses[0].client_url, '/colony/clients/%d/' % addresses[0].client_id)
+
+        response, queries = self.get('/colony/spaces/?name=space0')
+        self.assertEqual(len(response.context['page_obj']), 10)
+
+    def test_constant_queries(self):
+        bulk_colony(20)
+        response, few = self.get('/colony/clients/')
+        Client.objects.bulk_create([Client(name='x%05d' % i, domain='lab.it.uc3m.es', fqdn='x%05d.lab.it.uc3m.es' % i)
+                                    for i in range(2000)])
+        response, many = self.get('/colony/clients/?page_size=500')
+        self.assertEqual(few, many)
+
+    def test_cached_pages(self):
+        bulk_colony(30)
+        url = '/colony/clients/?space=%d' % Space.objects.get(name='space01').id
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(len(response.context['page_obj']), 3)
+        # Only the session and the user
+        self.assertFalse([query for query in context.captured_queries if 'colony_' in query['sql']])
+
+        client = Client.objects.get(name='it00001')
+        client.name = 'renamed'
+        client.save()
+        response = self.client.get(url)
+        self.assertIn('renamed', [row.name for row in response.context['page_obj']])
+
+    def test_large_list_time(self):
+        bulk_colony(10000, spaces=100)
+        self.client.get('/colony/clients/')
+        start = time.perf_counter()
+        response = self.client.get('/colony/clients/?page=100')
+        elapsed = time.perf_counter() - start
+        self.assertEqual(response.status_code, 200)
+        # Generous bound, a page takes a few milliseconds
+        self.assertLess(elapsed, 1.0)
@@ -16,6 +16,7 @@ urlpatterns = [
 urlpatterns += [
     path('clients/', views.ClientListView.as_view(), name='clients'),
     path('clients/add/', views.add_client, name='add-clients'),
+    path('clients/import/', views.import_clients, name='import-clients'),
     path('clients/<str:pk>/', views.ClientDetailView.as_view(), name='clients-detail'),
     path('clients/<str:pk>/update/', views.ClientUpdate.as_view(), name='clients-update'),
     path('clients/<str:pk>/delete/', views.ClientDelete.as_view(), name='clients-delete'),
@@ -35,4 +36,8 @@ urlpatterns += [
     path('netaddresses/<str:pk>', views.NetAddressDetailView.as_view(), name='netaddress-detail'),
     path('netaddresses/<str:pk>/update/', views.NetAddressUpdate.as_view(), name='netaddress-update'),
     path('netaddresses/<str:pk>/delete/', views.NetAddressDelete.as_view(), name='netaddress-delete'), 
+]
+
+urlpatterns += [
+    path('jobs/<int:pk>/', views.job_detail, name='job-detail'),
 ]
\ No newline at end of file
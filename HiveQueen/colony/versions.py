@@ -0,0 +1,114 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres <gregorio.corral@uc3m.es>
+
+Per model version counters, kept in the database (colony.models.ModelVersion).
+
+Every write to a colony model bumps its version (from the model signals,
+and explicitly after bulk operations, which send none). Anything derived
+from the models can then be cached under the current versions and is
+invalidated precisely by the next write. The time of the last bump is
+kept too, as the modification time of the model for HTTP Last-Modified.
+
+The counters are in the database, so that every process sees the writes
+of the others: the server processes and the commands writing the colony
+(import_colony, run_job, run_scheduler...). A bump is part of the
+transaction of the write. Reads go through the cache for
+COLONY_VERSIONS_TTL seconds, so cache hits need no query: a process sees
+its own writes at once, those of other processes within that time.
+'''
+
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from colony.models import ModelVersion
+
+
+# Seconds the versions read are used before reading them again
+VERSIONS_TTL = getattr(settings, 'COLONY_VERSIONS_TTL', 1)
+
+
+def version_label(model):
+    return model._meta.label_lower
+
+
+def version_key(label):
+    return 'colony:version:%s' % label
+
+
+def initial_version():
+    # Milliseconds: versions stay unique if the table is ever emptied, or
+    # a bump rolled back
+    return int(time.time() * 1000)
+
+
+# For models without a counter, never written since the table was created:
+# any time after that will do as their modification time
+STARTED = timezone.now()
+
+
+def read_versions(models):
+    '''
+    Returns label -> (version, modified) for models: from the cache, or
+    with one query
+    '''
+    labels = [version_label(model) for model in models]
+    keys = dict((version_key(label), label) for label in labels)
+    rows = dict((keys[key], value) for key, value in cache.get_many(list(keys)).items())
+    missing = [label for label in labels if label not in rows]
+    if missing:
+        read = dict((label, (version, modified)) for label, version, modified in
+                    ModelVersion.objects.filter(label__in=missing).values_list('label', 'version', 'modified'))
+        for label in missing:
+            read.setdefault(label, (0, STARTED))
+        cache.set_many(dict((version_key(label), value) for label, value in read.items()), VERSIONS_TTL)
+        rows.update(read)
+    return rows
+
+
+def get_version(model):
+    return get_versions(model)[0]
+
+
+def get_versions(*models):
+    rows = read_versions(models)
+    return tuple(rows[version_label(model)][0] for model in models)
+
+
+def get_modified(*models):
+    '''
+    Time (seconds since the epoch) of the last write to any of models
+    '''
+    return max(modified.timestamp() for version, modified in read_versions(models).values())
+
+
+def forget(labels):
+    cache.delete_many([version_key(label) for label in labels])
+
+
+def bump(*models):
+    '''
+    Bumps the versions of models, in the transaction of the write. This
+    process reads them again now, so the writer sees its change, and on
+    commit, so nothing read before the commit survives it.
+    '''
+    labels = set(version_label(model) for model in models)
+    now = timezone.now()
+    # Never below the time: a version bumped in a transaction rolled back
+    # may have been read, by the writer, and must not be handed out again
+    bumped = ModelVersion.objects.filter(label__in=labels).update(
+        version=Greatest(F('version') + 1, Value(initial_version())), modified=now)
+    if bumped < len(labels):
+        existing = set(ModelVersion.objects.filter(label__in=labels).values_list('label', flat=True))
+        # Created meanwhile by another process, theirs is as good
+        ModelVersion.objects.bulk_create([ModelVersion(label=label, version=initial_version(), modified=now)
+                                          for label in labels - existing], ignore_conflicts=True)
+    forget(labels)
+    transaction.on_commit(lambda: forget(labels))
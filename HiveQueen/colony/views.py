@@ -1,4 +1,8 @@
-from django.shortcuts import render
+import csv
+import io
+import json
+
+from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.decorators import login_required, permission_required
 from django.views.generic.edit import CreateView, UpdateView, DeleteView
 from django.urls import reverse_lazy
@@ -6,9 +10,14 @@ from django.http import HttpResponse
 from django.http import HttpResponseRedirect
 from django.urls import reverse
 from django.views import generic
-from colony.models import Client, Space, NetAddress
+from colony.models import Client, Space, NetAddress, Job
 
-from colony.forms import AddClientForm
+from colony.forms import AddClientForm, ImportColonyForm
+from colony.forms import ClientFilterForm, SpaceFilterForm, NetAddressFilterForm
+from colony.lists import ColonyListMixin
+from colony.stats import colony_stats
+from colony.importer import import_colony
+from colony import push
 
 
 @login_required
@@ -16,25 +25,43 @@ def index(request):
     """View function for colony page of site."""
     #return HttpResponse("Hello, world. You're at the colony index.")
     
-    # Generate counts of some of the main objects
-    num_clients = Client.objects.all().count()
-    num_addresses = NetAddress.objects.all().count()
-    num_spaces = Space.objects.all().count()
-    
-    
-    context = {
-        'num_clients': num_clients,
-        'num_spaces': num_spaces,
-        'num_addresses': num_addresses,
-    }
+    # Counts of the main objects and other statistics, cached until the
+    # next change to the colony
+    context = colony_stats()
     
     # Render the HTML template index.html with the data in the context variable
     #return render(request, 'index.html', context=context)
     return render(request, 'material-dashboard-django/index.html', context=context)
 
 #@login_required
-class ClientListView(generic.ListView):
+class ClientListView(ColonyListMixin, generic.ListView):
     model = Client
+    sort_fields = {
+        'name': ['name', 'domain'],
+        'domain': ['domain', 'name'],
+        'space': ['space__name', 'name', 'domain'],
+    }
+    default_sort = 'name'
+    filter_form = ClientFilterForm
+    cache_models = (Client, Space, NetAddress)
+    row_urls = {
+        'detail_url': 'clients-detail',
+        'update_url': 'clients-update',
+        'delete_url': 'clients-delete',
+    }
+    
+    def get_queryset(self):
+        return super().get_queryset().select_related('space').only('id', 'name', 'domain', 'space__id', 'space__name')
+    
+    def filter_queryset(self, queryset, cleaned_data):
+        if cleaned_data['space'] is not None:
+            queryset = queryset.filter(space_id=cleaned_data['space'])
+        if cleaned_data['domain']:
+            queryset = queryset.filter(domain__iexact=cleaned_data['domain'])
+        if cleaned_data['ip']:
+            addresses = NetAddress.objects.filter(ip_add__startswith=cleaned_data['ip'])
+            queryset = queryset.filter(pk__in=addresses.values('client_id'))
+        return queryset
 
 
 #@login_required
@@ -75,6 +102,33 @@ def add_client(request):
     return render(request, 'colony/add_client.html', context)
  
  
+@login_required
+@permission_required('colony.add_client', raise_exception=True)
+def import_clients(request):
+    """View function uploading a host inventory, read as a stream."""
+    stats = None
+    
+    if request.method == 'POST':
+        form = ImportColonyForm(request.POST, request.FILES)
+        
+        if form.is_valid():
+            lines = io.TextIOWrapper(form.cleaned_data['file'].file, encoding='utf-8', newline='')
+            try:
+                stats = import_colony(lines, form.cleaned_data['format'])
+            except (UnicodeDecodeError, json.JSONDecodeError, csv.Error, ValueError) as error:
+                # The batches before the error are kept
+                form.add_error('file', 'Invalid %s file: %s' % (form.cleaned_data['format'].upper(), error))
+    else:
+        form = ImportColonyForm()
+        
+    context = {
+        'form': form,
+        'stats': stats,
+    }
+    
+    return render(request, 'colony/import_clients.html', context)
+ 
+ 
 #@login_required
 #@permission_required('colony.client.can_change_client', raise_exception=True)
 class ClientUpdate(UpdateView):
@@ -90,8 +144,25 @@ class ClientDelete(DeleteView):
     success_url = reverse_lazy('clients')  
            
 #@login_required 
-class SpaceListView(generic.ListView):
+class SpaceListView(ColonyListMixin, generic.ListView):
     model = Space
+    sort_fields = {
+        'name': ['name'],
+    }
+    default_sort = 'name'
+    filter_form = SpaceFilterForm
+    cache_models = (Space,)
+    row_urls = {
+        'detail_url': 'space-detail',
+    }
+    
+    def get_queryset(self):
+        return super().get_queryset().only('id', 'name')
+    
+    def filter_queryset(self, queryset, cleaned_data):
+        if cleaned_data['name']:
+            queryset = queryset.filter(name__startswith=cleaned_data['name'])
+        return queryset
 
 #@login_required
 class SpaceDetailView(generic.DetailView):
@@ -120,8 +191,32 @@ class SpaceDelete(DeleteView):
 
 
 #@login_required     
-class NetAddressListView(generic.ListView):
+class NetAddressListView(ColonyListMixin, generic.ListView):
     model = NetAddress
+    sort_fields = {
+        'ip': ['ip_add'],
+        'client': ['client__name', 'client__domain', 'ip_add'],
+    }
+    default_sort = 'ip'
+    filter_form = NetAddressFilterForm
+    cache_models = (NetAddress, Client)
+    row_urls = {
+        'detail_url': 'netaddress-detail',
+        'client_url': ('clients-detail', 'client_id'),
+    }
+    
+    def get_queryset(self):
+        return super().get_queryset().select_related('client') \
+            .only('id', 'ip_add', 'client__id', 'client__name', 'client__domain')
+    
+    def filter_queryset(self, queryset, cleaned_data):
+        if cleaned_data['ip']:
+            queryset = queryset.filter(ip_add__startswith=cleaned_data['ip'])
+        if cleaned_data['space'] is not None:
+            queryset = queryset.filter(client__space_id=cleaned_data['space'])
+        if cleaned_data['domain']:
+            queryset = queryset.filter(client__domain__iexact=cleaned_data['domain'])
+        return queryset
 
 
 @login_required
@@ -167,4 +262,13 @@ class NetAddressUpdate(UpdateView):
 #@permission_required('colony.netaddress.can_delete_netaddress', raise_exception=True)
 class NetAddressDelete(DeleteView):
     model = NetAddress
-    success_url = reverse_lazy('netaddresses')    
\ No newline at end of file
+    success_url = reverse_lazy('netaddresses')    
+
+
+@login_required
+@permission_required('colony.view_job', raise_exception=True)
+def job_detail(request, pk):
+    """Job page, reading the results API when the push stream announces a batch."""
+    job = get_object_or_404(Job, pk=pk)
+    context = {'job': job, 'stream_url': f'{push.STREAM_PATH}?topics=job:{job.pk}'}
+    return render(request, 'colony/job_detail.html', context=context)
@@ -18,10 +18,32 @@ class BasicLinkedList:
         Constructor
         '''
         self.__first = None
+        self.__last = None
+        self.__size = 0
+        
+        
+    @classmethod
+    def fromIterable(cls, iterable):
+        '''
+        Builds a list keeping the order of iterable in O(n)
+        '''
+        newList = cls()
+        for info in iterable:
+            newList.append(info)
+        return newList
     
     
     def setFirst(self, first):
         self.__first = first
+        
+        # The chain is unknown, walk it once to recover size and tail
+        self.__size = 0
+        self.__last = None
+        current = first
+        while current != None:
+            self.__size += 1
+            self.__last = current
+            current = current.getNext()
     
     
     def getFirst(self):  
@@ -30,7 +52,10 @@ class BasicLinkedList:
     
     def getByIndex(self, index):
         if index < 0 or index > len(self):
-            raise ValueError("Invalid index value: " + index)
+            raise ValueError("Invalid index value: " + str(index))
+        
+        if index == self.__size - 1:
+            return self.__last
         
         current = self.__first
         for i in range(index):
@@ -44,29 +69,44 @@ class BasicLinkedList:
     
     
     def insert(self, info):
+        self.insertFirst(info)
+        
+        
+    def insertFirst(self, info):
         node = Node(info)
         node.setNext( self.__first )
         self.__first = node
+        if self.__last == None:
+            self.__last = node
+        self.__size += 1
+    
+    
+    def append(self, info):
+        node = Node(info)
+        if self.__last == None:
+            self.__first = node
+        else:
+            self.__last.setNext(node)
+        self.__last = node
+        self.__size += 1
        
        
     def insertAt(self, info, index): 
         """
         """ 
         if index < 0 or index > len(self):
-            raise ValueError("Invalid index value: " + index)
+            raise ValueError("Invalid index value: " + str(index))
        
-        newNode = Node(info)
-        
         if self.__first == None or index == 0:
-            newNode.setNext(self.__first)
-            self.__first = newNode
+            self.insertFirst(info)
+        elif index == self.__size:
+            self.append(info)
         else:   
             previous = self.__first
             for i in range(index-1):
                 previous = previous.getNext()
             
-            newNode.setNext(previous.getNext())
-            previous.setNext(newNode)
+            self.insertAfter(info, previous)
             
         
     def extract(self):
@@ -74,6 +114,9 @@ class BasicLinkedList:
         if not self.isEmpty():
             info = self.__first.getInfo()
             self.__first = self.__first.getNext()  
+            if self.__first == None:
+                self.__last = None
+            self.__size -= 1
         return info    
             
             
@@ -84,6 +127,9 @@ class BasicLinkedList:
         newNode = Node(info)
         newNode.setNext( previous.getNext() )   
         previous.setNext( newNode ) 
+        if previous is self.__last:
+            self.__last = newNode
+        self.__size += 1
      
      
     def extractAfter(self, previous):  
@@ -93,22 +139,40 @@ class BasicLinkedList:
         info = None   
         if previous.getNext() != None:
             info = previous.getNext().getInfo()
+            if previous.getNext() is self.__last:
+                self.__last = previous
             previous.setNext( previous.getNext().getNext() ) 
+            self.__size -= 1
         return info   
     
     
     def size(self):
-        size = 0
-        current = self.getFirst()
-        
-        while current != None:
-            size += 1
-            current = current.getNext()
-        return size
+        return self.__size
 
      
     def __len__(self):
-        return self.size()
+        return self.__size
+    
+    
+    def __iter__(self):
+        current = self.__first
+        
+        while current != None:
+            yield current.getInfo()
+            current = current.getNext()
+            
+            
+    def __reversed__(self):
+        # Singly linked: collect once, then walk backwards
+        return reversed(list(self))
+    
+    
+    def __contains__(self, info):
+        return self.searchNodeByInfo(info) != None
+    
+    
+    def cursor(self):
+        return LinkedListCursor(self)
              
             
     def __str__(self):        
@@ -142,12 +206,7 @@ class BasicLinkedList:
     
      
     def getLast(self):
-        current = self.__first
-        
-        while current != None and current.getNext() != None:
-            current = current.getNext()
-            
-        return current
+        return self.__last
     
     
     def getIndexOf(self, info):
@@ -176,4 +235,83 @@ class BasicLinkedList:
             current = current.getNext()
             
         return counter
-        
\ No newline at end of file
+
+
+class LinkedListCursor:
+    '''
+    Position in a BasicLinkedList. Remembers the previous node, so it can
+    insert or remove at the current position without walking from the
+    head again.
+    '''
+    
+    def __init__(self, linkedList):
+        self.__list = linkedList
+        self.__previous = None
+        self.__current = linkedList.getFirst()
+        
+        
+    def getCurrent(self):
+        return self.__current
+    
+    
+    def getPrevious(self):
+        return self.__previous
+    
+    
+    def getInfo(self):
+        if self.__current == None:
+            return None
+        return self.__current.getInfo()
+        
+        
+    def isValid(self):
+        return self.__current != None
+    
+    
+    def next(self):
+        '''
+        Moves to the next node. Returns False once past the last node.
+        '''
+        if self.__current != None:
+            self.__previous = self.__current
+            self.__current = self.__current.getNext()
+        return self.__current != None
+    
+    
+    def insertBefore(self, info):
+        '''
+        Inserts info before the current node (at the end when past the
+        last node). The cursor keeps pointing to the same node.
+        '''
+        if self.__previous == None:
+            self.__list.insertFirst(info)
+            self.__previous = self.__list.getFirst()
+        else:
+            self.__list.insertAfter(info, self.__previous)
+            self.__previous = self.__previous.getNext()
+            
+            
+    def insertAfter(self, info):
+        '''
+        Inserts info after the current node
+        '''
+        if self.__current == None:
+            raise ValueError("Cursor past the end of the list")
+        self.__list.insertAfter(info, self.__current)
+        
+        
+    def remove(self):
+        '''
+        Removes the current node and moves to the next one. Returns the
+        removed info.
+        '''
+        if self.__current == None:
+            raise ValueError("Cursor past the end of the list")
+        
+        if self.__previous == None:
+            info = self.__list.extract()
+            self.__current = self.__list.getFirst()
+        else:
+            info = self.__list.extractAfter(self.__previous)
+            self.__current = self.__previous.getNext()
+        return info
@@ -8,6 +8,9 @@ class Node():
     '''
     classdocs
     '''
+    
+    # No per-node __dict__: lists of tens of thousands of nodes stay small
+    __slots__ = ('__info', '__next')
         
     def __init__(self, info=None):
         self.__info = info
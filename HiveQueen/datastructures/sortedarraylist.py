@@ -0,0 +1,260 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral
+'''
+import bisect
+
+
+class SortedArrayListNode:
+    '''
+    Position inside a SortedArrayList. Exposes the same getInfo/getNext
+    interface as Node, so callers walking a linked list work unchanged.
+    Positions are invalidated by insertions and removals.
+    '''
+
+    def __init__(self, chunks, chunkIndex, offset):
+        self.__chunks = chunks
+        self.__chunkIndex = chunkIndex
+        self.__offset = offset
+
+    def getInfo(self):
+        return self.__chunks[self.__chunkIndex][self.__offset]
+
+    def getNext(self):
+        if self.__offset + 1 < len(self.__chunks[self.__chunkIndex]):
+            return SortedArrayListNode(self.__chunks, self.__chunkIndex, self.__offset + 1)
+        if self.__chunkIndex + 1 < len(self.__chunks):
+            return SortedArrayListNode(self.__chunks, self.__chunkIndex + 1, 0)
+        return None
+
+    def __str__(self):
+        return str(self.getInfo())
+
+
+class SortedArrayList:
+    '''
+    Sorted list backed by chunks of Python lists
+
+    Same interface as SortedLinkedList. Items are located with binary
+    search over the chunks and inside them, and a Fenwick tree over the
+    chunk sizes gives positional access, so insert, remove, getByIndex and
+    getIndexOf are logarithmic (plus a memmove of one chunk).
+    '''
+
+    LOAD = 500
+
+    def __init__(self, reverse=False):
+        '''
+        Constructor
+        '''
+        self.__reverse = reverse
+        self.__chunks = []
+        self.__maxes = []
+        self.__tree = [0]
+        self.__size = 0
+
+    # Binary searches honouring reverse order
+
+    def __bisectLeft(self, items, info):
+        if not self.__reverse:
+            return bisect.bisect_left(items, info)
+
+        low, high = 0, len(items)
+        while low < high:
+            middle = (low + high) // 2
+            if items[middle] > info:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def __bisectRight(self, items, info):
+        if not self.__reverse:
+            return bisect.bisect_right(items, info)
+
+        low, high = 0, len(items)
+        while low < high:
+            middle = (low + high) // 2
+            if info > items[middle]:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    # Fenwick tree over the chunk sizes
+
+    def __rebuildTree(self):
+        tree = [0] * (len(self.__chunks) + 1)
+        for i, chunk in enumerate(self.__chunks, 1):
+            tree[i] += len(chunk)
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self.__tree = tree
+
+    def __updateTree(self, chunkIndex, delta):
+        i = chunkIndex + 1
+        while i < len(self.__tree):
+            self.__tree[i] += delta
+            i += i & -i
+
+    def __prefix(self, chunkIndex):
+        ''' Number of items in the chunks before chunkIndex '''
+        total = 0
+        i = chunkIndex
+        while i > 0:
+            total += self.__tree[i]
+            i -= i & -i
+        return total
+
+    def __locate(self, index):
+        ''' Chunk index and offset of the item at position index '''
+        position = 0
+        step = 1
+        while step * 2 < len(self.__tree):
+            step *= 2
+
+        while step > 0:
+            following = position + step
+            if following < len(self.__tree) and self.__tree[following] <= index:
+                position = following
+                index -= self.__tree[following]
+            step //= 2
+
+        return position, index
+
+    # Public interface
+
+    def isEmpty(self):
+        return self.__size == 0
+
+    def size(self):
+        return self.__size
+
+    def __len__(self):
+        return self.__size
+
+    def __iter__(self):
+        for chunk in self.__chunks:
+            yield from chunk
+
+    def __str__(self):
+        return " -> ".join(str(info) for info in self)
+
+    def getFirst(self):
+        if self.isEmpty():
+            return None
+        return SortedArrayListNode(self.__chunks, 0, 0)
+
+    def getLast(self):
+        if self.isEmpty():
+            return None
+        return SortedArrayListNode(self.__chunks, len(self.__chunks) - 1, len(self.__chunks[-1]) - 1)
+
+    def insert(self, info):
+        if not self.__chunks:
+            self.__chunks.append([info])
+            self.__maxes.append(info)
+            self.__rebuildTree()
+            self.__size = 1
+            return
+
+        chunkIndex = self.__bisectRight(self.__maxes, info)
+        if chunkIndex == len(self.__chunks):
+            chunkIndex -= 1
+
+        chunk = self.__chunks[chunkIndex]
+        chunk.insert(self.__bisectRight(chunk, info), info)
+        self.__maxes[chunkIndex] = chunk[-1]
+        self.__size += 1
+
+        if len(chunk) > 2 * self.LOAD:
+            half = chunk[self.LOAD:]
+            del chunk[self.LOAD:]
+            self.__chunks.insert(chunkIndex + 1, half)
+            self.__maxes[chunkIndex] = chunk[-1]
+            self.__maxes.insert(chunkIndex + 1, half[-1])
+            self.__rebuildTree()
+        else:
+            self.__updateTree(chunkIndex, 1)
+
+    def __find(self, info):
+        ''' Chunk index and offset of the first item equal to info, or None '''
+        chunkIndex = self.__bisectLeft(self.__maxes, info)
+
+        while chunkIndex < len(self.__chunks):
+            chunk = self.__chunks[chunkIndex]
+            offset = self.__bisectLeft(chunk, info)
+            while offset < len(chunk):
+                item = chunk[offset]
+                if item == info:
+                    return chunkIndex, offset
+                if self.__bisectRight([item], info) == 0:
+                    # info sorts before item, no equal item left
+                    return None
+                offset += 1
+            chunkIndex += 1
+
+        return None
+
+    def remove(self, info):
+        found = self.__find(info)
+
+        if found is not None:
+            chunkIndex, offset = found
+            chunk = self.__chunks[chunkIndex]
+            del chunk[offset]
+            self.__size -= 1
+
+            if chunk:
+                self.__maxes[chunkIndex] = chunk[-1]
+                self.__updateTree(chunkIndex, -1)
+            else:
+                del self.__chunks[chunkIndex]
+                del self.__maxes[chunkIndex]
+                self.__rebuildTree()
+
+    def extract(self):
+        info = None
+        if not self.isEmpty():
+            info = self.__chunks[0][0]
+            self.remove(info)
+        return info
+
+    def getByIndex(self, index):
+        if index < 0 or index >= self.__size:
+            raise ValueError("Invalid index value: " + str(index))
+
+        chunkIndex, offset = self.__locate(index)
+        return SortedArrayListNode(self.__chunks, chunkIndex, offset)
+
+    def __getitem__(self, index):
+        return self.getByIndex(index)
+
+    def getIndexOf(self, info):
+        found = self.__find(info)
+
+        if found is None:
+            return -1
+
+        chunkIndex, offset = found
+        return self.__prefix(chunkIndex) + offset
+
+    def searchNodeByInfo(self, info):
+        found = self.__find(info)
+
+        if found is None:
+            return None
+        return SortedArrayListNode(self.__chunks, *found)
+
+    def occurrencesOf(self, info):
+        counter = 0
+        node = self.searchNodeByInfo(info)
+
+        while node is not None and self.__bisectRight([node.getInfo()], info) == 1:
+            if node.getInfo() == info:
+                counter += 1
+            node = node.getNext()
+
+        return counter
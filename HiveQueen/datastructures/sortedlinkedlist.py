@@ -3,6 +3,8 @@ Created on 14 abr. 2021
 
 @author: Gregorio Corral
 '''
+import functools
+
 from datastructures.basiclinkedlist import BasicLinkedList
 
 class SortedLinkedList(BasicLinkedList):
@@ -19,29 +21,72 @@ class SortedLinkedList(BasicLinkedList):
         self.__reverse = reverse
         
         
+    @classmethod
+    def fromSorted(cls, iterable, reverse=False):
+        '''
+        Builds a list from items already in order in O(n)
+        '''
+        newList = cls(reverse=reverse)
+        last = None
+        for info in iterable:
+            if last != None and newList.__precedes(info, last.getInfo()):
+                raise ValueError("Items not sorted")
+            newList.append(info)
+            last = newList.getLast()
+        return newList
+    
+    
+    @classmethod
+    def fromUnsorted(cls, iterable, reverse=False):
+        '''
+        Builds a list from items in any order in O(n log n). Items are
+        compared as insert does: with >, or with < when reversed.
+        '''
+        ordering = cls(reverse=reverse)
+        
+        def compare(first, second):
+            if ordering.__precedes(first, second):
+                return -1
+            if ordering.__precedes(second, first):
+                return 1
+            return 0
+        
+        items = sorted(iterable, key=functools.cmp_to_key(compare))
+        return cls.fromSorted(items, reverse=reverse)
+    
+    
+    @classmethod
+    def fromIterable(cls, iterable):
+        return cls.fromUnsorted(iterable)
+        
+        
     def insert(self, info):
-        current = self.getFirst()
-        index = 0
+        last = self.getLast()
+        
+        # Past the greatest item: append through the tail pointer
+        if last != None and self.__precedes(last.getInfo(), info):
+            self.append(info)
+            return
+        
+        cursor = self.cursor()
+        while cursor.isValid() and self.__precedes(cursor.getInfo(), info):
+            cursor.next()
+            
+        cursor.insertBefore(info)
         
+        
+    def __precedes(self, current, info):
         if not self.__reverse:
-            while current != None and info > current.getInfo():
-                current = current.getNext()
-                index += 1
+            return info > current
         else:
-            while current != None and info < current.getInfo():
-                current = current.getNext()
-                index += 1
-            
-        self.insertAt(info, index)
+            return info < current
         
                    
     def remove(self, info):
-        index = self.getIndexOf(info)
-        
-        if( index != -1 ):
-            if( index > 0 ):
-                previous = self.getByIndex(index-1)
-                self.extractAfter(previous)
-            else:
-                self.extract()    
-            
\ No newline at end of file
+        cursor = self.cursor()
+        
+        while cursor.isValid() and not cursor.getInfo() == info:
+            cursor.next()
+        
+        if cursor.isValid():
+            cursor.remove()
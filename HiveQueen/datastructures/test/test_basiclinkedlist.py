@@ -96,5 +96,55 @@ class TestBasicLinkedList(TestCase):
         self.assertEqual( self.bll.occurrencesOf('A'), 2)
         
         
-           
-                              
\ No newline at end of file
+    def testSizeAfterUpdates(self):
+        self.bll.extract()
+        self.bll.extractAfter(self.bll.getFirst())
+        self.assertEqual( len(self.bll), 1)
+        self.bll.extract()
+        self.assertEqual( self.bll.size(), 0)
+        self.assertEqual( self.bll.getLast(), None)
+        self.bll.insertAt('A', 0)
+        self.bll.insertAt('B', 1)
+        self.assertEqual( self.bll.size(), 2)
+        self.assertEqual( self.bll.getLast().getInfo(), 'B')
+        
+        
+    def testAppend(self):
+        self.bll.append('D')
+        self.bll_empty.append('D')
+        self.assertEqual( self.bll.getLast().getInfo(), 'D')
+        self.assertEqual( self.bll.getByIndex(3).getInfo(), 'D')
+        self.assertEqual( self.bll_empty.getFirst().getInfo(), 'D')
+        
+        
+    def testFromIterable(self):
+        bll = BasicLinkedList.fromIterable(['A', 'B', 'C'])
+        self.assertEqual( list(bll), ['A', 'B', 'C'])
+        self.assertEqual( bll.size(), 3)
+        self.assertEqual( bll.getLast().getInfo(), 'C')
+        
+        
+    def testIterator(self):
+        self.assertEqual( list(self.bll), ['C', 'B', 'A'])
+        self.assertEqual( list(reversed(self.bll)), ['A', 'B', 'C'])
+        self.assertEqual( list(self.bll_empty), [])
+        self.assertEqual( 'B' in self.bll, True)
+        self.assertEqual( 'D' in self.bll, False)
+        
+        
+    def testCursor(self):
+        cursor = self.bll.cursor()
+        self.assertEqual( cursor.getInfo(), 'C')
+        cursor.insertBefore('D')
+        self.assertEqual( cursor.next(), True)
+        self.assertEqual( cursor.remove(), 'B')
+        self.assertEqual( cursor.getInfo(), 'A')
+        cursor.insertAfter('E')
+        self.assertEqual( cursor.next(), True)
+        self.assertEqual( cursor.next(), False)
+        cursor.insertBefore('F')
+        self.assertEqual( list(self.bll), ['D', 'C', 'A', 'E', 'F'])
+        self.assertEqual( self.bll.size(), 5)
+        self.assertEqual( self.bll.getLast().getInfo(), 'F')
+        with self.assertRaises(ValueError):
+            cursor.remove()
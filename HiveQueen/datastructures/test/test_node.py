@@ -30,4 +30,9 @@ class TestNode(TestCase):
         
     def testSetNext(self):
         self.n1.setNext( self.n2 )
-        self.assertEqual( self.n1.getNext(), self.n2)      
\ No newline at end of file
+        self.assertEqual( self.n1.getNext(), self.n2)
+        
+        
+    def testSlots(self):
+        with self.assertRaises(AttributeError):
+            self.n1.other = 'C'
@@ -0,0 +1,102 @@
+'''
+Created on 17 oct. 2026
+
+@author: user
+'''
+from django.test import TestCase
+import random
+
+from datastructures.sortedarraylist import SortedArrayList
+
+
+class TestSortedArrayList(TestCase):
+
+
+    def setUp(self):
+        self.sal_reverse = SortedArrayList(reverse=True)
+        self.sal_empty = SortedArrayList()
+        self.sal = SortedArrayList()
+        self.sal.insert('B')
+        self.sal.insert('A')
+        self.sal.insert('C')
+        self.sal_reverse.insert('A')
+        self.sal_reverse.insert('C')
+        self.sal_reverse.insert('B')
+
+
+    def testInsert(self):
+        self.assertEqual( self.sal_empty.size(), 0)
+        self.assertEqual( self.sal.size(), 3)
+        self.sal.insert('D')
+        self.assertEqual( len(self.sal), 4)
+        self.assertEqual( self.sal.getByIndex(0).getInfo(), 'A')
+        self.assertEqual( self.sal.getByIndex(1).getInfo(), 'B')
+        self.assertEqual( self.sal.getByIndex(2).getInfo(), 'C')
+        self.assertEqual( self.sal[3].getInfo(), 'D')
+
+
+    def testInsertReverse(self):
+        self.sal_reverse.insert('D')
+        self.assertEqual( list(self.sal_reverse), ['D', 'C', 'B', 'A'])
+        self.assertEqual( self.sal_reverse.getIndexOf('B'), 2)
+        self.sal_reverse.remove('C')
+        self.assertEqual( list(self.sal_reverse), ['D', 'B', 'A'])
+
+
+    def testRemove(self):
+        self.sal.remove('A')
+        self.assertEqual( self.sal.size(), 2)
+        self.sal.remove('A')
+        self.assertEqual( self.sal.size(), 2)
+        self.assertEqual( self.sal.getFirst().getInfo(), 'B')
+
+
+    def testGetIndexOf(self):
+        self.assertEqual( self.sal.getIndexOf('C'), 2)
+        self.assertEqual( self.sal.getIndexOf('D'), -1)
+        self.assertEqual( self.sal_empty.getIndexOf('D'), -1)
+
+
+    def testOccurrencesOf(self):
+        self.assertEqual( self.sal.occurrencesOf('A'), 1)
+        self.sal.insert('A')
+        self.assertEqual( self.sal.occurrencesOf('A'), 2)
+        self.assertEqual( self.sal.occurrencesOf('D'), 0)
+
+
+    def testGetByIndexValue(self):
+        with self.assertRaises(ValueError):
+            self.sal.getByIndex(3)
+
+
+    def testWalk(self):
+        infos = []
+        current = self.sal.getFirst()
+        while current != None:
+            infos.append(current.getInfo())
+            current = current.getNext()
+        self.assertEqual( infos, ['A', 'B', 'C'])
+        self.assertEqual( self.sal.getLast().getInfo(), 'C')
+
+
+    def testRandomized(self):
+        rnd = random.Random(5)
+        sal = SortedArrayList()
+        sal.LOAD = 4
+        expected = []
+        for i in range(400):
+            value = rnd.randint(0, 100)
+            sal.insert(value)
+            expected.append(value)
+        for value in expected[::2]:
+            sal.remove(value)
+        for value in expected[::2]:
+            expected.remove(value)
+        expected.sort()
+
+        self.assertEqual( list(sal), expected)
+        self.assertEqual( sal.size(), len(expected))
+        for index in range(0, len(expected), 7):
+            self.assertEqual( sal.getByIndex(index).getInfo(), expected[index])
+            self.assertEqual( sal.getIndexOf(expected[index]), expected.index(expected[index]))
+        self.assertEqual( sal.occurrencesOf(expected[0]), expected.count(expected[0]))
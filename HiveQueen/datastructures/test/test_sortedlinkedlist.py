@@ -4,7 +4,9 @@ Created on 10 may. 2021
 @author: user
 '''
 from django.test import TestCase
+import datetime
 from datastructures.sortedlinkedlist import SortedLinkedList
+from hive.timeframe import TimeFrame
 
 
 class TestSortedLinkedList(TestCase):
@@ -47,7 +49,44 @@ class TestSortedLinkedList(TestCase):
         self.assertEqual( self.sll_reverse.getByIndex(3).getInfo(), 'A')    
         
         
+    def testFromSorted(self):
+        sll = SortedLinkedList.fromSorted(['A', 'B', 'B', 'C'])
+        self.assertEqual( list(sll), ['A', 'B', 'B', 'C'])
+        self.assertEqual( sll.size(), 4)
+        sll.insert('D')
+        self.assertEqual( sll.getLast().getInfo(), 'D')
+        sll_reverse = SortedLinkedList.fromSorted(['C', 'B', 'A'], reverse=True)
+        sll_reverse.insert('D')
+        self.assertEqual( list(sll_reverse), ['D', 'C', 'B', 'A'])
+        with self.assertRaises(ValueError):
+            SortedLinkedList.fromSorted(['B', 'A'])
+        
+        
+    def testFromUnsorted(self):
+        self.assertEqual( list(SortedLinkedList.fromUnsorted(['C', 'A', 'B'])), ['A', 'B', 'C'])
+        self.assertEqual( list(SortedLinkedList.fromUnsorted(['A', 'C', 'B'], reverse=True)), ['C', 'B', 'A'])
+        self.assertEqual( list(SortedLinkedList.fromIterable(['C', 'A', 'B'])), ['A', 'B', 'C'])
+        
+        
+    def testFromUnsortedReverseTimeFrames(self):
+        # TimeFrame compares begins with < and ends with >
+        t = datetime.datetime(2021, 4, 7)
+        hour = datetime.timedelta(hours=1)
+        frames = [TimeFrame(t, t + 10 * hour), TimeFrame(t + hour, t + 5 * hour), TimeFrame(t + 2 * hour, t + 3 * hour)]
+        inserted = SortedLinkedList(reverse=True)
+        for frame in frames:
+            inserted.insert(frame)
+        self.assertEqual( list(SortedLinkedList.fromUnsorted(frames, reverse=True)), list(inserted))
+        self.assertEqual( list(SortedLinkedList.fromUnsorted(reversed(frames), reverse=True)), list(inserted))
+        
+        
     def testRemove(self):
         self.sll.remove('A') 
         self.assertEqual( self.sll.size(), 2)
-          
\ No newline at end of file
+        self.sll.remove('C')
+        self.assertEqual( self.sll.getLast().getInfo(), 'B')
+        self.sll.insert('C')
+        self.sll.insert('A')
+        self.assertEqual( list(self.sll), ['A', 'B', 'C'])
+        self.sll_reverse.remove('B')
+        self.assertEqual( list(self.sll_reverse), ['C', 'A'])
@@ -0,0 +1,318 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres
+
+Benchmarks for the datastructures and hive packages.
+
+Runs every case at growing sizes and reports the time of the measured
+operation, so complexity regressions show up as a change in how the time
+grows with the size. Usage:
+
+    python -m hive.benchmark --sizes 10,100,1000 --json results.json
+    python manage.py benchmark --sizes 10,100,1000 --json results.json
+'''
+
+import argparse
+import datetime
+import json
+import math
+import platform
+import random
+import sys
+import time
+
+from datastructures.basiclinkedlist import BasicLinkedList
+from datastructures.sortedlinkedlist import SortedLinkedList
+from datastructures.sortedarraylist import SortedArrayList
+from hive.timeframe import TimeFrame
+from hive.compacttimeframe import CompactTimeFrame
+from hive.timeframeslist import TimeFramesList
+from hive.timeframetree import TimeFrameTree
+
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+
+# Sizes of a case predicted to run slower than this are skipped (the
+# smallest size always runs)
+DEFAULT_MAX_SECONDS = 2.0
+
+# Random lookups/removals done by the index and remove cases
+LOOKUPS = 1000
+
+T0 = datetime.datetime(2021, 4, 7)
+
+STORAGES = {
+    'SortedLinkedList': SortedLinkedList,
+    'SortedArrayList': SortedArrayList,
+    'TimeFrameTree': TimeFrameTree,
+}
+
+
+def randomFrames(size, rnd, spread=10):
+    '''
+    size frames of up to an hour spread over size * spread minutes
+    '''
+    frames = []
+    for i in range(size):
+        begin = T0 + datetime.timedelta(minutes=rnd.randint(0, size * spread))
+        frames.append(TimeFrame(begin, begin + datetime.timedelta(minutes=rnd.randint(0, 60))))
+    return frames
+
+
+def disjointFrames(size):
+    return [TimeFrame(T0 + datetime.timedelta(hours=2 * i), T0 + datetime.timedelta(hours=2 * i + 1))
+            for i in range(size)]
+
+
+def buildStorage(storageClass, frames):
+    if hasattr(storageClass, 'fromUnsorted'):
+        return storageClass.fromUnsorted(frames)
+
+    storage = storageClass()
+    for frame in frames:
+        storage.insert(frame)
+    return storage
+
+
+# Each case maps a size and a random generator to a pair (setup, run):
+# setup builds the input, only run(input) is timed. It returns the number
+# of operations done, used for the per operation time.
+
+def linkedListAppend(size, rnd):
+    def run(items):
+        bll = BasicLinkedList()
+        for item in items:
+            bll.append(item)
+        return len(items)
+    return (lambda: list(range(size))), run
+
+
+def linkedListFromIterable(size, rnd):
+    def run(items):
+        BasicLinkedList.fromIterable(items)
+        return len(items)
+    return (lambda: list(range(size))), run
+
+
+def linkedListGetByIndex(size, rnd):
+    def setup():
+        indexes = [rnd.randrange(size) for i in range(LOOKUPS)]
+        return BasicLinkedList.fromIterable(range(size)), indexes
+
+    def run(state):
+        bll, indexes = state
+        for index in indexes:
+            bll.getByIndex(index)
+        return len(indexes)
+    return setup, run
+
+
+def storageInsert(storageClass):
+    def case(size, rnd):
+        def run(frames):
+            storage = storageClass()
+            for frame in frames:
+                storage.insert(frame)
+            return len(frames)
+        return (lambda: randomFrames(size, rnd)), run
+    return case
+
+
+def storageRemove(storageClass):
+    def case(size, rnd):
+        def setup():
+            frames = randomFrames(size, rnd)
+            return buildStorage(storageClass, frames), rnd.sample(frames, min(size, LOOKUPS))
+
+        def run(state):
+            storage, removed = state
+            for frame in removed:
+                storage.remove(frame)
+            return len(removed)
+        return setup, run
+    return case
+
+
+def storageGetByIndex(storageClass):
+    def case(size, rnd):
+        def setup():
+            storage = buildStorage(storageClass, randomFrames(size, rnd))
+            return storage, [rnd.randrange(size) for i in range(LOOKUPS)]
+
+        def run(state):
+            storage, indexes = state
+            for index in indexes:
+                storage.getByIndex(index).getInfo()
+            return len(indexes)
+        return setup, run
+    return case
+
+
+def listIsOverlapping(storageClass):
+    def case(size, rnd):
+        def setup():
+            return TimeFramesList(storage=buildStorage(storageClass, disjointFrames(size)))
+
+        def run(timeFramesList):
+            timeFramesList.isOverlapping()
+            return size
+        return setup, run
+    return case
+
+
+def listJoinOverlapping(storageClass):
+    def case(size, rnd):
+        def setup():
+            return TimeFramesList(storage=buildStorage(storageClass, randomFrames(size, rnd)))
+
+        def run(timeFramesList):
+            timeFramesList.joinOverlapping()
+            return size
+        return setup, run
+    return case
+
+
+def frameIsOverlapping(compact):
+    def case(size, rnd):
+        def setup():
+            frames = randomFrames(size, rnd)
+            if compact:
+                frames = [CompactTimeFrame.fromTimeFrame(frame) for frame in frames]
+            return frames
+
+        def run(frames):
+            for first, second in zip(frames, frames[1:]):
+                first.isOverlapping(second)
+            return size
+        return setup, run
+    return case
+
+
+def cases():
+    '''
+    Ordered mapping of case name to case
+    '''
+    allCases = {
+        'BasicLinkedList.append': linkedListAppend,
+        'BasicLinkedList.fromIterable': linkedListFromIterable,
+        'BasicLinkedList.getByIndex': linkedListGetByIndex,
+        'TimeFrame.isOverlapping': frameIsOverlapping(False),
+        'CompactTimeFrame.isOverlapping': frameIsOverlapping(True),
+    }
+
+    for name, storageClass in STORAGES.items():
+        allCases[name + '.insert'] = storageInsert(storageClass)
+        allCases[name + '.remove'] = storageRemove(storageClass)
+        allCases[name + '.getByIndex'] = storageGetByIndex(storageClass)
+        allCases['TimeFramesList[' + name + '].isOverlapping'] = listIsOverlapping(storageClass)
+        allCases['TimeFramesList[' + name + '].joinOverlapping'] = listJoinOverlapping(storageClass)
+
+    return allCases
+
+
+def run(sizes=None, repeat=3, maxSeconds=DEFAULT_MAX_SECONDS, selected=None, seed=0, out=None):
+    '''
+    Runs the selected cases (names containing any of the selected strings)
+    and returns the results as a dictionary ready to be dumped as JSON
+    '''
+    sizes = sorted(sizes or DEFAULT_SIZES)
+    results = []
+
+    for name, case in cases().items():
+        if selected and not any(pattern in name for pattern in selected):
+            continue
+
+        measured = []
+        for size in sizes:
+            result = {'case': name, 'size': size, 'seconds': None, 'perOperation': None}
+
+            if not measured or predictSeconds(measured, size) <= maxSeconds:
+                rnd = random.Random(seed)
+                setup, timed = case(size, rnd)
+                best = None
+                for i in range(repeat):
+                    state = setup()
+                    start = time.perf_counter()
+                    operations = timed(state)
+                    elapsed = time.perf_counter() - start
+                    if best is None or elapsed < best:
+                        best = elapsed
+                    if elapsed > maxSeconds:
+                        break
+
+                result['seconds'] = best
+                result['perOperation'] = best / max(operations, 1)
+                measured.append((size, best))
+
+            results.append(result)
+            if out is not None:
+                out.write(formatResult(result) + '\n')
+                out.flush()
+
+    return {
+        'python': platform.python_version(),
+        'sizes': sizes,
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def predictSeconds(measured, size):
+    '''
+    Extrapolates the time at size from the last two measures, with the
+    growth exponent bounded between linear and quadratic
+    '''
+    lastSize, lastSeconds = measured[-1]
+    exponent = 1
+    if len(measured) > 1:
+        previousSize, previousSeconds = measured[-2]
+        if previousSeconds > 0 and lastSeconds > 0:
+            exponent = math.log(lastSeconds / previousSeconds) / math.log(lastSize / previousSize)
+            exponent = min(max(exponent, 1), 2)
+
+    return lastSeconds * (size / lastSize) ** exponent
+
+
+def formatResult(result):
+    if result['seconds'] is None:
+        return '%-55s %8d %14s' % (result['case'], result['size'], 'skipped')
+
+    return '%-55s %8d %12.6f s %12.3f us/op' % (result['case'], result['size'], result['seconds'],
+                                                 result['perOperation'] * 1e6)
+
+
+def addArguments(parser):
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help='Comma separated sizes')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per case and size, the best one is kept')
+    parser.add_argument('--max-seconds', type=float, default=DEFAULT_MAX_SECONDS,
+                        help='Skip sizes of a case predicted to take longer')
+    parser.add_argument('--case', action='append', dest='cases',
+                        help='Only run cases whose name contains this text (repeatable)')
+    parser.add_argument('--json', dest='jsonPath',
+                        help='Save the results as JSON to this file')
+
+
+def runFromOptions(sizes, repeat, maxSeconds, selected, jsonPath, out):
+    sizes = [int(size) for size in sizes.split(',') if size]
+    results = run(sizes, repeat, maxSeconds, selected, out=out)
+
+    if jsonPath:
+        with open(jsonPath, 'w') as jsonFile:
+            json.dump(results, jsonFile, indent=2)
+
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the datastructures and hive packages')
+    addArguments(parser)
+    options = parser.parse_args(argv)
+    runFromOptions(options.sizes, options.repeat, options.max_seconds, options.cases,
+                   options.jsonPath, sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
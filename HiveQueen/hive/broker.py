@@ -0,0 +1,114 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres
+
+In-process publish/subscribe of events, from any thread to asyncio
+subscribers.
+
+Publishers (request threads, job workers...) call publish(topic, data);
+each Subscription is an asyncio queue owned by an event loop, filled with
+call_soon_threadsafe, so a subscriber waiting for events costs a queue and
+a suspended coroutine, not a thread.
+
+Topics are 'kind' or 'kind:name' strings. A subscription to 'kind'
+receives every 'kind:...' event too. Queues are bounded: a subscriber too
+slow to keep up loses events and is told so with a single event of topic
+OVERFLOW, after which it should reload what it shows.
+
+Only this process sees the events: every writer must run in the same
+process as the subscribers (a single ASGI server process).
+'''
+
+import asyncio
+import itertools
+import threading
+
+
+OVERFLOW = 'overflow'
+
+# Events queued per subscriber before it is considered lost
+MAX_QUEUED = 1000
+
+
+class Subscription:
+
+    def __init__(self, broker, topics, loop, maxsize):
+        self.topics = frozenset(topics)
+        self.queue = asyncio.Queue(maxsize)
+        self.overflowed = False
+        self.__broker = broker
+        self.__loop = loop
+
+    def wants(self, topic):
+        return topic in self.topics or topic.split(':', 1)[0] in self.topics
+
+    def deliver(self, event):
+        self.__loop.call_soon_threadsafe(self.__put, event)
+
+    def __put(self, event):
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Room for the notice only: drop the oldest event
+            self.queue.get_nowait()
+            self.queue.put_nowait((next(self.__broker.sequence), OVERFLOW, None))
+            self.overflowed = True
+
+    async def get(self):
+        '''
+        Waits for the next (sequence, topic, data) event
+        '''
+        event = await self.queue.get()
+        if event[1] == OVERFLOW:
+            self.overflowed = False
+        return event
+
+    def close(self):
+        self.__broker.unsubscribe(self)
+
+
+class Broker:
+
+    def __init__(self, maxsize=MAX_QUEUED):
+        self.maxsize = maxsize
+        self.sequence = itertools.count(1)
+        self.__lock = threading.Lock()
+        self.__subscriptions = set()
+
+    def subscribe(self, topics):
+        '''
+        Returns a Subscription to topics for the running event loop
+        '''
+        subscription = Subscription(self, topics, asyncio.get_running_loop(), self.maxsize)
+        with self.__lock:
+            self.__subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.__lock:
+            self.__subscriptions.discard(subscription)
+
+    def publish(self, topic, data):
+        '''
+        Sends data to the subscribers of topic, from any thread
+        '''
+        with self.__lock:
+            subscriptions = [subscription for subscription in self.__subscriptions if subscription.wants(topic)]
+        if subscriptions:
+            event = (next(self.sequence), topic, data)
+            for subscription in subscriptions:
+                try:
+                    subscription.deliver(event)
+                except RuntimeError:
+                    # Its loop is closed
+                    self.unsubscribe(subscription)
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__subscriptions)
+
+
+broker = Broker()
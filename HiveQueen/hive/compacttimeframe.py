@@ -0,0 +1,145 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres
+'''
+
+import datetime
+
+from hive.timeframe import TimeFrame
+
+
+EPOCH = datetime.datetime(1970, 1, 1)
+EPOCH_UTC = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def toEpochMicroseconds(instant):
+    '''
+    Microseconds elapsed since the epoch. Naive datetimes are counted from
+    the naive epoch, so no local time zone is involved.
+    '''
+    if not isinstance(instant, datetime.datetime):
+        raise Exception("Invalid type argument: instant")
+
+    if instant.tzinfo is None:
+        delta = instant - EPOCH
+    else:
+        delta = instant - EPOCH_UTC
+
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def fromEpochMicroseconds(microseconds, tzinfo=None):
+    '''
+    Inverse of toEpochMicroseconds. A naive datetime is returned when
+    tzinfo is None.
+    '''
+    delta = datetime.timedelta(microseconds=microseconds)
+
+    if tzinfo is None:
+        return EPOCH + delta
+
+    return (EPOCH_UTC + delta).astimezone(tzinfo)
+
+
+class CompactTimeFrame:
+    '''
+    Compact Time Frame
+
+    Same behaviour as TimeFrame, but begin and end are stored as integer
+    epoch microseconds in a slotted object, so comparisons work on plain
+    integers. The time zone of the original datetimes is kept so the
+    conversion back to TimeFrame is lossless.
+    '''
+
+    __slots__ = ('begin', 'end', 'tzinfo')
+
+    def __init__(self, begin, end, tzinfo=None):
+        if not isinstance(begin, int):
+            raise Exception("Invalid type argument: begin")
+
+        if not isinstance(end, int):
+            raise Exception("Invalid type argument: end")
+
+        if begin > end:
+            raise ValueError("Time Frame invalid: begin > end")
+
+        self.begin = begin
+        self.end = end
+        self.tzinfo = tzinfo
+
+    @classmethod
+    def fromTimeFrame(cls, timeframe):
+        if not isinstance(timeframe, TimeFrame):
+            raise Exception("Invalid type argument: timeframe")
+
+        return cls(toEpochMicroseconds(timeframe.getBegin()),
+                   toEpochMicroseconds(timeframe.getEnd()),
+                   timeframe.getBegin().tzinfo)
+
+    def toTimeFrame(self):
+        return TimeFrame(fromEpochMicroseconds(self.begin, self.tzinfo),
+                         fromEpochMicroseconds(self.end, self.tzinfo))
+
+    def getBegin(self):
+        return self.begin
+
+    def getEnd(self):
+        return self.end
+
+    def __repr__(self):
+        return "CompactTimeFrame(%d, %d)" % (self.begin, self.end)
+
+    def __eq__(self, other):
+        if not isinstance(other, CompactTimeFrame):
+            raise Exception("Invalid type argument: other")
+
+        return self.begin == other.begin and self.end == other.end
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __lt__(self, other):
+        if not isinstance(other, CompactTimeFrame):
+            raise Exception("Invalid type argument: other")
+
+        return self.begin < other.begin
+
+    def __le__(self, other):
+        if not isinstance(other, CompactTimeFrame):
+            raise Exception("Invalid type argument: other")
+
+        return self.begin < other.begin or self == other
+
+    def __gt__(self, other):
+        if not isinstance(other, CompactTimeFrame):
+            raise Exception("Invalid type argument: other")
+
+        return self.end > other.end
+
+    def __ge__(self, other):
+        if not isinstance(other, CompactTimeFrame):
+            raise Exception("Invalid type argument: other")
+
+        return self.end > other.end or self == other
+
+    def isOverlapping(self, other):
+        if not isinstance(other, CompactTimeFrame):
+            raise Exception("Invalid type argument: other")
+
+        return other.begin <= self.end and self.begin <= other.end
+
+    def union(self, other):
+        begin = self.begin if self.begin <= other.begin else other.begin
+        end = self.end if self.end >= other.end else other.end
+
+        return CompactTimeFrame(begin, end, self.tzinfo)
+
+    def intersection(self, other):
+        if not self.isOverlapping(other):
+            raise ValueError("Time frames not overlapped !!!")
+
+        begin = other.begin if self.begin <= other.begin else self.begin
+        end = other.end if self.end >= other.end else self.end
+
+        return CompactTimeFrame(begin, end, self.tzinfo)
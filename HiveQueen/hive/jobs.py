@@ -0,0 +1,269 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres
+
+Parallel execution of a command (usually ansible-playbook) over many
+hosts.
+
+A JobRunner owns a bounded pool of worker threads shared by every job.
+Each Job runs at most `forks` hosts at a time, with a timeout per host,
+and can be cancelled: pending hosts are skipped and running commands are
+killed. Results are handed over in batches, so they can be stored with a
+single bulk insert per batch.
+
+Executors decide what "running on a host" means: CommandExecutor runs a
+local process per host (ansible-playbook limited to the host, ssh, ...)
+and StubExecutor runs a Python function, to test without real hosts.
+'''
+
+import datetime
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+OK = 'ok'
+FAILED = 'failed'
+TIMEOUT = 'timeout'
+CANCELLED = 'cancelled'
+ERROR = 'error'
+
+PENDING = 'pending'
+RUNNING = 'running'
+FINISHED = 'finished'
+
+# Output kept per host, the tail of longer outputs
+MAX_OUTPUT = 64 * 1024
+
+# How often running commands check for cancellation
+POLL_SECONDS = 0.1
+
+
+class HostResult:
+    '''
+    Outcome of a job on one host
+    '''
+
+    __slots__ = ('host', 'status', 'returncode', 'output', 'started', 'finished')
+
+    def __init__(self, host, status, returncode=None, output='', started=None, finished=None):
+        self.host = host
+        self.status = status
+        self.returncode = returncode
+        self.output = output[-MAX_OUTPUT:]
+        self.started = started
+        self.finished = finished
+
+    def __repr__(self):
+        return 'HostResult(%r, %r, %r)' % (self.host, self.status, self.returncode)
+
+
+def now():
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+class CommandExecutor:
+    '''
+    Runs a command per host. '{host}' in the arguments is replaced by the
+    host name.
+    '''
+
+    def __init__(self, command):
+        self.command = list(command)
+
+    def arguments(self, host):
+        return [argument.replace('{host}', host) for argument in self.command]
+
+    def run(self, host, timeout, cancelled):
+        started = now()
+        try:
+            process = subprocess.Popen(self.arguments(host), stdout=subprocess.PIPE,
+                                       stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+                                       universal_newlines=True)
+        except OSError as error:
+            return HostResult(host, ERROR, None, str(error), started, now())
+
+        # communicate() in slices, so cancellation is seen while it runs
+        deadline = None if timeout is None else started + datetime.timedelta(seconds=timeout)
+        status = None
+        output = ''
+        while status is None:
+            try:
+                output, unused = process.communicate(timeout=POLL_SECONDS)
+                status = OK if process.returncode == 0 else FAILED
+            except subprocess.TimeoutExpired:
+                if cancelled.is_set():
+                    status = CANCELLED
+                elif deadline is not None and now() >= deadline:
+                    status = TIMEOUT
+
+                if status is not None:
+                    process.kill()
+                    output, unused = process.communicate()
+
+        return HostResult(host, status, process.returncode, output or '', started, now())
+
+
+def ansible_playbook(playbook, inventory=None, extra_arguments=()):
+    '''
+    Executor running a playbook limited to each host. Without an inventory
+    the host is used as a one host inventory ("host,").
+    '''
+    if inventory is None:
+        command = ['ansible-playbook', '-i', '{host},', playbook]
+    else:
+        command = ['ansible-playbook', '-i', inventory, '--limit', '{host}', playbook]
+    return CommandExecutor(command + list(extra_arguments))
+
+
+class StubExecutor:
+    '''
+    Runs function(host) instead of a command. It returns the output, or
+    raises to mark the host as failed. Without a function every host
+    succeeds.
+    '''
+
+    def __init__(self, function=None):
+        self.function = function
+
+    def run(self, host, timeout, cancelled):
+        started = now()
+        if cancelled.is_set():
+            return HostResult(host, CANCELLED, None, '', started, now())
+        try:
+            output = self.function(host) if self.function is not None else ''
+        except Exception as error:
+            return HostResult(host, FAILED, 1, str(error), started, now())
+        return HostResult(host, OK, 0, output or '', started, now())
+
+
+class Job:
+    '''
+    A command over a list of hosts, at most forks hosts at a time
+    '''
+
+    def __init__(self, hosts, executor, forks=5, timeout=None, on_batch=None, batch_size=50,
+                 on_finish=None):
+        if forks < 1:
+            raise ValueError("Invalid forks value: " + str(forks))
+
+        self.hosts = list(hosts)
+        self.executor = executor
+        self.forks = forks
+        self.timeout = timeout
+        self.on_batch = on_batch
+        self.batch_size = batch_size
+        self.on_finish = on_finish
+
+        self.status = PENDING
+        self.results = []
+        self.__next = 0
+        self.__lanes = 0
+        self.__pending = []
+        self.__lock = threading.Lock()
+        self.__cancelled = threading.Event()
+        self.__finished = threading.Event()
+
+    def start(self, pool):
+        lanes = min(self.forks, len(self.hosts))
+        with self.__lock:
+            self.status = RUNNING
+            self.__lanes = lanes
+        if lanes == 0:
+            self.__finish()
+        for i in range(lanes):
+            pool.submit(self.__lane)
+
+    def __take(self):
+        with self.__lock:
+            if self.__next >= len(self.hosts):
+                return None
+            host = self.hosts[self.__next]
+            self.__next += 1
+            return host
+
+    def __lane(self):
+        try:
+            host = self.__take()
+            while host is not None:
+                if self.__cancelled.is_set():
+                    result = HostResult(host, CANCELLED)
+                else:
+                    try:
+                        result = self.executor.run(host, self.timeout, self.__cancelled)
+                    except Exception as error:
+                        result = HostResult(host, ERROR, None, str(error), None, now())
+                self.__add(result)
+                host = self.__take()
+        finally:
+            with self.__lock:
+                self.__lanes -= 1
+                last = self.__lanes == 0
+            if last:
+                self.__finish()
+
+    def __add(self, result):
+        batch = None
+        with self.__lock:
+            self.results.append(result)
+            self.__pending.append(result)
+            if len(self.__pending) >= self.batch_size:
+                batch, self.__pending = self.__pending, []
+        if batch and self.on_batch is not None:
+            self.on_batch(batch)
+
+    def __finish(self):
+        with self.__lock:
+            batch, self.__pending = self.__pending, []
+        if batch and self.on_batch is not None:
+            self.on_batch(batch)
+
+        self.status = FINISHED
+        if self.on_finish is not None:
+            self.on_finish(self)
+        self.__finished.set()
+
+    def cancel(self):
+        '''
+        Skips the pending hosts and kills the running commands
+        '''
+        self.__cancelled.set()
+
+    def isCancelled(self):
+        return self.__cancelled.is_set()
+
+    def wait(self, timeout=None):
+        return self.__finished.wait(timeout)
+
+    def isFinished(self):
+        return self.__finished.is_set()
+
+    def progress(self):
+        '''
+        Counts of results per status, plus total and done
+        '''
+        with self.__lock:
+            counts = {'total': len(self.hosts), 'done': len(self.results)}
+            for result in self.results:
+                counts[result.status] = counts.get(result.status, 0) + 1
+        return counts
+
+
+class JobRunner:
+    '''
+    Bounded pool of workers shared by the jobs it runs
+    '''
+
+    def __init__(self, max_workers=20):
+        self.__pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='hive-job')
+
+    def submit(self, job):
+        job.start(self.__pool)
+        return job
+
+    def run(self, hosts, executor, **options):
+        return self.submit(Job(hosts, executor, **options))
+
+    def shutdown(self, wait=True):
+        self.__pool.shutdown(wait=wait)
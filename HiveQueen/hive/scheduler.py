@@ -0,0 +1,105 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres
+
+Dispatch of items (queued jobs, hosts...) only inside their allowed time
+frames.
+
+The frames of an item are the intersections of its maintenance windows
+with the requested run window. Items wait in a heap keyed on the begin of
+their next frame, so finding the due ones costs O(log n) per item and
+items far in the future are never looked at.
+'''
+
+import heapq
+import itertools
+
+from hive.timeframeslist import TimeFramesList
+
+
+def allowedFrames(windows, requested):
+    '''
+    Sorted, disjoint frames of requested inside any of windows (TimeFrames).
+    windows None means no restriction.
+    '''
+    if windows is None:
+        return [requested]
+
+    frames = TimeFramesList()
+    for window in windows:
+        if window.isOverlapping(requested):
+            frame = window.intersection(requested)
+            # Windows only touching the requested one leave an instant
+            if frame.getBegin() < frame.getEnd():
+                frames.addTimeFrame(frame)
+    frames.joinOverlapping()
+
+    allowed = []
+    current = frames.getList().getFirst()
+    while current != None:
+        allowed.append(current.getInfo())
+        current = current.getNext()
+    return allowed
+
+
+class WindowScheduler:
+    '''
+    Priority queue of items keyed on the begin of their next allowed frame
+    '''
+
+    def __init__(self):
+        self.__heap = []
+        self.__counter = itertools.count()
+        self.__expired = []
+
+    def __len__(self):
+        return len(self.__heap)
+
+    def add(self, item, frames):
+        '''
+        Queues item to be dispatched in any of frames (sorted and disjoint,
+        see allowedFrames). Without frames the item expires at once and
+        False is returned.
+        '''
+        if not frames:
+            self.__expired.append(item)
+            return False
+
+        heapq.heappush(self.__heap, (frames[0].getBegin(), next(self.__counter), item, frames, 0))
+        return True
+
+    def nextStart(self):
+        '''
+        Begin of the earliest frame of the queued items, None if empty
+        '''
+        return self.__heap[0][0] if self.__heap else None
+
+    def due(self, now):
+        '''
+        Removes and returns the items with a frame containing now. Items
+        whose frames all ended are moved to the expired ones, the others
+        are queued again on their next frame.
+        '''
+        due = []
+        while self.__heap and self.__heap[0][0] <= now:
+            begin, order, item, frames, index = heapq.heappop(self.__heap)
+
+            while index < len(frames) and frames[index].getEnd() < now:
+                index += 1
+
+            if index == len(frames):
+                self.__expired.append(item)
+            elif frames[index].getBegin() <= now:
+                due.append(item)
+            else:
+                heapq.heappush(self.__heap, (frames[index].getBegin(), order, item, frames, index))
+
+        return due
+
+    def popExpired(self):
+        '''
+        Returns and forgets the items that expired so far
+        '''
+        expired, self.__expired = self.__expired, []
+        return expired
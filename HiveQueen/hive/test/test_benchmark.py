@@ -0,0 +1,21 @@
+'''
+Created on 17 oct. 2026
+
+@author: user
+'''
+from django.test import TestCase
+
+from hive import benchmark
+
+
+class TestBenchmark(TestCase):
+
+    def testRun(self):
+        results = benchmark.run(sizes=[10, 20], repeat=1)
+        self.assertEqual( len(results['results']), 2 * len(benchmark.cases()))
+        for result in results['results']:
+            self.assertGreaterEqual( result['seconds'], 0)
+
+    def testSkipSlowSizes(self):
+        results = benchmark.run(sizes=[10, 20], repeat=1, maxSeconds=-1, selected=['TimeFrameTree.insert'])
+        self.assertEqual( [result['seconds'] is None for result in results['results']], [False, True])
@@ -0,0 +1,73 @@
+'''
+Created on 17 oct. 2026
+
+@author: user
+'''
+import asyncio
+import threading
+
+from django.test import SimpleTestCase
+
+from hive.broker import Broker, OVERFLOW
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class TestBroker(SimpleTestCase):
+
+    def testTopics(self):
+        async def main():
+            broker = Broker()
+            colony = broker.subscribe(['colony'])
+            jobs = broker.subscribe(['job'])
+            job = broker.subscribe(['job:2'])
+
+            broker.publish('colony', 'a')
+            broker.publish('job:1', 'b')
+            broker.publish('job:2', 'c')
+            await asyncio.sleep(0)
+
+            self.assertEqual([(await colony.get())[1:]], [('colony', 'a')])
+            self.assertEqual([(await jobs.get())[1:], (await jobs.get())[1:]], [('job:1', 'b'), ('job:2', 'c')])
+            self.assertEqual([(await job.get())[1:]], [('job:2', 'c')])
+            self.assertTrue(colony.queue.empty() and job.queue.empty())
+
+            colony.close()
+            self.assertEqual(len(broker), 2)
+
+        run(main())
+
+    def testFromThreads(self):
+        async def main():
+            broker = Broker()
+            subscription = broker.subscribe(['colony'])
+            threads = [threading.Thread(target=lambda: [broker.publish('colony', i) for i in range(100)])
+                       for t in range(4)]
+            for thread in threads:
+                thread.start()
+            events = [await asyncio.wait_for(subscription.get(), 5) for i in range(400)]
+            for thread in threads:
+                thread.join()
+            self.assertEqual(len(set(sequence for sequence, topic, data in events)), 400)
+
+        run(main())
+
+    def testOverflow(self):
+        async def main():
+            broker = Broker(maxsize=3)
+            subscription = broker.subscribe(['colony'])
+            for i in range(10):
+                broker.publish('colony', i)
+            await asyncio.sleep(0)
+
+            events = [(await subscription.get())[1:] for i in range(3)]
+            self.assertEqual(events, [('colony', 1), ('colony', 2), (OVERFLOW, None)])
+
+            # Delivered again once the notice is read
+            broker.publish('colony', 10)
+            await asyncio.sleep(0)
+            self.assertEqual((await subscription.get())[1:], ('colony', 10))
+
+        run(main())
@@ -0,0 +1,71 @@
+'''
+Created on 17 oct. 2026
+
+@author: user
+'''
+from django.test import TestCase
+import datetime
+
+from hive.timeframe import TimeFrame
+from hive.compacttimeframe import CompactTimeFrame
+from hive.timeframeslist import mergeTimeFrames
+
+
+class TestCompactTimeFrame(TestCase):
+
+    def setUp(self):
+        self.t0 = datetime.datetime.now()
+        self.t1 =  self.t0 + datetime.timedelta(days=1)
+        self.t2 =  self.t1 + datetime.timedelta(days=1)
+        self.t3 =  self.t2 + datetime.timedelta(days=1)
+        self.timeframe0_2 = CompactTimeFrame.fromTimeFrame(TimeFrame(self.t0, self.t2))
+        self.timeframe1_3 = CompactTimeFrame.fromTimeFrame(TimeFrame(self.t1, self.t3))
+        self.timeframe2_3 = CompactTimeFrame.fromTimeFrame(TimeFrame(self.t2, self.t3))
+        self.timeframe0_1 = CompactTimeFrame.fromTimeFrame(TimeFrame(self.t0, self.t1))
+
+    def testCompactTimeFrame1(self):
+        with self.assertRaises(ValueError):
+            CompactTimeFrame(2, 1)
+
+    def testCompactTimeFrame2(self):
+        with self.assertRaises(Exception):
+            CompactTimeFrame(self.t0, 1)
+
+    def testSlots(self):
+        with self.assertRaises(AttributeError):
+            self.timeframe0_2.other = 1
+
+    def testRoundTripNaive(self):
+        timeframe = TimeFrame(self.t0, self.t3)
+        compact = CompactTimeFrame.fromTimeFrame(timeframe)
+        self.assertEqual( compact.end - compact.begin, 3 * 86400 * 1000000)
+        self.assertEqual( compact.toTimeFrame(), timeframe)
+        self.assertIsNone( compact.toTimeFrame().getBegin().tzinfo)
+
+    def testRoundTripAware(self):
+        tz = datetime.timezone(datetime.timedelta(hours=2))
+        begin = datetime.datetime(2021, 4, 7, 10, 30, 15, 123456, tzinfo=tz)
+        timeframe = TimeFrame(begin, begin + datetime.timedelta(microseconds=1))
+        back = CompactTimeFrame.fromTimeFrame(timeframe).toTimeFrame()
+        self.assertEqual( back, timeframe)
+        self.assertEqual( back.getBegin().utcoffset(), datetime.timedelta(hours=2))
+
+    def testIsOverlapping(self):
+        self.assertEqual( self.timeframe0_2.isOverlapping( self.timeframe1_3 ), True)
+        self.assertEqual( self.timeframe0_2.isOverlapping( self.timeframe2_3 ), True)
+        self.assertEqual( self.timeframe0_1.isOverlapping( self.timeframe2_3 ), False)
+
+    def testUnionIntersection(self):
+        self.assertEqual( self.timeframe0_2.union( self.timeframe2_3 ).toTimeFrame(), TimeFrame(self.t0, self.t3))
+        self.assertEqual( self.timeframe0_2.intersection( self.timeframe1_3 ).toTimeFrame(), TimeFrame(self.t1, self.t2))
+        with self.assertRaises(ValueError):
+            self.timeframe0_1.intersection( self.timeframe2_3 )
+
+    def testComparison(self):
+        self.assertEqual( self.timeframe0_1 < self.timeframe1_3, True)
+        self.assertEqual( self.timeframe1_3 > self.timeframe0_2, True)
+        self.assertEqual( self.timeframe0_2 == CompactTimeFrame.fromTimeFrame(TimeFrame(self.t0, self.t2)), True)
+
+    def testMerge(self):
+        merged = list(mergeTimeFrames([self.timeframe0_1, self.timeframe0_2, self.timeframe2_3]))
+        self.assertEqual( [frame.toTimeFrame() for frame in merged], [TimeFrame(self.t0, self.t3)])
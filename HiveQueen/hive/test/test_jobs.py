@@ -0,0 +1,99 @@
+'''
+Created on 17 oct. 2026
+
+@author: user
+'''
+import sys
+import threading
+
+from django.test import SimpleTestCase
+
+from hive import jobs
+
+
+class TestJobs(SimpleTestCase):
+
+    def setUp(self):
+        self.runner = jobs.JobRunner(max_workers=4)
+
+    def tearDown(self):
+        self.runner.shutdown()
+
+    def testStub(self):
+        batches = []
+        job = self.runner.run(['h%d' % i for i in range(10)], jobs.StubExecutor(lambda host: 'done ' + host),
+                              forks=3, batch_size=4, on_batch=batches.append)
+        self.assertTrue( job.wait(5))
+        self.assertEqual( job.status, jobs.FINISHED)
+        self.assertEqual( sorted(result.host for result in job.results), sorted('h%d' % i for i in range(10)))
+        self.assertEqual( sorted(len(batch) for batch in batches), [2, 4, 4])
+        self.assertEqual( job.progress(), {'total': 10, 'done': 10, jobs.OK: 10})
+
+    def testFailures(self):
+        def function(host):
+            if host == 'bad':
+                raise RuntimeError('unreachable')
+            return ''
+
+        job = self.runner.run(['good', 'bad'], jobs.StubExecutor(function))
+        job.wait(5)
+        statuses = dict((result.host, result.status) for result in job.results)
+        self.assertEqual( statuses, {'good': jobs.OK, 'bad': jobs.FAILED})
+
+    def testForks(self):
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def function(host):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            threading.Event().wait(0.02)
+            with lock:
+                running[0] -= 1
+
+        job = self.runner.run(['h%d' % i for i in range(8)], jobs.StubExecutor(function), forks=2)
+        job.wait(5)
+        self.assertEqual( running[1], 2)
+
+    def testNoHosts(self):
+        finished = []
+        job = self.runner.run([], jobs.StubExecutor(), on_finish=finished.append)
+        self.assertTrue( job.wait(1))
+        self.assertEqual( finished, [job])
+
+    def testInvalidForks(self):
+        self.assertRaises(ValueError, jobs.Job, ['h'], jobs.StubExecutor(), forks=0)
+
+    def testCommand(self):
+        executor = jobs.CommandExecutor([sys.executable, '-c', 'print("hello {host}")'])
+        job = self.runner.run(['localhost'], executor)
+        job.wait(10)
+        result = job.results[0]
+        self.assertEqual( (result.status, result.returncode), (jobs.OK, 0))
+        self.assertEqual( result.output.strip(), 'hello localhost')
+
+    def testCommandFailed(self):
+        job = self.runner.run(['localhost'], jobs.CommandExecutor([sys.executable, '-c', 'raise SystemExit(3)']))
+        job.wait(10)
+        self.assertEqual( (job.results[0].status, job.results[0].returncode), (jobs.FAILED, 3))
+
+    def testCommandNotFound(self):
+        job = self.runner.run(['localhost'], jobs.CommandExecutor(['/nonexistent/command']))
+        job.wait(10)
+        self.assertEqual( job.results[0].status, jobs.ERROR)
+
+    def testTimeout(self):
+        executor = jobs.CommandExecutor([sys.executable, '-c', 'import time; time.sleep(30)'])
+        job = self.runner.run(['localhost'], executor, timeout=0.3)
+        self.assertTrue( job.wait(10))
+        self.assertEqual( job.results[0].status, jobs.TIMEOUT)
+
+    def testCancel(self):
+        executor = jobs.CommandExecutor([sys.executable, '-c', 'import time; time.sleep(30)'])
+        job = self.runner.run(['a', 'b', 'c'], executor, forks=1)
+        threading.Event().wait(0.3)
+        job.cancel()
+        self.assertTrue( job.wait(10))
+        self.assertTrue( job.isCancelled())
+        self.assertEqual( [result.status for result in job.results], [jobs.CANCELLED] * 3)
@@ -0,0 +1,65 @@
+'''
+Created on 17 oct. 2026
+
+@author: user
+'''
+import datetime
+
+from django.test import SimpleTestCase
+
+from hive.scheduler import WindowScheduler, allowedFrames
+from hive.timeframe import TimeFrame
+
+
+T0 = datetime.datetime(2021, 4, 7)
+
+
+def frame(beginHour, endHour):
+    return TimeFrame(T0 + datetime.timedelta(hours=beginHour), T0 + datetime.timedelta(hours=endHour))
+
+
+def at(hour):
+    return T0 + datetime.timedelta(hours=hour)
+
+
+class TestAllowedFrames(SimpleTestCase):
+
+    def testNoWindows(self):
+        self.assertEqual( allowedFrames(None, frame(0, 10)), [frame(0, 10)])
+
+    def testIntersection(self):
+        windows = [frame(8, 12), frame(1, 2), frame(20, 30), frame(1, 3)]
+        self.assertEqual( allowedFrames(windows, frame(0, 10)), [frame(1, 3), frame(8, 10)])
+
+    def testTouching(self):
+        self.assertEqual( allowedFrames([frame(10, 12)], frame(0, 10)), [])
+
+
+class TestWindowScheduler(SimpleTestCase):
+
+    def testOrder(self):
+        scheduler = WindowScheduler()
+        scheduler.add('late', [frame(5, 6)])
+        scheduler.add('early', [frame(1, 2)])
+        scheduler.add('middle', [frame(3, 4)])
+        self.assertEqual( scheduler.nextStart(), at(1))
+        self.assertEqual( scheduler.due(at(0)), [])
+        self.assertEqual( scheduler.due(at(3.5)), ['middle'])
+        self.assertEqual( scheduler.popExpired(), ['early'])
+        self.assertEqual( scheduler.nextStart(), at(5))
+        self.assertEqual( len(scheduler), 1)
+
+    def testNextFrame(self):
+        scheduler = WindowScheduler()
+        scheduler.add('item', [frame(1, 2), frame(4, 5)])
+        self.assertEqual( scheduler.due(at(3)), [])
+        self.assertEqual( scheduler.nextStart(), at(4))
+        self.assertEqual( scheduler.due(at(4)), ['item'])
+        self.assertEqual( len(scheduler), 0)
+
+    def testNoFrames(self):
+        scheduler = WindowScheduler()
+        self.assertFalse( scheduler.add('item', []))
+        self.assertEqual( scheduler.popExpired(), ['item'])
+        self.assertEqual( scheduler.popExpired(), [])
+        self.assertIsNone( scheduler.nextStart())
@@ -0,0 +1,97 @@
+'''
+Created on 17 oct. 2026
+
+@author: user
+'''
+from django.test import TestCase
+import datetime
+import random
+import unittest
+
+try:
+    import numpy
+    from hive.timeframearray import TimeFrameArray
+except ImportError:
+    numpy = None
+
+from hive.timeframe import TimeFrame
+from hive.timeframeslist import mergeTimeFrames
+
+
+@unittest.skipIf(numpy is None, "numpy not installed")
+class TestTimeFrameArray(TestCase):
+
+    def setUp(self):
+        self.t0 = datetime.datetime.now()
+        self.t1 =  self.t0 + datetime.timedelta(days=1)
+        self.t2 =  self.t1 + datetime.timedelta(days=1)
+        self.t3 =  self.t2 + datetime.timedelta(days=1)
+        self.timeframe0_1 = TimeFrame(self.t0, self.t1)
+        self.timeframe1_2 = TimeFrame(self.t1, self.t2)
+        self.timeframe2_3 = TimeFrame(self.t2, self.t3)
+        self.frames = [self.timeframe2_3, self.timeframe0_1, TimeFrame(self.t0, self.t0)]
+        self.array = TimeFrameArray.fromTimeFrames(self.frames)
+
+        rnd = random.Random(7)
+        self.randomFrames = []
+        for i in range(200):
+            begin = self.t0 + datetime.timedelta(minutes=rnd.randint(0, 5000))
+            self.randomFrames.append(TimeFrame(begin, begin + datetime.timedelta(minutes=rnd.randint(0, 60))))
+
+    def testInvalid(self):
+        with self.assertRaises(ValueError):
+            TimeFrameArray([2], [1])
+
+    def testRoundTrip(self):
+        self.assertEqual( self.array.toTimeFrames(), self.frames)
+        self.assertEqual( len(self.array), 3)
+        self.assertEqual( self.array[1].toTimeFrame(), self.timeframe0_1)
+
+    def testOverlaps(self):
+        self.assertEqual( list(self.array.overlaps(self.timeframe1_2)), [True, True, False])
+        other = TimeFrameArray.fromTimeFrames([self.timeframe0_1, self.timeframe2_3, self.timeframe1_2])
+        self.assertEqual( list(self.array.overlaps(other)), [False, False, False])
+
+        query = self.randomFrames[0]
+        expected = [frame.isOverlapping(query) for frame in self.randomFrames]
+        self.assertEqual( list(TimeFrameArray.fromTimeFrames(self.randomFrames).overlaps(query)), expected)
+
+    def testIntersect(self):
+        query = TimeFrame(self.t0 + datetime.timedelta(minutes=1000), self.t0 + datetime.timedelta(minutes=1500))
+        expected = [frame.intersection(query) for frame in self.randomFrames if frame.isOverlapping(query)]
+        array = TimeFrameArray.fromTimeFrames(self.randomFrames)
+        self.assertEqual( array.intersect(query).toTimeFrames(), expected)
+
+    def testUnionAll(self):
+        key = lambda frame: (frame.getBegin(), frame.getEnd())
+        expected = list(mergeTimeFrames(sorted(self.randomFrames, key=key)))
+        array = TimeFrameArray.fromTimeFrames(self.randomFrames)
+        self.assertEqual( array.unionAll().toTimeFrames(), expected)
+        self.assertEqual( self.array.unionAll().toTimeFrames(), [TimeFrame(self.t0, self.t1), self.timeframe2_3])
+        self.assertEqual( len(TimeFrameArray([], []).unionAll()), 0)
+
+    def testOverlapsAny(self):
+        clients = TimeFrameArray.fromTimeFrames(self.randomFrames)
+        jobs = TimeFrameArray.fromTimeFrames(self.randomFrames[:20])
+        expected = [any(frame.isOverlapping(job) for job in self.randomFrames[:20]) for frame in self.randomFrames]
+        self.assertEqual( list(clients.overlapsAny(jobs)), expected)
+
+    def testOverlapsAnyEmpty(self):
+        empty = TimeFrameArray([], [])
+        self.assertEqual( list(self.array.overlapsAny(empty)), [False, False, False])
+        self.assertEqual( list(empty.overlapsAny(self.array)), [])
+        self.assertEqual( list(empty.overlapsAny(empty)), [])
+
+    def testContains(self):
+        instants = [self.t0, self.t1 + datetime.timedelta(hours=1), self.t3, self.t3 + datetime.timedelta(microseconds=1)]
+        self.assertEqual( list(self.array.contains(instants)), [True, False, True, False])
+
+    def testContainsEmpty(self):
+        empty = TimeFrameArray([], [])
+        self.assertEqual( list(empty.contains([self.t0, self.t1])), [False, False])
+        self.assertEqual( list(empty.contains([])), [])
+
+    def testCoverage(self):
+        self.assertEqual( self.array.coverage(), 2 * 86400 * 1000000)
+        self.assertEqual( self.array.coverage(within=self.timeframe1_2), 0)
+        self.assertEqual( self.array.coverage(within=TimeFrame(self.t0, self.t2)), 86400 * 1000000)
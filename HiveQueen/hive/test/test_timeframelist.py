@@ -6,7 +6,10 @@ Created on 11 may. 2021
 from django.test import TestCase
 import datetime
 from hive.timeframe import TimeFrame
-from hive.timeframeslist import TimeFramesList
+from hive.timeframeslist import TimeFramesList, mergeTimeFrames
+from hive.timeframetree import TimeFrameTree
+from datastructures.sortedarraylist import SortedArrayList
+from datastructures.sortedlinkedlist import SortedLinkedList
 
 class TestTimeFrameList(TestCase):
 
@@ -75,4 +78,73 @@ class TestTimeFrameList(TestCase):
         self.assertEqual( self.ttfl_empty.size(), 1)
         self.ttfl.joinOverlapping()
         self.assertEqual( self.ttfl.size(), 1)
-        
\ No newline at end of file
+        
+        
+        
+    def testGetOverlappingTimeFramesList(self):
+        self.assertEqual( len(self.ttfl.getOverlapping(self.timeframe2_3)), 5)
+        self.assertEqual( len(self.ttfl.getFramesAt(self.t0)), 3)
+        self.assertEqual( self.ttfl_empty.getFramesAt(self.t0), [])
+        
+        
+    def testTreeStorage(self):
+        ttfl_tree = TimeFramesList(storage=TimeFrameTree())
+        ttfl_tree.addTimeFrame(self.timeframe2_3)
+        ttfl_tree.addTimeFrame(self.timeframe0_1)
+        self.assertEqual( ttfl_tree.isOverlapping(), False)
+        self.assertEqual( ttfl_tree.getFramesAt(self.t0), [self.timeframe0_1])
+        ttfl_tree.addTimeFrame(self.timeframe1_2)
+        self.assertEqual( ttfl_tree.isOverlapping(), True)
+        self.assertEqual( ttfl_tree.getOverlapping(self.timeframe1_2), 
+                          [self.timeframe0_1, self.timeframe1_2, self.timeframe2_3])
+        ttfl_tree.joinOverlapping()
+        self.assertEqual( ttfl_tree.size(), 1)
+        self.assertEqual( ttfl_tree.getList().getFirst().getInfo(), self.timeframe0_3)
+        
+        
+    def testJoinOverlappingSortedByEnd(self):
+        t4 = self.t3 + datetime.timedelta(days=1)
+        self.ttfl_empty.addTimeFrame(TimeFrame(self.t0, self.t2))
+        self.ttfl_empty.addTimeFrame(TimeFrame(self.t3, self.t3))
+        self.ttfl_empty.addTimeFrame(TimeFrame(self.t1, t4))
+        self.ttfl_empty.joinOverlapping()
+        self.assertEqual( self.ttfl_empty.size(), 1)
+        self.assertEqual( self.ttfl_empty.getList().getFirst().getInfo(), TimeFrame(self.t0, t4))
+        
+        
+    def testJoinOverlappingKeepsStorage(self):
+        t4 = self.t3 + datetime.timedelta(days=1)
+        storage = SortedLinkedList(reverse=True)
+        ttfl_reverse = TimeFramesList(storage=storage)
+        ttfl_reverse.addTimeFrame(self.timeframe0_1)
+        ttfl_reverse.addTimeFrame(TimeFrame(self.t3, t4))
+        ttfl_reverse.addTimeFrame(self.timeframe1_2)
+        ttfl_reverse.joinOverlapping()
+        self.assertIs( ttfl_reverse.getList(), storage)
+        self.assertEqual( list(storage), [TimeFrame(self.t3, t4), self.timeframe0_2])
+        ttfl_reverse.addTimeFrame(self.timeframe1_2)
+        self.assertEqual( list(storage), [TimeFrame(self.t3, t4), self.timeframe1_2, self.timeframe0_2])
+        
+        
+    def testMergeTimeFrames(self):
+        frames = (frame for frame in [self.timeframe0_1, self.timeframe0_2, self.timeframe0_1, self.timeframe2_3])
+        self.assertEqual( list(mergeTimeFrames(frames)), [self.timeframe0_3])
+        self.assertEqual( list(mergeTimeFrames([])), [])
+        t4 = self.t3 + datetime.timedelta(days=1)
+        merged = list(mergeTimeFrames([self.timeframe0_1, TimeFrame(self.t3, t4)]))
+        self.assertEqual( merged, [self.timeframe0_1, TimeFrame(self.t3, t4)])
+        with self.assertRaises(ValueError):
+            list(mergeTimeFrames([self.timeframe1_2, self.timeframe0_1]))
+        
+        
+    def testArrayStorage(self):
+        ttfl_array = TimeFramesList(storage=SortedArrayList())
+        ttfl_array.addTimeFrame(self.timeframe2_3)
+        ttfl_array.addTimeFrame(self.timeframe0_1)
+        self.assertEqual( ttfl_array.isOverlapping(), False)
+        ttfl_array.addTimeFrame(self.timeframe1_2)
+        ttfl_array.removeTimeFrame(self.timeframe0_1)
+        self.assertEqual( ttfl_array.size(), 2)
+        ttfl_array.joinOverlapping()
+        self.assertEqual( ttfl_array.size(), 1)
+        self.assertEqual( ttfl_array.getList().getFirst().getInfo(), self.timeframe1_3)
\ No newline at end of file
@@ -0,0 +1,93 @@
+'''
+Created on 17 oct. 2026
+
+@author: user
+'''
+from django.test import TestCase
+import datetime
+import random
+
+from hive.timeframe import TimeFrame
+from hive.timeframetree import TimeFrameTree
+
+
+class TestTimeFrameTree(TestCase):
+
+
+    def setUp(self):
+        self.t0 = datetime.datetime.now()
+        self.t1 =  self.t0 + datetime.timedelta(days=1)
+        self.t2 =  self.t1 + datetime.timedelta(days=1)
+        self.t3 =  self.t2 + datetime.timedelta(days=1)
+        self.timeframe0_1 = TimeFrame(self.t0, self.t1)
+        self.timeframe1_2 = TimeFrame(self.t1, self.t2)
+        self.timeframe2_3 = TimeFrame(self.t2, self.t3)
+        self.timeframe0_2 = TimeFrame(self.t0, self.t2)
+        self.tree_empty = TimeFrameTree()
+        self.tree = TimeFrameTree()
+        self.tree.insert(self.timeframe2_3)
+        self.tree.insert(self.timeframe0_2)
+        self.tree.insert(self.timeframe1_2)
+        self.tree.insert(self.timeframe0_1)
+
+
+    def testSize(self):
+        self.assertEqual( self.tree_empty.size(), 0)
+        self.assertEqual( self.tree.size(), 4)
+        self.assertEqual( len(self.tree), 4)
+
+
+    def testOrder(self):
+        self.assertEqual( list(self.tree), [self.timeframe0_1, self.timeframe0_2,
+                                            self.timeframe1_2, self.timeframe2_3])
+        self.assertEqual( self.tree.getByIndex(2).getInfo(), self.timeframe1_2)
+        self.assertEqual( self.tree.getFirst().getInfo(), self.timeframe0_1)
+        self.assertEqual( self.tree.getLast().getInfo(), self.timeframe2_3)
+        self.assertEqual( self.tree.getFirst().getNext().getInfo(), self.timeframe0_2)
+
+
+    def testGetByIndexValue(self):
+        with self.assertRaises(ValueError):
+            self.tree.getByIndex(4)
+
+
+    def testRemove(self):
+        self.tree.remove(self.timeframe0_2)
+        self.assertEqual( self.tree.size(), 3)
+        self.tree.remove(self.timeframe0_2)
+        self.assertEqual( self.tree.size(), 3)
+        self.assertEqual( self.tree.getIndexOf(self.timeframe0_2), -1)
+        self.assertEqual( self.tree.getIndexOf(self.timeframe2_3), 2)
+
+
+    def testOccurrencesOf(self):
+        self.assertEqual( self.tree.occurrencesOf(self.timeframe1_2), 1)
+        self.tree.insert(TimeFrame(self.t1, self.t2))
+        self.assertEqual( self.tree.occurrencesOf(self.timeframe1_2), 2)
+
+
+    def testGetOverlapping(self):
+        self.assertEqual( self.tree.getOverlapping(TimeFrame(self.t3, self.t3)), [self.timeframe2_3])
+        self.assertEqual( self.tree.getContaining(self.t1), [self.timeframe0_1, self.timeframe0_2,
+                                                             self.timeframe1_2])
+        self.assertEqual( self.tree_empty.getContaining(self.t1), [])
+
+
+    def testRandomized(self):
+        rnd = random.Random(4)
+        frames = []
+        for i in range(300):
+            begin = self.t0 + datetime.timedelta(hours=rnd.randint(0, 500))
+            frame = TimeFrame(begin, begin + datetime.timedelta(hours=rnd.randint(0, 30)))
+            frames.append(frame)
+            self.tree_empty.insert(frame)
+        for frame in frames[::3]:
+            frames.remove(frame)
+            self.tree_empty.remove(frame)
+
+        key = lambda frame: (frame.getBegin(), frame.getEnd())
+        self.assertEqual( [key(f) for f in self.tree_empty], sorted(key(f) for f in frames))
+
+        query = TimeFrame(self.t0 + datetime.timedelta(hours=200), self.t0 + datetime.timedelta(hours=220))
+        expected = sorted((f for f in frames if f.isOverlapping(query)), key=key)
+        self.assertEqual( [key(f) for f in self.tree_empty.getOverlapping(query)], [key(f) for f in expected])
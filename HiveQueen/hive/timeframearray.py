@@ -0,0 +1,175 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres
+'''
+
+import numpy
+
+from hive.timeframe import TimeFrame
+from hive.compacttimeframe import CompactTimeFrame, toEpochMicroseconds, fromEpochMicroseconds
+
+
+class TimeFrameArray:
+    '''
+    Columnar array of time frames
+
+    Begins and ends are kept as two int64 NumPy arrays of epoch
+    microseconds (see CompactTimeFrame), so operations over many frames run
+    vectorized. Overlapping, union and intersection follow the TimeFrame
+    semantics: frames are closed, touching frames overlap.
+    '''
+
+    def __init__(self, begins, ends, tzinfo=None):
+        '''
+        Constructor
+        '''
+        self.__begins = numpy.asarray(begins, dtype=numpy.int64)
+        self.__ends = numpy.asarray(ends, dtype=numpy.int64)
+        self.__tzinfo = tzinfo
+
+        if self.__begins.ndim != 1 or self.__begins.shape != self.__ends.shape:
+            raise ValueError("Begins and ends must be one dimensional and of the same size")
+
+        if numpy.any(self.__begins > self.__ends):
+            raise ValueError("Time Frame invalid: begin > end")
+
+    @classmethod
+    def fromTimeFrames(cls, timeframes):
+        timeframes = list(timeframes)
+        tzinfo = None
+        if timeframes:
+            tzinfo = timeframes[0].getBegin().tzinfo
+
+        begins = numpy.fromiter((toEpochMicroseconds(frame.getBegin()) for frame in timeframes),
+                                dtype=numpy.int64, count=len(timeframes))
+        ends = numpy.fromiter((toEpochMicroseconds(frame.getEnd()) for frame in timeframes),
+                              dtype=numpy.int64, count=len(timeframes))
+        return cls(begins, ends, tzinfo)
+
+    def toTimeFrames(self):
+        return [TimeFrame(fromEpochMicroseconds(int(begin), self.__tzinfo),
+                          fromEpochMicroseconds(int(end), self.__tzinfo))
+                for begin, end in zip(self.__begins, self.__ends)]
+
+    def getBegins(self):
+        return self.__begins
+
+    def getEnds(self):
+        return self.__ends
+
+    def getTzinfo(self):
+        return self.__tzinfo
+
+    def __len__(self):
+        return len(self.__begins)
+
+    def __getitem__(self, index):
+        return CompactTimeFrame(int(self.__begins[index]), int(self.__ends[index]), self.__tzinfo)
+
+    def durations(self):
+        return self.__ends - self.__begins
+
+    def __bounds(self, other):
+        '''
+        Begin and end of other as scalars (single frame) or arrays
+        '''
+        if isinstance(other, TimeFrameArray):
+            if len(other) != len(self):
+                raise ValueError("Time frame arrays of different size")
+            return other.getBegins(), other.getEnds()
+
+        if isinstance(other, TimeFrame):
+            return toEpochMicroseconds(other.getBegin()), toEpochMicroseconds(other.getEnd())
+
+        if isinstance(other, CompactTimeFrame):
+            return other.begin, other.end
+
+        raise Exception("Invalid type argument: other")
+
+    def overlaps(self, other):
+        '''
+        Boolean array telling which frames overlap other. other is a single
+        frame or an array of the same size compared element by element.
+        '''
+        begin, end = self.__bounds(other)
+        return (begin <= self.__ends) & (self.__begins <= end)
+
+    def intersect(self, other):
+        '''
+        Intersections with other of the overlapping frames. Frames not
+        overlapping are dropped, overlaps(other) gives their positions.
+        '''
+        begin, end = self.__bounds(other)
+        mask = (begin <= self.__ends) & (self.__begins <= end)
+
+        begins = numpy.maximum(self.__begins, begin)[mask]
+        ends = numpy.minimum(self.__ends, end)[mask]
+        return TimeFrameArray(begins, ends, self.__tzinfo)
+
+    def unionAll(self):
+        '''
+        Sorted array of disjoint frames joining overlapping and touching
+        frames, as TimeFramesList.joinOverlapping does
+        '''
+        if len(self) == 0:
+            return TimeFrameArray(self.__begins, self.__ends, self.__tzinfo)
+
+        order = numpy.lexsort((self.__ends, self.__begins))
+        begins = self.__begins[order]
+        reach = numpy.maximum.accumulate(self.__ends[order])
+
+        starts = numpy.empty(len(begins), dtype=bool)
+        starts[0] = True
+        starts[1:] = begins[1:] > reach[:-1]
+
+        firsts = numpy.flatnonzero(starts)
+        lasts = numpy.append(firsts[1:] - 1, len(begins) - 1)
+        return TimeFrameArray(begins[firsts], reach[lasts], self.__tzinfo)
+
+    def overlapsAny(self, other):
+        '''
+        Boolean array telling which frames overlap any frame of other, in
+        O((n + m) log m) instead of comparing every pair
+        '''
+        if not isinstance(other, TimeFrameArray):
+            raise Exception("Invalid type argument: other")
+
+        joined = other.unionAll()
+        # Nothing to index the ends of
+        if len(joined) == 0:
+            return numpy.zeros(len(self), dtype=bool)
+        index = numpy.searchsorted(joined.getBegins(), self.__ends, side='right') - 1
+        found = index >= 0
+        return found & (joined.getEnds()[numpy.maximum(index, 0)] >= self.__begins)
+
+    def contains(self, timestamps):
+        '''
+        Boolean array telling which timestamps lie inside any frame.
+        timestamps are datetimes or epoch microseconds.
+        '''
+        timestamps = self.__toMicroseconds(timestamps)
+        joined = self.unionAll()
+        if len(joined) == 0:
+            return numpy.zeros(len(timestamps), dtype=bool)
+        index = numpy.searchsorted(joined.getBegins(), timestamps, side='right') - 1
+        found = index >= 0
+        return found & (joined.getEnds()[numpy.maximum(index, 0)] >= timestamps)
+
+    def coverage(self, within=None):
+        '''
+        Total microseconds covered by the frames, counting overlaps once,
+        optionally restricted to the frame within
+        '''
+        joined = self.unionAll()
+        if within is not None:
+            joined = joined.intersect(within)
+        return int(joined.durations().sum())
+
+    def __toMicroseconds(self, timestamps):
+        if isinstance(timestamps, numpy.ndarray) and numpy.issubdtype(timestamps.dtype, numpy.integer):
+            return timestamps.astype(numpy.int64, copy=False)
+
+        timestamps = list(timestamps)
+        return numpy.fromiter((toEpochMicroseconds(instant) for instant in timestamps),
+                              dtype=numpy.int64, count=len(timestamps))
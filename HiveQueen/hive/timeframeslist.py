@@ -13,11 +13,17 @@ class TimeFramesList:
     classdocs
     '''
 
-    def __init__(self):
+    def __init__(self, storage=None):
         '''
         Constructor
+
+        storage is the sorted container holding the frames. By default a
+        SortedLinkedList; use a SortedArrayList or a TimeFrameTree (which
+        also answers overlap queries) for large lists.
         '''
-        self.__list = SortedLinkedList()
+        if storage is None:
+            storage = SortedLinkedList()
+        self.__list = storage
         
              
     def setList(self, newlist):
@@ -42,30 +48,100 @@ class TimeFramesList:
         
     def isOverlapping(self):
         isOverlapping = False
-        i = 0
-        size = self.__list.size()
-        while i < size - 1 and not isOverlapping:
-            firstFrame = self.__list.getByIndex(i).getInfo()
-            secondFrame = self.__list.getByIndex(i+1).getInfo()
+        current = self.__list.getFirst()
+        
+        while current != None and current.getNext() != None and not isOverlapping:
+            firstFrame = current.getInfo()
+            secondFrame = current.getNext().getInfo()
             isOverlapping = firstFrame.isOverlapping( secondFrame )
-            i += 1
+            current = current.getNext()
             
         return isOverlapping  
     
     
+    def getOverlapping(self, timeframe):
+        '''
+        Returns the frames overlapping timeframe
+        '''
+        if hasattr(self.__list, 'getOverlapping'):
+            return self.__list.getOverlapping(timeframe)
+        
+        overlapping = []
+        current = self.__list.getFirst()
+        while current != None:
+            if current.getInfo().isOverlapping(timeframe):
+                overlapping.append(current.getInfo())
+            current = current.getNext()
+        return overlapping
+    
+    
+    def getFramesAt(self, instant):
+        '''
+        Returns the frames containing instant
+        '''
+        if hasattr(self.__list, 'getContaining'):
+            return self.__list.getContaining(instant)
+        
+        frames = []
+        current = self.__list.getFirst()
+        while current != None:
+            frame = current.getInfo()
+            if frame.getBegin() <= instant <= frame.getEnd():
+                frames.append(frame)
+            current = current.getNext()
+        return frames
+    
+    
     def joinOverlapping(self):
+        '''
+        Joins overlapping and touching frames in a single sweep over the
+        frames sorted by begin
+        '''
+        frames = sorted(self.__frames(), key=lambda frame: (frame.getBegin(), frame.getEnd()))
+        joined = list(mergeTimeFrames(frames))
         
-        while self.isOverlapping():
-            joined = False
-            i = 0
-            size = self.__list.size() 
-            while i < size - 1 and not joined:
-                firstFrame = self.__list.getByIndex(i).getInfo()
-                secondFrame = self.__list.getByIndex(i+1).getInfo()
-                if firstFrame.isOverlapping( secondFrame ):
-                    joinedFrame = firstFrame.union( secondFrame )
-                    self.removeTimeFrame( firstFrame )
-                    self.removeTimeFrame( secondFrame )
-                    self.addTimeFrame( joinedFrame )
-                    joined = True
-                i += 1
\ No newline at end of file
+        if len(joined) < len(frames):
+            # Rebuilt in place, keeping the storage and its order. From the
+            # greatest frame, a linked list storage only ever inserts at
+            # its head (or at its tail when reversed)
+            if hasattr(self.__list, 'extract'):
+                while not self.__list.isEmpty():
+                    self.__list.extract()
+            else:
+                for frame in frames:
+                    self.__list.remove(frame)
+            for frame in reversed(joined):
+                self.__list.insert(frame)
+    
+    
+    def __frames(self):
+        current = self.__list.getFirst()
+        while current != None:
+            yield current.getInfo()
+            current = current.getNext()
+
+
+def mergeTimeFrames(frames):
+    '''
+    Generator joining overlapping and touching frames of an iterable sorted
+    by begin. Frames are consumed lazily, so it can merge a stream without
+    building the whole list first.
+    '''
+    current = None
+    previousBegin = None
+    
+    for frame in frames:
+        if current is None:
+            current = frame
+        elif frame.getBegin() < previousBegin:
+            raise ValueError("Time frames not sorted by begin")
+        elif frame.getBegin() <= current.getEnd():
+            if frame.getEnd() > current.getEnd():
+                current = current.union(frame)
+        else:
+            yield current
+            current = frame
+        previousBegin = frame.getBegin()
+            
+    if current is not None:
+        yield current
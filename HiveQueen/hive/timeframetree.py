@@ -0,0 +1,323 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral Torres
+'''
+
+
+class TimeFrameTreeNode:
+    '''
+    Node of a TimeFrameTree. Exposes the same getInfo/getNext interface as
+    datastructures.Node so it can be walked like a linked list.
+    '''
+
+    def __init__(self, info):
+        self.info = info
+        self.begin = info.getBegin()
+        self.end = info.getEnd()
+        self.maxEnd = self.end
+        self.height = 1
+        self.count = 1
+        self.left = None
+        self.right = None
+        self.parent = None
+
+    def getInfo(self):
+        return self.info
+
+    def getNext(self):
+        ''' In-order successor or None '''
+        if self.right is not None:
+            node = self.right
+            while node.left is not None:
+                node = node.left
+            return node
+
+        node = self
+        while node.parent is not None and node.parent.right is node:
+            node = node.parent
+        return node.parent
+
+    def getPrevious(self):
+        ''' In-order predecessor or None '''
+        if self.left is not None:
+            node = self.left
+            while node.right is not None:
+                node = node.right
+            return node
+
+        node = self
+        while node.parent is not None and node.parent.left is node:
+            node = node.parent
+        return node.parent
+
+    def __str__(self):
+        return str(self.info)
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+def _count(node):
+    return node.count if node is not None else 0
+
+
+def _update(node):
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    node.count = 1 + _count(node.left) + _count(node.right)
+    node.maxEnd = node.end
+    if node.left is not None and node.left.maxEnd > node.maxEnd:
+        node.maxEnd = node.left.maxEnd
+    if node.right is not None and node.right.maxEnd > node.maxEnd:
+        node.maxEnd = node.right.maxEnd
+
+
+def _rotateRight(node):
+    pivot = node.left
+    node.left = pivot.right
+    if node.left is not None:
+        node.left.parent = node
+    pivot.right = node
+    pivot.parent = node.parent
+    node.parent = pivot
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotateLeft(node):
+    pivot = node.right
+    node.right = pivot.left
+    if node.right is not None:
+        node.right.parent = node
+    pivot.left = node
+    pivot.parent = node.parent
+    node.parent = pivot
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotateLeft(node.left)
+        return _rotateRight(node)
+
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotateRight(node.right)
+        return _rotateLeft(node)
+
+    return node
+
+
+class TimeFrameTree:
+    '''
+    Sorted container of time frames backed by an augmented AVL tree.
+
+    Frames are ordered by (begin, end). Every node keeps the size of its
+    subtree and the greatest end below it, so insert, remove and index
+    lookups are O(log n) and overlap queries are O(log n + k).
+
+    It offers the same interface as SortedLinkedList, so it can be used as
+    storage for a TimeFramesList.
+    '''
+
+    def __init__(self):
+        '''
+        Constructor
+        '''
+        self.__root = None
+
+    def getRoot(self):
+        return self.__root
+
+    def getFirst(self):
+        node = self.__root
+        while node is not None and node.left is not None:
+            node = node.left
+        return node
+
+    def getLast(self):
+        node = self.__root
+        while node is not None and node.right is not None:
+            node = node.right
+        return node
+
+    def isEmpty(self):
+        return self.__root is None
+
+    def size(self):
+        return _count(self.__root)
+
+    def __len__(self):
+        return self.size()
+
+    def __iter__(self):
+        node = self.getFirst()
+        while node is not None:
+            yield node.info
+            node = node.getNext()
+
+    def __str__(self):
+        return " -> ".join(str(info) for info in self)
+
+    def insert(self, info):
+        newNode = TimeFrameTreeNode(info)
+        self.__root = self.__insert(self.__root, newNode)
+        self.__root.parent = None
+
+    def __insert(self, node, newNode):
+        if node is None:
+            return newNode
+
+        if (newNode.begin, newNode.end) < (node.begin, node.end):
+            node.left = self.__insert(node.left, newNode)
+            node.left.parent = node
+        else:
+            node.right = self.__insert(node.right, newNode)
+            node.right.parent = node
+
+        return _rebalance(node)
+
+    def remove(self, info):
+        ''' Removes one frame equal to info, if any '''
+        if self.searchNodeByInfo(info) is not None:
+            self.__root = self.__remove(self.__root, info.getBegin(), info.getEnd())
+            if self.__root is not None:
+                self.__root.parent = None
+
+    def __remove(self, node, begin, end):
+        key = (node.begin, node.end)
+
+        if (begin, end) < key:
+            node.left = self.__remove(node.left, begin, end)
+            if node.left is not None:
+                node.left.parent = node
+        elif (begin, end) > key:
+            node.right = self.__remove(node.right, begin, end)
+            if node.right is not None:
+                node.right.parent = node
+        else:
+            if node.left is None or node.right is None:
+                child = node.left if node.left is not None else node.right
+                if child is not None:
+                    child.parent = node.parent
+                return child
+
+            # Replace with the in-order successor and drop it from the right
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node.info = successor.info
+            node.begin = successor.begin
+            node.end = successor.end
+            node.right = self.__removeFirst(node.right)
+            if node.right is not None:
+                node.right.parent = node
+
+        return _rebalance(node)
+
+    def __removeFirst(self, node):
+        if node.left is None:
+            if node.right is not None:
+                node.right.parent = node.parent
+            return node.right
+
+        node.left = self.__removeFirst(node.left)
+        if node.left is not None:
+            node.left.parent = node
+        return _rebalance(node)
+
+    def getByIndex(self, index):
+        if index < 0 or index >= self.size():
+            raise ValueError("Invalid index value: " + str(index))
+
+        node = self.__root
+        while node is not None:
+            leftCount = _count(node.left)
+            if index < leftCount:
+                node = node.left
+            elif index == leftCount:
+                return node
+            else:
+                index -= leftCount + 1
+                node = node.right
+
+    def __getitem__(self, index):
+        return self.getByIndex(index)
+
+    def __lowerBound(self, begin, end):
+        ''' First node whose key is not less than (begin, end) and its index '''
+        node = self.__root
+        found = None
+        foundIndex = self.size()
+        index = 0
+        while node is not None:
+            if (node.begin, node.end) < (begin, end):
+                index += _count(node.left) + 1
+                node = node.right
+            else:
+                found = node
+                foundIndex = index + _count(node.left)
+                node = node.left
+        return found, foundIndex
+
+    def searchNodeByInfo(self, info):
+        node, index = self.__lowerBound(info.getBegin(), info.getEnd())
+        if node is not None and node.begin == info.getBegin() and node.end == info.getEnd():
+            return node
+        return None
+
+    def getIndexOf(self, info):
+        node, index = self.__lowerBound(info.getBegin(), info.getEnd())
+        if node is not None and node.begin == info.getBegin() and node.end == info.getEnd():
+            return index
+        return -1
+
+    def occurrencesOf(self, info):
+        counter = 0
+        node = self.searchNodeByInfo(info)
+        while node is not None and node.begin == info.getBegin() and node.end == info.getEnd():
+            counter += 1
+            node = node.getNext()
+        return counter
+
+    def getOverlapping(self, timeframe):
+        '''
+        Returns, in order, the frames overlapping timeframe (touching ends
+        included, as in TimeFrame.isOverlapping)
+        '''
+        return self.getOverlappingRange(timeframe.getBegin(), timeframe.getEnd())
+
+    def getContaining(self, instant):
+        ''' Returns, in order, the frames with begin <= instant <= end '''
+        return self.getOverlappingRange(instant, instant)
+
+    def getOverlappingRange(self, begin, end):
+        found = []
+        stack = []
+        node = self.__root
+
+        # Iterative in-order walk pruned by maxEnd (left/right) and begin (right)
+        while stack or node is not None:
+            if node is not None:
+                if node.maxEnd < begin:
+                    node = None
+                    continue
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                if node.begin > end:
+                    break
+                if node.end >= begin:
+                    found.append(node.info)
+                node = node.right
+
+        return found
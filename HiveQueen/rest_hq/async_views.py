@@ -0,0 +1,55 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral
+
+Async variants of the read endpoints, for the ASGI server (HiveQueen.asgi).
+
+Under ASGI every sync view runs in the one thread Django keeps for sync
+code, so a slow query delays every other request. These views are
+coroutines: they hand the work of the sync viewset (authentication,
+permissions, conditional GET, cache, queries, serialization) to a pool of
+threads and wait for it without blocking the event loop, so a single
+worker serves many requests at once. Django 3.2 has no async ORM; the
+queries run in the pool threads, each with its own connection.
+
+Answers are the same as those of the sync endpoints, under /api/async/.
+'''
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+
+from rest_hq import views
+
+
+def async_view(view):
+    '''
+    Returns a coroutine view running the sync view in the thread pool
+    '''
+    def run(request, *args, **kwargs):
+        # Pool threads outlive the requests: as the request handler does
+        close_old_connections()
+        try:
+            response = view(request, *args, **kwargs)
+            if hasattr(response, 'render'):
+                response.render()
+            return response
+        finally:
+            close_old_connections()
+
+    run = sync_to_async(run, thread_sensitive=False)
+
+    async def coroutine(request, *args, **kwargs):
+        return await run(request, *args, **kwargs)
+
+    coroutine.csrf_exempt = getattr(view, 'csrf_exempt', False)
+    return coroutine
+
+
+client_list = async_view(views.ClientViewSet.as_view({'get': 'list'}))
+client_detail = async_view(views.ClientViewSet.as_view({'get': 'retrieve'}))
+space_list = async_view(views.SpaceViewSet.as_view({'get': 'list'}))
+space_detail = async_view(views.SpaceViewSet.as_view({'get': 'retrieve'}))
+netaddress_list = async_view(views.NetAddressViewSet.as_view({'get': 'list'}))
+netaddress_detail = async_view(views.NetAddressViewSet.as_view({'get': 'retrieve'}))
+clients_by_space = async_view(views.clients_by_space)
@@ -0,0 +1,197 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral
+'''
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from colony.versions import bump
+from colony import changes
+from colony import signals
+
+
+class BulkModelMixin:
+    '''
+    Adds a bulk/ endpoint to a ModelViewSet taking JSON arrays:
+
+        POST   [{...}, ...]           creates every item
+        PATCH  [{"id": 1, ...}, ...]  updates the given fields of every item
+        DELETE [1, 2, ...]            deletes the items with those ids
+
+    Items are validated with bulk_serializer_class, which must not touch the
+    database, and then together by bulk_validate with set based queries.
+    Nothing is written unless every item is valid; otherwise the answer is
+    a 400 with one error dictionary per item (empty for valid ones). Writes
+    use bulk_create / bulk_update / a single delete in one transaction, with
+    the same number of queries however many items there are.
+
+    bulk_lookup_field is a unique field finding the created rows when the
+    database does not return their ids from bulk_create (SQLite, MySQL).
+    '''
+
+    bulk_serializer_class = None
+    bulk_lookup_field = None
+    bulk_max_items = 5000
+    bulk_batch_size = 500
+
+    def bulk_validate(self, items, errors, instances=None):
+        '''
+        Hook for checks across items. items are the validated data (None
+        for invalid items) and instances the objects being updated.
+        Problems are added to errors[i].
+        '''
+        pass
+
+    def bulk_prepare(self, objects, fields=None):
+        '''
+        Hook run before writing, for the values save() would compute
+        (bulk writes skip it). fields are the fields being updated, None
+        when creating; returns the fields to write.
+        '''
+        return fields
+
+    @action(detail=False, methods=['post', 'patch', 'delete'])
+    def bulk(self, request):
+        data = request.data
+        if not isinstance(data, list):
+            return Response({'detail': 'Expected a list of items.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        if len(data) > self.bulk_max_items:
+            return Response({'detail': 'Too many items, the limit is %d.' % self.bulk_max_items},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        if request.method == 'POST':
+            return self.bulk_create(data)
+        elif request.method == 'PATCH':
+            return self.bulk_update(data)
+        else:
+            return self.bulk_delete(data)
+
+    def bulk_create(self, data):
+        items, errors = self.__validate_items(data, partial=False)
+        self.bulk_validate(items, errors)
+        if any(errors):
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        model = self.get_queryset().model
+        objects = [model(**item) for item in items]
+        self.bulk_prepare(objects)
+        with transaction.atomic():
+            model.objects.bulk_create(objects, batch_size=self.bulk_batch_size)
+            if objects and objects[0].pk is None and self.bulk_lookup_field:
+                field = self.bulk_lookup_field
+                ids = dict(model.objects.filter(**{field + '__in': [getattr(obj, field) for obj in objects]})
+                           .values_list(field, 'pk'))
+                for obj in objects:
+                    obj.pk = ids[getattr(obj, field)]
+            # bulk_create sends no signals
+            bump(model)
+            changes.record(model, [obj.pk for obj in objects if obj.pk is not None], changes.CREATED)
+
+        serializer = self.bulk_serializer_class(objects, many=True)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def bulk_update(self, data):
+        ids = [item.get('id') if isinstance(item, dict) else None for item in data]
+        items, errors = self.__validate_items(data, partial=True)
+
+        model = self.get_queryset().model
+        instances = model.objects.in_bulk([pk for pk in ids if isinstance(pk, int)])
+
+        seen = set()
+        for i, pk in enumerate(ids):
+            if not isinstance(pk, int):
+                errors[i].setdefault('id', []).append('A valid integer is required.')
+            elif pk not in instances:
+                errors[i].setdefault('id', []).append('Not found.')
+            elif pk in seen:
+                errors[i].setdefault('id', []).append('Repeated in this request.')
+            seen.add(pk)
+
+        self.bulk_validate(items, errors, [instances.get(pk) for pk in ids])
+        if any(errors):
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        fields = set()
+        objects = []
+        for pk, item in zip(ids, items):
+            instance = instances[pk]
+            for field, value in item.items():
+                setattr(instance, field, value)
+            fields.update(item)
+            objects.append(instance)
+
+        fields = self.bulk_prepare(objects, fields)
+        if fields:
+            # bulk_update does not set the auto_now fields, as save() does
+            now = timezone.now()
+            for field in model._meta.concrete_fields:
+                if getattr(field, 'auto_now', False):
+                    for instance in objects:
+                        setattr(instance, field.attname, now)
+                    fields = fields | {field.name}
+            with transaction.atomic():
+                model.objects.bulk_update(objects, sorted(fields), batch_size=self.bulk_batch_size)
+                bump(model)
+                changes.record(model, [obj.pk for obj in objects], changes.UPDATED)
+
+        serializer = self.bulk_serializer_class(objects, many=True)
+        return Response(serializer.data)
+
+    def bulk_delete(self, data):
+        errors = [{} for pk in data]
+        for i, pk in enumerate(data):
+            if not isinstance(pk, int):
+                errors[i]['id'] = ['A valid integer is required.']
+
+        model = self.get_queryset().model
+        existing = set(model.objects.filter(pk__in=[pk for pk in data if isinstance(pk, int)])
+                       .values_list('pk', flat=True))
+        for i, pk in enumerate(data):
+            if isinstance(pk, int) and pk not in existing:
+                errors[i]['id'] = ['Not found.']
+
+        if any(errors):
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        # The change log and the versions are written for all the rows at
+        # once, not from the signals of each one
+        with transaction.atomic(), signals.batched_deletes():
+            for related, field in signals.SET_NULL_ON_DELETE.get(model, ()):
+                nulled = list(related.objects.filter(**{field + '__in': existing}).values_list('pk', flat=True))
+                if nulled:
+                    changes.record(related, nulled, changes.UPDATED)
+            model.objects.filter(pk__in=existing).delete()
+            changes.record(model, existing, changes.DELETED)
+
+        return Response({'deleted': len(existing)})
+
+    def __validate_items(self, data, partial):
+        items = []
+        errors = []
+        for item in data:
+            serializer = self.bulk_serializer_class(data=item, partial=partial)
+            if serializer.is_valid():
+                items.append(dict(serializer.validated_data))
+                errors.append({})
+            else:
+                items.append(None)
+                errors.append(dict(serializer.errors))
+        return items, errors
+
+
+def check_exists(model, field, items, errors, key):
+    '''
+    Checks with one query that the ids in items[i][key] exist in model
+    '''
+    ids = set(item[key] for item in items if item is not None and item.get(key) is not None)
+    existing = set(model.objects.filter(pk__in=ids).values_list('pk', flat=True))
+
+    for item, error in zip(items, errors):
+        if item is not None and item.get(key) is not None and item[key] not in existing:
+            error.setdefault(field, []).append('Invalid pk "%s" - object does not exist.' % item[key])
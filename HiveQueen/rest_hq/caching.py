@@ -0,0 +1,83 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral
+'''
+
+import hashlib
+
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+from colony import caching
+from colony.versions import get_versions, get_modified
+
+
+class ConditionalGetMixin:
+    '''
+    ETag and Last-Modified for the list and retrieve answers of a viewset,
+    from the versions and modification times of cache_models: a request
+    with If-None-Match or If-Modified-Since still valid is answered 304
+    without queries or serialization. Prefer the ETag, Last-Modified has
+    a resolution of one second.
+    '''
+
+    cache_models = ()
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(super().retrieve, request, *args, **kwargs)
+
+    def conditional_response(self, view, request, *args, **kwargs):
+        models = self.cache_models or (self.get_queryset().model,)
+        digest = hashlib.sha1(('%s\n%s' % (request.build_absolute_uri(), request.accepted_renderer.format)).encode())
+        etag = quote_etag('%s-%s' % ('-'.join(str(version) for version in get_versions(*models)),
+                                     digest.hexdigest()[:16]))
+        last_modified = int(get_modified(*models))
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = view(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        return response
+
+
+class CachedResponseMixin:
+    '''
+    Caches the data of the list and retrieve answers of a viewset, for the
+    user, the absolute URL (the links of the pages hold the scheme and the
+    host) and the format. cache_models are the models the serializers
+    read: a write to any of them is a miss.
+    The X-Cache header says HIT or MISS.
+    '''
+
+    cache_models = ()
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    def cached_response(self, view, request, *args, **kwargs):
+        key = caching.make_key('api', self.cache_models or (self.get_queryset().model,),
+                               self.action, request.build_absolute_uri(), request.accepted_renderer.format,
+                               caching.permissions_key(request.user))
+
+        data = caching.get(key)
+        if data is not None:
+            response = Response(data)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        response = view(request, *args, **kwargs)
+        if response.status_code == 200:
+            caching.store(key, response.data)
+        response['X-Cache'] = 'MISS'
+        return response
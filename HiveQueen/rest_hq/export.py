@@ -0,0 +1,90 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral
+'''
+
+import csv
+import json
+
+from colony.models import Client, Space, NetAddress
+
+
+CHUNK_SIZE = 2000
+
+# Exported models, in order, with the name and fields written for each
+EXPORTED = (
+    ('space', Space, ('id', 'name')),
+    ('client', Client, ('id', 'name', 'domain', 'space')),
+    ('netaddress', NetAddress, ('id', 'client', 'ip_add')),
+)
+
+CSV_COLUMNS = ('model', 'id', 'name', 'domain', 'space', 'client', 'ip_add')
+
+
+def columns(fields):
+    return [field + '_id' if field in ('space', 'client') else field for field in fields]
+
+
+def colony_rows():
+    '''
+    Yields (model name, fields, values) for every exported object, reading
+    the tables in chunks so memory does not grow with the inventory. Each
+    chunk is a query seeking after the last id read: server side cursors
+    (iterator()) are not available with every database driver, mysqlclient
+    fetches the whole result.
+    '''
+    for name, model, fields in EXPORTED:
+        last = None
+        while True:
+            rows = model.objects.order_by('pk')
+            if last is not None:
+                rows = rows.filter(pk__gt=last)
+            rows = list(rows.values_list(*columns(fields))[:CHUNK_SIZE])
+            for values in rows:
+                yield name, fields, values
+            if len(rows) < CHUNK_SIZE:
+                break
+            last = rows[-1][0]
+
+
+def export_records(name, ids):
+    '''
+    Returns id -> record, as exported, of the existing objects of the
+    model called name with ids
+    '''
+    for exported, model, fields in EXPORTED:
+        if exported == name:
+            records = {}
+            for i in range(0, len(ids), CHUNK_SIZE):
+                for values in model.objects.filter(pk__in=ids[i:i + CHUNK_SIZE]).values_list(*columns(fields)):
+                    records[values[0]] = dict(zip(fields, values))
+            return records
+    raise KeyError(name)
+
+
+def ndjson_lines():
+    for name, fields, values in colony_rows():
+        record = {'model': name}
+        record.update(zip(fields, values))
+        yield json.dumps(record) + '\n'
+
+
+class Echo:
+    '''
+    File-like object handing back what csv.writer writes
+    '''
+
+    def write(self, value):
+        return value
+
+
+def csv_lines():
+    writer = csv.writer(Echo())
+    yield writer.writerow(CSV_COLUMNS)
+
+    for name, fields, values in colony_rows():
+        record = dict(zip(fields, values))
+        record['model'] = name
+        yield writer.writerow(['' if record.get(column) is None else record[column]
+                               for column in CSV_COLUMNS])
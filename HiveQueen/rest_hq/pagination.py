@@ -0,0 +1,134 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral
+'''
+
+import datetime
+import json
+from base64 import b64decode, b64encode
+from collections import namedtuple
+from urllib import parse
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.utils.urls import replace_query_param
+
+
+Cursor = namedtuple('Cursor', ['reverse', 'position'])
+
+
+class KeysetPagination(CursorPagination):
+    '''
+    Keyset pagination on every field of the ordering: a cursor holds the
+    values of the ordering fields of the row it follows, and the page is
+    the rows after it in that order,
+
+        WHERE a > x OR (a = x AND b > y) OR (a = x AND b = y AND id > z)
+
+    so any page is one seek on an index of the ordering, however many rows
+    share the first field, and rows inserted or deleted meanwhile neither
+    repeat nor skip others. DRF's CursorPagination seeks on the first field
+    only, with an OFFSET over the rows sharing it.
+
+    The ordering must end with a unique field (the id) and its fields must
+    not be null. Works on querysets of instances and of .values() dicts.
+    '''
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.fields = [queryset.model._meta.pk if name.lstrip('-') == 'pk' else
+                       queryset.model._meta.get_field(name.lstrip('-')) for name in self.ordering]
+
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+        ordering = self.reversed_ordering() if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if self.cursor is not None:
+            queryset = queryset.filter(self.after(ordering, self.cursor.position))
+
+        results = list(queryset[:self.page_size + 1])
+        has_following = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        if reverse:
+            self.page.reverse()
+            self.has_previous, self.has_next = has_following, True
+        else:
+            self.has_previous, self.has_next = self.cursor is not None, has_following
+
+        # From an empty page, both links go on from the cursor
+        if self.page:
+            self.previous_position = self.position(self.page[0])
+            self.next_position = self.position(self.page[-1])
+        else:
+            self.previous_position = self.next_position = self.cursor.position if self.cursor else None
+            self.has_previous = self.has_next = self.cursor is not None
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def reversed_ordering(self):
+        return tuple(name[1:] if name.startswith('-') else '-' + name for name in self.ordering)
+
+    def after(self, ordering, position):
+        '''
+        Q of the rows following position in ordering
+        '''
+        names = [name.lstrip('-') for name in ordering]
+        condition = Q()
+        for i, name in enumerate(ordering):
+            step = Q(**dict(zip(names[:i], position[:i])))
+            step &= Q(**{names[i] + ('__lt' if name.startswith('-') else '__gt'): position[i]})
+            condition |= step
+        return condition
+
+    def position(self, row):
+        names = [name.lstrip('-') for name in self.ordering]
+        if isinstance(row, dict):
+            return [row[name] for name in names]
+        return [getattr(row, name) for name in names]
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(False, self.next_position)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self.encode_cursor(True, self.previous_position)
+
+    def encode_cursor(self, reverse, position):
+        values = [value.isoformat() if isinstance(value, (datetime.date, datetime.time)) else value
+                  for value in position]
+        tokens = {'p': json.dumps(values, separators=(',', ':'))}
+        if reverse:
+            tokens['r'] = '1'
+        encoded = b64encode(parse.urlencode(tokens).encode()).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            tokens = parse.parse_qs(b64decode(encoded.encode('ascii')).decode(), keep_blank_values=True)
+            reverse = bool(int(tokens.get('r', ['0'])[0]))
+            values = json.loads(tokens['p'][0])
+            if not isinstance(values, list) or len(values) != len(self.fields):
+                raise ValueError('Cursor of another ordering')
+            position = [field.to_python(value) for field, value in zip(self.fields, values)]
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return Cursor(reverse, position)
+
@@ -0,0 +1,36 @@
+'''
+Created on 17 oct. 2026
+
+@author: Gregorio Corral
+'''
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    '''
+    JSONRenderer writing with orjson when it is installed, several times
+    faster on large pages, and with the json module of JSONRenderer
+    otherwise. The output is the same: indented answers, settings asking
+    for other than compact UTF-8 and data orjson rejects are left to
+    JSONRenderer, and the values orjson would write its own way (dates,
+    times, decimals...) go through the encoder of JSONRenderer.
+    '''
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or not self.compact or self.ensure_ascii \
+                or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            text = orjson.dumps(data, default=self.encoder_class().default,
+                                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Escaped by JSONRenderer for JavaScript
+        return text.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
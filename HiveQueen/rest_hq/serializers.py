@@ -5,7 +5,7 @@ Created on 7 jun. 2021
 '''
 
 from rest_framework import serializers
-from colony.models import Client, Space, NetAddress
+from colony.models import Client, Space, NetAddress, Job, JobResult, make_fqdn
 
 class NetAddressSerializer(serializers.ModelSerializer):
     class Meta:
@@ -14,14 +14,65 @@ class NetAddressSerializer(serializers.ModelSerializer):
         
 
 class ClientSerializer(serializers.ModelSerializer):
-    addresses = NetAddressSerializer(read_only=True, many=True)
+    addresses = NetAddressSerializer(source='netaddress_set', read_only=True, many=True)
     class Meta:
         model = Client
         fields = '__all__'
 
+    def validate(self, data):
+        name = data.get('name', getattr(self.instance, 'name', None))
+        domain = data.get('domain', getattr(self.instance, 'domain', None))
+        clients = Client.objects.filter(fqdn=make_fqdn(name, domain))
+        if self.instance is not None:
+            clients = clients.exclude(pk=self.instance.pk)
+        if clients.exists():
+            raise serializers.ValidationError('A client with this name and domain already exists.')
+        return data
+
         
 class SpaceSerializer(serializers.ModelSerializer):
-    clients = ClientSerializer(read_only=True, many=True)
+    clients = ClientSerializer(source='client_set', read_only=True, many=True)
     class Meta:
         model = Space
-        fields = '__all__'
\ No newline at end of file
+        fields = '__all__'
+
+
+# Flat serializers validating bulk requests without database queries, the
+# related ids are checked for the whole batch by the viewsets
+class ClientBulkSerializer(serializers.Serializer):
+    id = serializers.IntegerField(read_only=True)
+    name = serializers.CharField(max_length=200)
+    domain = serializers.CharField(max_length=200)
+    space = serializers.IntegerField(source='space_id', allow_null=True, required=False)
+
+
+class NetAddressBulkSerializer(serializers.Serializer):
+    id = serializers.IntegerField(read_only=True)
+    client = serializers.IntegerField(source='client_id', allow_null=True, required=False)
+    ip_add = serializers.IPAddressField()
+
+
+class JobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Job
+        fields = '__all__'
+
+
+class JobResultSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = JobResult
+        exclude = ['job']
+
+
+class JobCreateSerializer(serializers.Serializer):
+    playbook = serializers.CharField(max_length=500)
+    # Plain ids, resolved by the view with one query
+    clients = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, required=False)
+    space = serializers.IntegerField(required=False)
+    forks = serializers.IntegerField(min_value=1, max_value=100, default=5)
+    timeout = serializers.IntegerField(min_value=1, required=False, allow_null=True)
+
+    def validate(self, data):
+        if ('clients' in data) == ('space' in data):
+            raise serializers.ValidationError('Give either clients or space.')
+        return data
@@ -1,3 +1,757 @@
-from django.test import TestCase
+from django.test import TestCase, TransactionTestCase, override_settings
 
 # Create your tests here.
+import csv
+import io
+import json
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, connections, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from colony.models import Client, Space, NetAddress, Job, Change, MaintenanceWindow
+from colony.versions import get_versions
+from colony import changes
+from colony import jobs
+from colony import caching
+from rest_framework.renderers import JSONRenderer
+
+from rest_hq.serializers import ClientSerializer, SpaceSerializer, NetAddressSerializer
+from rest_hq.views import client_queryset, space_queryset
+from rest_hq.renderers import FastJSONRenderer
+from rest_hq import fast
+from rest_hq import export
+
+
+def create_colony(spaces, clients_per_space, start=0):
+    for i in range(start, start + spaces):
+        space = Space.objects.create(name='space%03d' % i)
+        for j in range(clients_per_space):
+            client = Client.objects.create(name='it%03d%03d' % (i, j), domain='lab.it.uc3m.es', space=space)
+            NetAddress.objects.create(client=client, ip_add='10.%d.%d.1' % (i, j))
+            NetAddress.objects.create(client=client, ip_add='10.%d.%d.2' % (i, j))
+
+
+class NestedQueryCountTest(TestCase):
+
+    def setUp(self):
+        self.api = APIClient()
+        self.api.force_authenticate(get_user_model().objects.create_user('tester', password='tester'))
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.api.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries), response
+
+    def test_spaces_constant_queries(self):
+        create_colony(2, 2)
+        few, response = self.count_queries('/api/spaces/?page_size=100')
+        self.assertEqual(len(response.data['results'][0]['clients']), 2)
+        self.assertEqual(len(response.data['results'][0]['clients'][0]['addresses']), 2)
+
+        create_colony(8, 4, start=2)
+        many, response = self.count_queries('/api/spaces/?page_size=100')
+        self.assertEqual(len(response.data['results']), 10)
+        self.assertEqual(few, many)
+
+    def count_serializer_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            data = ClientSerializer(client_queryset(), many=True).data
+        return len(context.captured_queries), data
+
+    def test_clients_constant_queries(self):
+        create_colony(2, 2)
+        few, data = self.count_serializer_queries()
+        self.assertEqual(len(data), 4)
+        self.assertEqual(len(data[0]['addresses']), 2)
+
+        create_colony(4, 5, start=2)
+        many, data = self.count_serializer_queries()
+        self.assertEqual(len(data), 24)
+        self.assertEqual(few, many)
+
+
+class FastReadTest(TestCase):
+
+    def setUp(self):
+        self.api = APIClient()
+        self.api.force_authenticate(get_user_model().objects.create_superuser('tester', password='tester'))
+        create_colony(3, 3)
+        # Without relations
+        Space.objects.create(name='empty')
+        Client.objects.create(name='lost', domain='lab.it.uc3m.es')
+        NetAddress.objects.create(ip_add='10.99.0.1')
+
+    def test_same_data_as_serializers(self):
+        self.assertEqual(fast.clients(list(Client.objects.values(*fast.CLIENT_VALUES))),
+                         json.loads(json.dumps(ClientSerializer(client_queryset(), many=True).data)))
+        self.assertEqual(fast.spaces(list(Space.objects.values(*fast.SPACE_VALUES))),
+                         json.loads(json.dumps(SpaceSerializer(space_queryset(), many=True).data)))
+        self.assertEqual(fast.netaddresses(list(NetAddress.objects.values(*fast.NETADDRESS_VALUES))),
+                         json.loads(json.dumps(NetAddressSerializer(NetAddress.objects.all(), many=True).data)))
+        # Keys in the same order
+        space = fast.spaces(list(Space.objects.filter(name='space000').values(*fast.SPACE_VALUES)))[0]
+        expected = SpaceSerializer(space_queryset().get(name='space000')).data
+        self.assertEqual(list(space), list(expected))
+        self.assertEqual(list(space['clients'][0]), list(expected['clients'][0]))
+        self.assertEqual(list(space['clients'][0]['addresses'][0]), list(expected['clients'][0]['addresses'][0]))
+
+    def test_list_endpoints(self):
+        for url, serializer, queryset in (('/api/clients/', ClientSerializer, client_queryset()),
+                                          ('/api/spaces/', SpaceSerializer, space_queryset()),
+                                          ('/api/netaddresses/', NetAddressSerializer, NetAddress.objects.all())):
+            detail = serializer(queryset.first()).data
+            response = self.api.get(url + '?page_size=2')
+            self.assertEqual(response.data['results'][0], json.loads(json.dumps(detail)))
+            self.assertEqual(self.api.get(url + '%d/' % detail['id']).data, detail)
+
+        space = Space.objects.get(name='space001')
+        response = self.api.post('/api/clientsbyspace/', {'space': space.pk}, format='json')
+        self.assertEqual(response.data, json.loads(json.dumps(
+            ClientSerializer(client_queryset().filter(space=space), many=True).data)))
+
+    def test_renderer(self):
+        data = {'clients': ClientSerializer(client_queryset(), many=True).data,
+                'text': 'line\u2028separator \u00f1', 'when': Job.objects.create(command='ping').created,
+                'none': None}
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(FastJSONRenderer().render(data, 'application/json; indent=2'),
+                         JSONRenderer().render(data, 'application/json; indent=2'))
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+    def test_benchmark_command(self):
+        out = io.StringIO()
+        call_command('benchmark_serializers', '--rows', '20', '--repeat', '1', stdout=out)
+        self.assertEqual([line.split()[0] for line in out.getvalue().splitlines()],
+                         ['clients', 'clients', 'spaces', 'spaces', 'addresses', 'addresses'])
+        self.assertEqual(Client.objects.count(), 10)
+
+
+class CursorPaginationTest(TestCase):
+
+    def setUp(self):
+        self.api = APIClient()
+        self.api.force_authenticate(get_user_model().objects.create_user('tester', password='tester'))
+        create_colony(3, 5)
+        # Repeated names must not be skipped nor duplicated across pages
+        Client.objects.create(name='it000000', domain='lab2.it.uc3m.es')
+
+    def walk(self, url, link='next'):
+        names = []
+        while url:
+            with CaptureQueriesContext(connection) as context:
+                response = self.api.get(url)
+            self.assertEqual(response.status_code, 200)
+            for query in context.captured_queries:
+                self.assertNotIn('COUNT(', query['sql'].upper())
+                self.assertNotIn('OFFSET', query['sql'].upper())
+            names.extend(response.data['results'] if link == 'next' else reversed(response.data['results']))
+            url = response.data[link]
+        return names
+
+    def test_walk_clients(self):
+        clients = self.walk('/api/clients/?page_size=4')
+        self.assertEqual(len(clients), 16)
+        self.assertEqual(len(set(client['id'] for client in clients)), 16)
+        self.assertEqual([client['name'] for client in clients],
+                         sorted(client['name'] for client in clients))
+
+    def test_repeated_names(self):
+        # More rows sharing the first ordering field than a page
+        Client.objects.bulk_create([Client(name='it', domain='d%02d.es' % i, fqdn='it.d%02d.es' % i)
+                                    for i in range(30)])
+        clients = self.walk('/api/clients/?page_size=4')
+        self.assertEqual(len(clients), 46)
+        self.assertEqual(len(set(client['id'] for client in clients)), 46)
+        self.assertEqual([(client['name'], client['domain']) for client in clients],
+                         sorted((client['name'], client['domain']) for client in clients))
+
+        # And back from the last page
+        response = self.api.get('/api/clients/?page_size=4')
+        while response.data['next']:
+            last = response
+            response = self.api.get(response.data['next'])
+        backwards = self.walk(last.data['next'], 'previous')
+        self.assertEqual(backwards, clients[::-1])
+
+    def test_inserted_while_walking(self):
+        Client.objects.bulk_create([Client(name='it', domain='d%02d.es' % i, fqdn='it.d%02d.es' % i)
+                                    for i in range(0, 20, 2)])
+        response = self.api.get('/api/clients/?page_size=4')
+        seen = list(response.data['results'])
+        # Before and after the cursor, with the same name
+        Client.objects.create(name='it', domain='d01.es')
+        Client.objects.create(name='it', domain='d11.es')
+        seen.extend(self.walk(response.data['next']))
+        domains = [client['domain'] for client in seen if client['name'] == 'it']
+        self.assertEqual(domains, sorted(['d%02d.es' % i for i in range(0, 20, 2)] + ['d11.es']))
+        self.assertEqual(len(set(client['id'] for client in seen)), len(seen))
+
+    def test_descending_times(self):
+        job = Job.objects.create(command='ping')
+        Job.objects.bulk_create([Job(command='ping %d' % i) for i in range(6)])
+        # Equal times, paged by id
+        Job.objects.update(created=job.created)
+        jobs_ = self.walk('/api/jobs/?page_size=4')
+        self.assertEqual([job['id'] for job in jobs_], sorted(Job.objects.values_list('id', flat=True), reverse=True))
+
+    def test_invalid_cursor(self):
+        self.assertEqual(self.api.get('/api/clients/?cursor=bogus').status_code, 404)
+        response = self.api.get('/api/spaces/?page_size=1')
+        # A cursor of the spaces does not fit the ordering of the clients
+        cursor = response.data['next'].split('cursor=')[1].split('&')[0]
+        self.assertEqual(self.api.get('/api/clients/?cursor=' + cursor).status_code, 404)
+
+    def test_walk_addresses_and_spaces(self):
+        self.assertEqual(len(self.walk('/api/netaddresses/?page_size=7')), 30)
+        self.assertEqual(len(self.walk('/api/spaces/?page_size=2')), 3)
+
+
+class BulkEndpointsTest(TestCase):
+
+    def setUp(self):
+        self.api = APIClient()
+        user = get_user_model().objects.create_superuser('admin', 'admin@lab.it.uc3m.es', 'admin')
+        self.api.force_authenticate(user)
+        self.space = Space.objects.create(name='4.1B01')
+
+    def test_bulk_create_clients(self):
+        data = [{'name': 'it%03d' % i, 'domain': 'lab.it.uc3m.es', 'space': self.space.id} for i in range(50)]
+        with CaptureQueriesContext(connection) as context:
+            response = self.api.post('/api/clients/bulk/', data, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Client.objects.filter(space=self.space).count(), 50)
+        # With the ids of the new rows, also where bulk_create does not return them
+        self.assertEqual(sorted(client['id'] for client in response.data),
+                         sorted(Client.objects.values_list('id', flat=True)))
+        self.assertLess(len(context.captured_queries), 10)
+
+    def test_bulk_create_errors(self):
+        data = [{'name': 'it001', 'domain': 'lab.it.uc3m.es'},
+                {'name': 'it002'},
+                {'name': 'it003', 'domain': 'lab.it.uc3m.es', 'space': 9999}]
+        response = self.api.post('/api/clients/bulk/', data, format='json')
+        self.assertEqual(response.status_code, 400)
+        errors = response.data['errors']
+        self.assertEqual(errors[0], {})
+        self.assertIn('domain', errors[1])
+        self.assertIn('space', errors[2])
+        self.assertEqual(Client.objects.count(), 0)
+
+    def test_bulk_clients_unique(self):
+        taken = Client.objects.create(name='it001', domain='lab.it.uc3m.es')
+        data = [{'name': 'IT001', 'domain': 'lab.it.uc3m.es'},
+                {'name': 'it002', 'domain': 'lab.it.uc3m.es'},
+                {'name': 'it002', 'domain': 'LAB.it.uc3m.es'}]
+        response = self.api.post('/api/clients/bulk/', data, format='json')
+        self.assertEqual(response.status_code, 400)
+        errors = response.data['errors']
+        self.assertIn('name', errors[0])
+        self.assertEqual(errors[1], {})
+        self.assertIn('name', errors[2])
+
+        response = self.api.patch('/api/clients/bulk/', [{'id': taken.id, 'name': 'IT001'}], format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Client.objects.get(pk=taken.id).fqdn, 'it001.lab.it.uc3m.es')
+
+        response = self.api.post('/api/clients/bulk/', data[1:2], format='json')
+        self.assertEqual(response.status_code, 201)
+        response = self.api.get('/api/clients/?fqdn=IT002.Lab.It.Uc3m.Es.')
+        self.assertEqual([client['name'] for client in response.data['results']], ['it002'])
+
+    def test_create_client_unique(self):
+        Client.objects.create(name='it001', domain='lab.it.uc3m.es')
+        response = self.api.post('/api/clients/', {'name': 'It001', 'domain': 'lab.it.uc3m.es'}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_bulk_addresses_unique(self):
+        client = Client.objects.create(name='it001', domain='lab.it.uc3m.es')
+        taken = NetAddress.objects.create(client=client, ip_add='10.0.0.1')
+        data = [{'client': client.id, 'ip_add': '10.0.0.1'},
+                {'client': client.id, 'ip_add': '10.0.0.2'},
+                {'client': client.id, 'ip_add': '10.0.0.2'},
+                {'client': client.id, 'ip_add': 'not an ip'}]
+        response = self.api.post('/api/netaddresses/bulk/', data, format='json')
+        self.assertEqual(response.status_code, 400)
+        errors = response.data['errors']
+        self.assertIn('ip_add', errors[0])
+        self.assertEqual(errors[1], {})
+        self.assertIn('ip_add', errors[2])
+        self.assertIn('ip_add', errors[3])
+
+        # An address may keep its own ip when updated
+        response = self.api.patch('/api/netaddresses/bulk/', [{'id': taken.id, 'ip_add': '10.0.0.1'}], format='json')
+        self.assertEqual(response.status_code, 200)
+
+        # Nor take the ip of another row of the batch that keeps it
+        other = NetAddress.objects.create(client=client, ip_add='10.0.0.2')
+        response = self.api.patch('/api/netaddresses/bulk/', [{'id': taken.id, 'ip_add': '10.0.0.2'},
+                                                              {'id': other.id, 'client': None}], format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('ip_add', response.data['errors'][1])
+        # But rows may exchange their ips
+        response = self.api.patch('/api/netaddresses/bulk/', [{'id': taken.id, 'ip_add': '10.0.0.3'},
+                                                              {'id': other.id, 'ip_add': '10.0.0.1'}], format='json')
+        self.assertEqual(response.status_code, 200)
+
+    def test_bulk_update_and_delete(self):
+        clients = [Client.objects.create(name='it%03d' % i, domain='old.es') for i in range(5)]
+        data = [{'id': client.id, 'domain': 'lab.it.uc3m.es', 'space': self.space.id} for client in clients]
+        response = self.api.patch('/api/clients/bulk/', data, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Client.objects.filter(domain='lab.it.uc3m.es', space=self.space).count(), 5)
+
+        response = self.api.patch('/api/clients/bulk/', [{'id': 9999, 'domain': 'a.es'}], format='json')
+        self.assertEqual(response.status_code, 400)
+
+        response = self.api.delete('/api/clients/bulk/', [clients[0].id, 9999], format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Client.objects.count(), 5)
+        response = self.api.delete('/api/clients/bulk/', [client.id for client in clients[:3]], format='json')
+        self.assertEqual(response.data, {'deleted': 3})
+        self.assertEqual(Client.objects.count(), 2)
+
+    def test_bulk_delete_queries(self):
+        def delete(count):
+            clients = [Client.objects.create(name='del%03d' % i, domain='lab.it.uc3m.es', space=self.space)
+                       for i in range(count)]
+            now = timezone.now()
+            for client in clients:
+                NetAddress.objects.create(client=client, ip_add='10.1.%d.%d' % (count, client.pk % 256))
+                MaintenanceWindow.objects.create(client=client, begin=now, end=now)
+            cursor = changes.last_cursor()
+            with CaptureQueriesContext(connection) as context:
+                response = self.api.delete('/api/clients/bulk/', [client.pk for client in clients], format='json')
+            self.assertEqual(response.data, {'deleted': count})
+            self.assertEqual(Change.objects.filter(id__gt=cursor, model='client', action='deleted').count(), count)
+            self.assertEqual(Change.objects.filter(id__gt=cursor, model='netaddress', action='updated').count(), count)
+            return len(context.captured_queries)
+
+        self.assertEqual(delete(2), delete(20))
+        self.assertFalse(Client.objects.exists())
+        self.assertEqual(NetAddress.objects.filter(client=None).count(), 22)
+        self.assertFalse(MaintenanceWindow.objects.exists())
+
+    def test_bulk_delete_bumps(self):
+        client = Client.objects.create(name='it001', domain='lab.it.uc3m.es')
+        MaintenanceWindow.objects.create(client=client, begin=timezone.now(), end=timezone.now())
+        versions = get_versions(Client, NetAddress, MaintenanceWindow)
+        self.api.delete('/api/clients/bulk/', [client.pk], format='json')
+        self.assertTrue(all(new > old for new, old in zip(get_versions(Client, NetAddress, MaintenanceWindow),
+                                                          versions)))
+
+
+class ExportTest(TestCase):
+
+    def setUp(self):
+        self.api = APIClient()
+        self.api.force_authenticate(get_user_model().objects.create_superuser('admin', 'admin@lab.it.uc3m.es', 'admin'))
+        create_colony(2, 3)
+
+    def test_export_ndjson(self):
+        response = self.api.get('/api/export/ndjson/')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        records = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(len(records), 2 + 6 + 12)
+        self.assertEqual(records[0], {'model': 'space', 'id': records[0]['id'], 'name': 'space000'})
+        self.assertEqual(sum(1 for record in records if record['model'] == 'netaddress'), 12)
+
+    def test_export_csv(self):
+        response = self.api.get('/api/export/csv/')
+        rows = list(csv.reader(b''.join(response.streaming_content).decode().splitlines()))
+        self.assertEqual(rows[0], ['model', 'id', 'name', 'domain', 'space', 'client', 'ip_add'])
+        self.assertEqual(len(rows), 1 + 20)
+        self.assertEqual(rows[-1][0], 'netaddress')
+
+    @mock.patch('rest_hq.export.CHUNK_SIZE', 4)
+    def test_export_in_chunks(self):
+        with CaptureQueriesContext(connection) as context:
+            records = [json.loads(line) for line in export.ndjson_lines()]
+        self.assertEqual([(record['model'], record['id']) for record in records],
+                         [('space', pk) for pk in Space.objects.order_by('pk').values_list('pk', flat=True)] +
+                         [('client', pk) for pk in Client.objects.order_by('pk').values_list('pk', flat=True)] +
+                         [('netaddress', pk) for pk in NetAddress.objects.order_by('pk').values_list('pk', flat=True)])
+        # Bounded queries: 1 + 2 + 4
+        self.assertEqual(len(context.captured_queries), 7)
+        self.assertTrue(all('LIMIT 4' in query['sql'] for query in context.captured_queries))
+
+    def test_export_unknown_format_and_permissions(self):
+        self.assertEqual(self.api.get('/api/export/xml/').status_code, 404)
+        viewer = APIClient()
+        viewer.force_authenticate(get_user_model().objects.create_user('viewer', password='viewer'))
+        self.assertEqual(viewer.get('/api/export/csv/').status_code, 403)
+
+
+class AnsibleInventoryTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.api = APIClient()
+        self.api.force_authenticate(get_user_model().objects.create_superuser('admin', 'admin@lab.it.uc3m.es', 'admin'))
+        create_colony(2, 2)
+
+    def test_conditional_get(self):
+        response = self.api.get('/api/inventory/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(json.loads(response.content)['_meta']['hostvars']), 4)
+
+        etag = response['ETag']
+        response = self.api.get('/api/inventory/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.api.post('/api/clients/bulk/', [{'name': 'it999', 'domain': 'lab.it.uc3m.es'}], format='json')
+        response = self.api.get('/api/inventory/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('it999.lab.it.uc3m.es', json.loads(response.content)['ungrouped']['hosts'])
+
+    def test_host(self):
+        response = self.api.get('/api/inventory/', {'host': 'it000000.lab.it.uc3m.es'})
+        self.assertEqual(response.data['ansible_host'], '10.0.0.1')
+
+
+class ResponseCacheTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        caching.get_cache().clear()
+        self.api = APIClient()
+        self.api.force_authenticate(get_user_model().objects.create_superuser('admin', 'admin@lab.it.uc3m.es', 'admin'))
+        create_colony(2, 2)
+
+    def test_hit_and_invalidation(self):
+        response = self.api.get('/api/spaces/')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        with CaptureQueriesContext(connection) as context:
+            response = self.api.get('/api/spaces/')
+        self.assertEqual(response['X-Cache'], 'HIT')
+        self.assertEqual(len(context.captured_queries), 0)
+        self.assertEqual(len(response.data['results']), 2)
+
+        # A client change is a miss for the spaces, which nest the clients
+        client = Client.objects.get(name='it000000')
+        self.assertEqual(self.api.patch('/api/clients/%d/' % client.pk, {'name': 'renamed'}, format='json').status_code, 200)
+        response = self.api.get('/api/spaces/')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertIn('renamed', [client['name'] for client in response.data['results'][0]['clients']])
+
+        response = self.api.get('/api/clients/%d/' % client.pk)
+        self.assertEqual((response['X-Cache'], response.data['name']), ('MISS', 'renamed'))
+        self.assertEqual(self.api.get('/api/clients/%d/' % client.pk)['X-Cache'], 'HIT')
+
+    def test_per_user_and_url(self):
+        self.api.get('/api/netaddresses/')
+        self.assertEqual(self.api.get('/api/netaddresses/?page_size=2')['X-Cache'], 'MISS')
+
+        viewer = APIClient()
+        viewer.force_authenticate(get_user_model().objects.create_user('viewer', password='viewer'))
+        self.assertEqual(viewer.get('/api/netaddresses/')['X-Cache'], 'MISS')
+        self.assertEqual(viewer.get('/api/netaddresses/')['X-Cache'], 'HIT')
+
+    @override_settings(ALLOWED_HOSTS=['testserver', 'hq.example.org'])
+    def test_per_host_and_scheme(self):
+        url = '/api/clients/?page_size=1'
+        self.assertEqual(self.api.get(url)['X-Cache'], 'MISS')
+        for options in ({'HTTP_HOST': 'hq.example.org'}, {'secure': True}):
+            response = self.api.get(url, **options)
+            self.assertEqual(response['X-Cache'], 'MISS')
+            self.assertTrue(response.data['next'].startswith(response.wsgi_request.build_absolute_uri('/')))
+            self.assertEqual(self.api.get(url, **options)['X-Cache'], 'HIT')
+
+    def test_stats(self):
+        caching.reset_stats()
+        self.api.get('/api/clients/')
+        self.api.get('/api/clients/')
+        response = self.api.get('/api/cache/')
+        self.assertEqual(response.data, {'hits': 1, 'misses': 1, 'hit_ratio': 0.5})
+
+        self.assertEqual(self.api.delete('/api/cache/').status_code, 204)
+        self.assertEqual(self.api.get('/api/cache/').data['hits'], 0)
+
+        viewer = APIClient()
+        viewer.force_authenticate(get_user_model().objects.create_user('viewer', password='viewer'))
+        self.assertEqual(viewer.get('/api/cache/').status_code, 403)
+
+
+class ConditionalGetTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        caching.get_cache().clear()
+        self.api = APIClient()
+        self.api.force_authenticate(get_user_model().objects.create_superuser('admin', 'admin@lab.it.uc3m.es', 'admin'))
+        create_colony(2, 2)
+
+    def test_etag(self):
+        response = self.api.get('/api/clients/')
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.api.get('/api/clients/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(len(context.captured_queries), 0)
+
+        # Another page, or another format, is another representation
+        self.assertEqual(self.api.get('/api/clients/?page_size=1', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+        self.assertEqual(self.api.get('/api/clients/?format=json', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        address = NetAddress.objects.first()
+        self.api.patch('/api/netaddresses/bulk/', [{'id': address.pk, 'ip_add': '10.9.9.9'}], format='json')
+        response = self.api.get('/api/clients/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_last_modified(self):
+        response = self.api.get('/api/spaces/')
+        last_modified = response['Last-Modified']
+        self.assertEqual(self.api.get('/api/spaces/', HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+        self.assertEqual(self.api.get('/api/spaces/', HTTP_IF_MODIFIED_SINCE='Thu, 01 Jan 2015 00:00:00 GMT')
+                         .status_code, 200)
+
+    def test_detail(self):
+        space = Space.objects.first()
+        response = self.api.get('/api/spaces/%d/' % space.pk)
+        self.assertEqual(self.api.get('/api/spaces/%d/' % space.pk, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        self.assertNotIn('ETag', self.api.get('/api/spaces/99999/'))
+
+        pk = space.pk
+        space.delete()
+        self.assertEqual(self.api.get('/api/spaces/%d/' % pk, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 404)
+
+    def test_timestamps(self):
+        client = Client.objects.get(name='it000000')
+        self.assertIsNotNone(client.created)
+        created, updated = client.created, client.updated
+
+        response = self.api.patch('/api/clients/bulk/', [{'id': client.pk, 'domain': 'lab2.it.uc3m.es'}], format='json')
+        self.assertEqual(response.status_code, 200)
+        client.refresh_from_db()
+        self.assertEqual(client.created, created)
+        self.assertGreater(client.updated, updated)
+        self.assertIn('updated', self.api.get('/api/clients/%d/' % client.pk).data)
+
+
+class ChangeFeedTest(TestCase):
+
+    def setUp(self):
+        self.api = APIClient()
+        self.api.force_authenticate(get_user_model().objects.create_superuser('admin', 'admin@lab.it.uc3m.es', 'admin'))
+        create_colony(1, 2)
+
+    def test_sync(self):
+        response = self.api.get('/api/export/ndjson/')
+        cursor = int(response['X-Change-Cursor'])
+
+        response = self.api.post('/api/clients/bulk/', [{'name': 'it999', 'domain': 'lab.it.uc3m.es'}], format='json')
+        client = Client.objects.get(name='it999')
+        self.assertEqual(response.data[0]['id'], client.pk)
+        address = NetAddress.objects.get(ip_add='10.0.0.1')
+        self.api.patch('/api/netaddresses/bulk/', [{'id': address.pk, 'client': client.pk}], format='json')
+        self.api.delete('/api/netaddresses/bulk/', [address.pk], format='json')
+
+        response = self.api.get('/api/changes/', {'since': cursor})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.data['more'])
+        self.assertEqual([(change['model'], change['id'], change['action'], change['object'])
+                          for change in response.data['changes']],
+                         [('client', client.pk, 'created',
+                           {'id': client.pk, 'name': 'it999', 'domain': 'lab.it.uc3m.es', 'space': None}),
+                          ('netaddress', address.pk, 'deleted', None)])
+
+        response = self.api.get('/api/changes/', {'since': response.data['cursor']})
+        self.assertEqual(response.data['changes'], [])
+
+    def test_limit_and_errors(self):
+        response = self.api.get('/api/changes/', {'limit': 2})
+        self.assertTrue(response.data['more'])
+        self.assertEqual(len(response.data['changes']), 2)
+        self.assertEqual(response.data['cursor'], response.data['changes'][-1]['cursor'])
+
+        self.assertEqual(self.api.get('/api/changes/', {'since': 'x'}).status_code, 400)
+
+        Change.objects.create(model='', object_id=10, action='compacted')
+        self.assertEqual(self.api.get('/api/changes/', {'since': 5}).status_code, 410)
+
+        viewer = APIClient()
+        viewer.force_authenticate(get_user_model().objects.create_user('viewer', password='viewer'))
+        self.assertEqual(viewer.get('/api/changes/').status_code, 403)
+
+
+# The async views query from pool threads, with their own connections, so
+# the data must be committed
+class AsyncViewsTest(TransactionTestCase):
+
+    def setUp(self):
+        cache.clear()
+        caching.get_cache().clear()
+        self.api = APIClient()
+        self.api.force_authenticate(get_user_model().objects.create_superuser('admin', 'admin@lab.it.uc3m.es', 'admin'))
+        create_colony(2, 2)
+
+    def results(self, response):
+        # Pages differ in their links only, by the path
+        data = response.json()
+        return data['results'] if 'results' in data else data
+
+    def test_same_answers(self):
+        client = Client.objects.first()
+        space = Space.objects.first()
+        address = NetAddress.objects.first()
+        for path in ('clients/', 'clients/%d/' % client.pk, 'spaces/', 'spaces/%d/' % space.pk,
+                     'netaddresses/?page_size=2', 'netaddresses/%d/' % address.pk, 'clients/?fqdn=IT000001.lab.it.uc3m.es'):
+            sync = self.api.get('/api/' + path)
+            answer = self.api.get('/api/async/' + path)
+            self.assertEqual(sync.status_code, 200, path)
+            self.assertEqual((answer.status_code, self.results(answer)), (200, self.results(sync)), path)
+            self.assertTrue(answer['ETag'], path)
+        self.assertEqual(len(self.api.get('/api/async/clients/').json()['results']), 4)
+        self.assertEqual(self.api.get('/api/async/clients/%d/' % client.pk).json()['fqdn'], client.fqdn)
+
+        sync = self.api.post('/api/clientsbyspace/', {'space': space.pk}, format='json')
+        answer = self.api.post('/api/async/clientsbyspace/', {'space': space.pk}, format='json')
+        self.assertEqual((answer.status_code, answer.json()), (200, sync.json()))
+        self.assertEqual(len(answer.json()), 2)
+
+    def test_conditional_and_permissions(self):
+        response = self.api.get('/api/async/clients/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.api.get('/api/async/clients/', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        self.assertEqual(self.api.get('/api/async/clients/99999/').status_code, 404)
+        self.assertEqual(APIClient().get('/api/async/clients/').status_code, 401)
+
+        # Authenticated without the view permissions: as the sync views
+        nobody = APIClient()
+        nobody.force_authenticate(get_user_model().objects.create_user('nobody', password='nobody'))
+        space = Space.objects.first()
+        self.assertEqual(nobody.post('/api/async/clientsbyspace/', {'space': space.pk}, format='json').status_code, 403)
+        self.assertEqual(nobody.post('/api/clientsbyspace/', {'space': space.pk}, format='json').status_code, 403)
+
+    def test_benchmark_command(self):
+        out = io.StringIO()
+        call_command('benchmark_api', '--user', 'admin', '--password', 'admin', '--concurrency', '2',
+                     '--requests', '4', '--path', '/api/spaces/', '--host', 'testserver', stdout=out)
+        lines = out.getvalue().splitlines()
+        self.assertEqual([line.split()[0] for line in lines], ['/api/spaces/', '/api/async/spaces/'])
+        self.assertTrue(all(line.endswith('errors 0') for line in lines))
+
+
+# Jobs store their results from worker threads, with their own connections,
+# so the data must be committed
+@override_settings(HIVE_JOB_EXECUTOR='stub')
+class JobsTest(TransactionTestCase):
+
+    def setUp(self):
+        self.api = APIClient()
+        user = get_user_model().objects.create_superuser('admin', 'admin@lab.it.uc3m.es', 'admin')
+        self.api.force_authenticate(user)
+        create_colony(2, 3)
+
+    def test_run_space(self):
+        space = Space.objects.get(name='space000')
+        response = self.api.post('/api/jobs/', {'playbook': 'site.yml', 'space': space.id, 'forks': 2}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['total'], 3)
+        self.assertTrue(jobs.wait_job(response.data['id'], 10))
+
+        response = self.api.get('/api/jobs/%d/results/' % response.data['id'])
+        self.assertEqual(response.data['job']['status'], 'finished')
+        self.assertEqual(response.data['progress'], {'total': 3, 'done': 3, 'ok': 3})
+        self.assertEqual(sorted(result['host'] for result in response.data['results']),
+                         ['it000%03d.lab.it.uc3m.es' % j for j in range(3)])
+        self.assertTrue(all(result['client'] is not None for result in response.data['results']))
+
+        after = response.data['after']
+        response = self.api.get('/api/jobs/%d/results/?after=%d' % (response.data['job']['id'], after))
+        self.assertEqual(response.data['results'], [])
+        self.assertEqual(response.data['after'], after)
+
+    def test_run_clients(self):
+        ids = list(Client.objects.values_list('id', flat=True)[:4])
+        response = self.api.post('/api/jobs/', {'playbook': 'site.yml', 'clients': ids}, format='json')
+        self.assertEqual(response.status_code, 201)
+        jobs.wait_job(response.data['id'], 10)
+        self.assertEqual(Job.objects.get(pk=response.data['id']).results.count(), 4)
+
+    def test_invalid(self):
+        space = Space.objects.get(name='space000')
+        response = self.api.post('/api/jobs/', {'playbook': 'site.yml'}, format='json')
+        self.assertEqual(response.status_code, 400)
+        response = self.api.post('/api/jobs/', {'playbook': 'site.yml', 'space': space.id, 'clients': [1]}, format='json')
+        self.assertEqual(response.status_code, 400)
+        response = self.api.post('/api/jobs/', {'playbook': 'site.yml', 'clients': [9999]}, format='json')
+        self.assertEqual(response.status_code, 400)
+        with override_settings(HIVE_JOB_EXECUTOR='ansible'):
+            response = self.api.post('/api/jobs/', {'playbook': '../secret.yml', 'space': space.id}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Job.objects.exists())
+
+    def test_batch_failure(self):
+        def on_batch(batch):
+            raise RuntimeError('No room')
+
+        ids = list(Client.objects.values_list('id', flat=True))
+        with self.assertLogs('colony.jobs', 'ERROR') as logs:
+            job = jobs.start_job(ids, 'site.yml', forks=2, batch_size=2, on_batch=on_batch)
+            self.assertTrue(jobs.wait_job(job, 10))
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'failed')
+        self.assertIsNotNone(job.finished)
+        self.assertEqual(len(logs.records), 3)
+        self.assertEqual(job.results.count(), 6)
+
+    def test_closes_connections(self):
+        # The connections of the threads storing batches
+        used = []
+
+        def on_batch(batch):
+            used.append(connections['default'])
+
+        ids = list(Client.objects.values_list('id', flat=True))
+        # In-memory SQLite shares one connection and never closes it, so the
+        # calls are checked instead
+        backend = type(connections['default'])
+        with mock.patch.object(backend, 'close', autospec=True, side_effect=backend.close) as close:
+            job = jobs.start_job(ids, 'site.yml', forks=3, batch_size=1, on_batch=on_batch)
+            self.assertTrue(jobs.wait_job(job, 10))
+        self.assertEqual(len(used), 6)
+        closed = [call.args[0] for call in close.call_args_list]
+        self.assertTrue(all(any(closing is thread for closing in closed) for thread in used))
+        self.assertEqual(Job.objects.get(pk=job.pk).status, 'finished')
+
+    def test_empty(self):
+        backend = type(connections['default'])
+        with mock.patch.object(backend, 'close', autospec=True, side_effect=backend.close) as close:
+            job = jobs.start_job([], 'site.yml')
+        # The connection of the caller is left open
+        close.assert_not_called()
+        self.assertIsNone(jobs.get_running(job))
+        self.assertTrue(jobs.wait_job(job, 0))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.total), ('finished', 0))
+        self.assertIsNotNone(job.finished)
+
+    def test_rolled_back(self):
+        ids = list(Client.objects.values_list('id', flat=True))
+        with mock.patch.object(jobs, 'get_runner') as get_runner:
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    job = jobs.start_job(ids, 'site.yml')
+                    raise RuntimeError('Rolled back')
+        get_runner.assert_not_called()
+        self.assertIsNone(jobs.get_running(job))
+        self.assertFalse(Job.objects.exists())
+
+    def test_cancel_finished(self):
+        ids = list(Client.objects.values_list('id', flat=True))
+        job = jobs.start_job(ids, 'site.yml')
+        jobs.wait_job(job, 10)
+        response = self.api.post('/api/jobs/%d/cancel/' % job.id)
+        self.assertEqual(response.status_code, 409)
@@ -6,6 +6,7 @@ Created on 16 mar. 2021
 
 from django.urls import path, include
 from rest_hq import views
+from rest_hq import async_views
 from rest_framework.routers import DefaultRouter
 
 client_router = DefaultRouter()
@@ -17,6 +18,9 @@ space_router.register('spaces', views.SpaceViewSet)
 netaddress_router = DefaultRouter()
 netaddress_router.register('netaddresses', views.NetAddressViewSet)
 
+job_router = DefaultRouter()
+job_router.register('jobs', views.JobViewSet)
+
 urlpatterns = [
     #path('clients/', views.ClientListView.as_view()), 
     #path('client/<int:pk>', views.ClientDetailView.as_view()),
@@ -28,4 +32,17 @@ urlpatterns = [
     #path('addresses/', views.NetAddressListView.as_view()), 
     #path('address/<int:pk>', views.NetAddressDetailView.as_view()),
     path('', include(netaddress_router.urls)),  
+    path('export/<str:kind>/', views.ColonyExportView.as_view(), name='colony-export'),
+    path('changes/', views.ChangeFeedView.as_view(), name='change-feed'),
+    path('', include(job_router.urls)),
+    path('inventory/', views.AnsibleInventoryView.as_view(), name='ansible-inventory'),
+    path('cache/', views.CacheStatsView.as_view(), name='cache-stats'),
+    # Read endpoints served by coroutines, for the ASGI server
+    path('async/clients/', async_views.client_list, name='async-clients-list'),
+    path('async/clients/<int:pk>/', async_views.client_detail, name='async-clients-detail'),
+    path('async/clientsbyspace/', async_views.clients_by_space, name='async-clients-by-space'),
+    path('async/spaces/', async_views.space_list, name='async-spaces-list'),
+    path('async/spaces/<int:pk>/', async_views.space_detail, name='async-spaces-detail'),
+    path('async/netaddresses/', async_views.netaddress_list, name='async-netaddresses-list'),
+    path('async/netaddresses/<int:pk>/', async_views.netaddress_detail, name='async-netaddresses-detail'),
 ]
\ No newline at end of file
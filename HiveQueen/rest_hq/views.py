@@ -3,16 +3,45 @@
 #from rest_framework import status
 #from rest_framework import generics
 from rest_framework import viewsets
+from rest_framework import mixins
+from rest_framework import status
 #from rest_framework.authentication import BasicAuthentication
 #from rest_framework.permissions import IsAuthenticated, DjangoModelPermissions
-from rest_framework.pagination import PageNumberPagination, LimitOffsetPagination 
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, action, permission_classes
 from rest_framework.response import Response
-from colony.models import Client, Space, NetAddress
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from django.http import StreamingHttpResponse, HttpResponse, HttpResponseNotModified
+from django.conf import settings
+from django.db.models import Prefetch
+from colony.models import Client, Space, NetAddress, Job, make_fqdn
 from rest_hq.serializers import ClientSerializer, SpaceSerializer, NetAddressSerializer
+from rest_hq.serializers import ClientBulkSerializer, NetAddressBulkSerializer
+from rest_hq.serializers import JobSerializer, JobResultSerializer, JobCreateSerializer
+from rest_hq.bulk import BulkModelMixin, check_exists
+from rest_hq.pagination import KeysetPagination
+from rest_hq.caching import CachedResponseMixin, ConditionalGetMixin
+from rest_hq.fast import FastListMixin
+from rest_hq import fast
+from rest_hq import export
+from colony import inventory
+from colony import jobs
+from colony import caching
+from colony import changes
 
 # Create your views here.
 
+# Querysets loading the nested relations of the serializers in a constant
+# number of queries, whatever the number of rows
+def client_queryset():
+    return Client.objects.select_related('space').prefetch_related('netaddress_set')
+
+
+def space_queryset():
+    clients=Client.objects.prefetch_related('netaddress_set')
+    return Space.objects.prefetch_related(Prefetch('client_set', queryset=clients))
+
 
 
 '''
@@ -54,23 +83,81 @@ def client_detail(request,pk):
         return Response(status=status.HTTP_204_NO_CONTENT)
 '''       
 
-class ClientPagination(LimitOffsetPagination):
-    page_size=2
+# Keyset pagination: each page seeks from the cursor on all the ordering
+# fields, instead of counting rows and scanning an offset. The id closes
+# the ordering, so rows sharing the other fields are paged by id.
+class HivePagination(KeysetPagination):
+    page_size=getattr(settings, 'REST_HQ_PAGE_SIZE', 100)
+    page_size_query_param='page_size'
+    max_page_size=getattr(settings, 'REST_HQ_MAX_PAGE_SIZE', 5000)
 
 
-class ClientViewSet(viewsets.ModelViewSet):
-    queryset=Client.objects.all()
+class ClientPagination(HivePagination):
+    ordering=('name', 'domain', 'id')
+
+
+class ClientViewSet(ConditionalGetMixin, CachedResponseMixin, FastListMixin, BulkModelMixin, viewsets.ModelViewSet):
+    queryset=client_queryset()
+    cache_models=(Client, Space, NetAddress)
     serializer_class=ClientSerializer
+    fast_values=fast.CLIENT_VALUES
+    fast_serializer=staticmethod(fast.clients)
+    bulk_serializer_class=ClientBulkSerializer
+    bulk_lookup_field='fqdn'
     #pagination_class=PageNumberPagination
-    agination_class=ClientPagination
+    pagination_class=ClientPagination
     #authentication_classes=[BasicAuthentication]
     #permission_classes=[IsAuthenticated, DjangoModelPermissions]
+    
+    def get_queryset(self):
+        queryset=super().get_queryset()
+        # ?fqdn= finds a host ignoring case, on the unique fqdn index
+        if 'fqdn' in self.request.query_params:
+            queryset=queryset.by_fqdn(self.request.query_params['fqdn'])
+        return queryset
+    
+    def bulk_validate(self, items, errors, instances=None):
+        check_exists(Space, 'space', items, errors, 'space_id')
+        
+        # Names must be unique ignoring case, within the batch and against
+        # the stored clients not being updated by it: one query
+        if instances is None:
+            instances = [None] * len(items)
+        fqdns = []
+        for item, instance in zip(items, instances):
+            name = item.get('name', getattr(instance, 'name', None)) if item is not None else None
+            domain = item.get('domain', getattr(instance, 'domain', None)) if item is not None else None
+            fqdns.append(make_fqdn(name, domain) if name is not None and domain is not None else None)
+        
+        updating = set(instance.pk for instance in instances if instance is not None)
+        taken = set(Client.objects.filter(fqdn__in=set(fqdn for fqdn in fqdns if fqdn))
+                    .exclude(pk__in=updating).values_list('fqdn', flat=True))
+        
+        seen = set()
+        for fqdn, error in zip(fqdns, errors):
+            if fqdn is None:
+                continue
+            if fqdn in taken:
+                error.setdefault('name', []).append('A client with this name and domain already exists.')
+            elif fqdn in seen:
+                error.setdefault('name', []).append('Client repeated in this request.')
+            seen.add(fqdn)
+    
+    def bulk_prepare(self, objects, fields=None):
+        for client in objects:
+            client.fqdn = make_fqdn(client.name, client.domain)
+        if fields is not None and fields & {'name', 'domain'}:
+            fields = fields | {'fqdn'}
+        return fields
 
 @api_view(['POST'])
+@permission_classes([IsAuthenticated])
 def clients_by_space(request):
-    clients=Client.objects.filter(space=request.data['space'])
-    serializer=ClientSerializer(clients, many=True)
-    return Response(serializer.data)
+    # DjangoModelPermissions needs a queryset, that a function view lacks
+    if not request.user.has_perm('colony.view_client'):
+        raise PermissionDenied()
+    clients=Client.objects.filter(space=request.data['space']).values(*fast.CLIENT_VALUES)
+    return Response(fast.clients(list(clients)))
         
 '''        
 class ClientListView(generics.ListCreateAPIView):
@@ -82,13 +169,16 @@ class ClientDetailView(generics.RetrieveUpdateDestroyAPIView):
     serializer_class=ClientSerializer 
 '''   
 
-class SpacePagination(LimitOffsetPagination):
-    page_size=2
+class SpacePagination(HivePagination):
+    ordering=('name', 'id')
 
 
-class SpaceViewSet(viewsets.ModelViewSet):
-    queryset=Space.objects.all()
+class SpaceViewSet(ConditionalGetMixin, CachedResponseMixin, FastListMixin, viewsets.ModelViewSet):
+    queryset=space_queryset()
+    cache_models=(Space, Client, NetAddress)
     serializer_class=SpaceSerializer
+    fast_values=fast.SPACE_VALUES
+    fast_serializer=staticmethod(fast.spaces)
     #pagination_class=PageNumberPagination
     pagination_class=SpacePagination
     #authentication_classes=[BasicAuthentication]
@@ -104,17 +194,53 @@ class SpaceDetailView(generics.RetrieveUpdateDestroyAPIView):
     serializer_class=SpaceSerializer
 '''
   
-class NetAddressPagination(LimitOffsetPagination):
-    page_size=2  
+class NetAddressPagination(HivePagination):
+    ordering=('ip_add', 'id')
  
     
-class NetAddressViewSet(viewsets.ModelViewSet):
+class NetAddressViewSet(ConditionalGetMixin, CachedResponseMixin, FastListMixin, BulkModelMixin, viewsets.ModelViewSet):
     queryset=NetAddress.objects.all()
+    cache_models=(NetAddress,)
     serializer_class=NetAddressSerializer
+    fast_values=fast.NETADDRESS_VALUES
+    fast_serializer=staticmethod(fast.netaddresses)
+    bulk_serializer_class=NetAddressBulkSerializer
+    bulk_lookup_field='ip_add'
     #pagination_class=PageNumberPagination
     pagination_class=NetAddressPagination
     #authentication_classes=[BasicAuthentication]
     #permission_classes=[IsAuthenticated, DjangoModelPermissions]       
+    
+    def get_queryset(self):
+        queryset=super().get_queryset()
+        if 'ip_add' in self.request.query_params:
+            queryset=queryset.filter(ip_add=self.request.query_params['ip_add'])
+        return queryset
+    
+    def bulk_validate(self, items, errors, instances=None):
+        check_exists(Client, 'client', items, errors, 'client_id')
+        
+        # Addresses must be unique within the batch and against the
+        # stored ones not being updated by it: one query for the batch.
+        # Rows updated without ip_add keep theirs, which counts too
+        if instances is None:
+            instances = [None] * len(items)
+        updating = set(instance.pk for instance in instances if instance is not None)
+        
+        ips = [item.get('ip_add', getattr(instance, 'ip_add', None)) if item is not None else None
+               for item, instance in zip(items, instances)]
+        taken = set(NetAddress.objects.filter(ip_add__in=set(ip for ip in ips if ip))
+                    .exclude(pk__in=updating).values_list('ip_add', flat=True))
+        
+        seen = set()
+        for ip, error in zip(ips, errors):
+            if ip is None:
+                continue
+            if ip in taken:
+                error.setdefault('ip_add', []).append('Address already in use.')
+            elif ip in seen:
+                error.setdefault('ip_add', []).append('Address repeated in this request.')
+            seen.add(ip)
            
 '''    
 class NetAddressListView(generics.ListCreateAPIView):
@@ -124,4 +250,169 @@ class NetAddressListView(generics.ListCreateAPIView):
 class NetAddressDetailView(generics.RetrieveUpdateDestroyAPIView):
     queryset=NetAddress.objects.all() 
     serializer_class=NetAddressSerializer
-'''    
\ No newline at end of file
+'''    
+
+
+class ColonyExportView(APIView):
+    '''
+    Streams every space, client and address as NDJSON or CSV
+    '''
+    permission_classes=[IsAuthenticated]
+    
+    formats={
+        'ndjson': (export.ndjson_lines, 'application/x-ndjson', 'colony.ndjson'),
+        'csv': (export.csv_lines, 'text/csv', 'colony.csv'),
+    }
+    
+    def get(self, request, kind):
+        if kind not in self.formats:
+            raise NotFound('Unknown export format: ' + kind)
+        
+        if not request.user.has_perms(['colony.view_space', 'colony.view_client', 'colony.view_netaddress']):
+            raise PermissionDenied()
+        
+        lines, content_type, filename = self.formats[kind]
+        # Taken before reading, the change feed goes on from here
+        cursor=changes.last_cursor()
+        response=StreamingHttpResponse(lines(), content_type=content_type)
+        response['Content-Disposition']='attachment; filename="%s"' % filename
+        response['X-Change-Cursor']=str(cursor)
+        return response
+
+
+class ChangeFeedView(APIView):
+    '''
+    Changes of the colony after a cursor: ?since=<cursor>&limit=<entries>.
+    Each changed object comes once, with its last action and, unless it is
+    gone, its record as exported. Start from the X-Change-Cursor of an
+    export; a 410 means the cursor was compacted away and the colony must
+    be exported again.
+    '''
+    permission_classes=[IsAuthenticated]
+    default_limit=1000
+    max_limit=5000
+    
+    def get(self, request):
+        if not request.user.has_perms(['colony.view_space', 'colony.view_client', 'colony.view_netaddress']):
+            raise PermissionDenied()
+        
+        try:
+            since=int(request.query_params.get('since', 0))
+            limit=int(request.query_params.get('limit', self.default_limit))
+        except ValueError:
+            raise ValidationError({'detail': 'since and limit must be integers.'})
+        limit=min(max(limit, 1), self.max_limit)
+        
+        try:
+            entries, cursor, more=changes.read(since, limit)
+        except changes.CursorExpired:
+            return Response({'detail': 'Cursor expired, export the colony again.'}, status=status.HTTP_410_GONE)
+        
+        ids={}
+        for entry, model, pk, change in entries:
+            if change != changes.DELETED:
+                ids.setdefault(model, []).append(pk)
+        records=dict((model, export.export_records(model, pks)) for model, pks in ids.items())
+        
+        return Response({
+            'cursor': cursor,
+            'more': more,
+            'changes': [{'cursor': entry, 'model': model, 'id': pk, 'action': change,
+                         'object': records.get(model, {}).get(pk)}
+                        for entry, model, pk, change in entries],
+        })
+
+
+class AnsibleInventoryView(APIView):
+    '''
+    Ansible dynamic inventory (JSON) of the colony. ?host=<fqdn> returns
+    the variables of one host. Answers 304 when If-None-Match matches.
+    '''
+    permission_classes=[IsAuthenticated]
+    
+    def get(self, request):
+        if not request.user.has_perms(['colony.view_space', 'colony.view_client', 'colony.view_netaddress']):
+            raise PermissionDenied()
+        
+        if 'host' in request.query_params:
+            return Response(inventory.host_vars(request.query_params['host']))
+        
+        etag, text = inventory.inventory_json()
+        if etag in request.headers.get('If-None-Match', ''):
+            response=HttpResponseNotModified()
+        else:
+            response=HttpResponse(text, content_type='application/json')
+        response['ETag']=etag
+        return response
+
+
+class CacheStatsView(APIView):
+    '''
+    Hits and misses of the response cache. DELETE resets the counters.
+    '''
+    permission_classes=[IsAdminUser]
+    
+    def get(self, request):
+        return Response(caching.stats())
+    
+    def delete(self, request):
+        caching.reset_stats()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class JobPagination(HivePagination):
+    ordering=('-created', '-id')
+
+
+class JobViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet):
+    '''
+    Playbook runs. POST {"playbook": ..., "clients": [ids] or "space": id,
+    "forks": 5, "timeout": seconds} starts one; results/?after=<id> returns
+    the progress and the results stored after that id, for polling.
+    '''
+    queryset=Job.objects.all()
+    serializer_class=JobSerializer
+    pagination_class=JobPagination
+    results_limit=500
+    
+    def create(self, request):
+        serializer=JobCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data=serializer.validated_data
+        
+        if 'space' in data:
+            clients=Client.objects.filter(space=data['space'])
+        else:
+            clients=Client.objects.filter(pk__in=data['clients'])
+        clients=list(clients.values_list('pk', flat=True))
+        if not clients:
+            raise ValidationError({'clients': ['No clients selected.']})
+        
+        try:
+            job=jobs.start_job(clients, data['playbook'], forks=data['forks'], timeout=data.get('timeout'))
+        except ValueError as error:
+            raise ValidationError({'playbook': [str(error)]})
+        return Response(JobSerializer(job).data, status=status.HTTP_201_CREATED)
+    
+    @action(detail=True)
+    def results(self, request, pk=None):
+        job=self.get_object()
+        try:
+            after=int(request.query_params.get('after', 0))
+        except ValueError:
+            raise ValidationError({'after': ['A valid integer is required.']})
+        
+        results=list(job.results.filter(id__gt=after)[:self.results_limit])
+        return Response({
+            'job': JobSerializer(job).data,
+            'progress': jobs.progress(job),
+            'results': JobResultSerializer(results, many=True).data,
+            'after': results[-1].id if results else after,
+        })
+    
+    @action(detail=True, methods=['post'])
+    def cancel(self, request, pk=None):
+        job=self.get_object()
+        if not jobs.cancel_job(job):
+            return Response({'detail': 'The job is not running in this server.'}, status=status.HTTP_409_CONFLICT)
+        return Response({'cancelled': True})